@@ -0,0 +1,83 @@
+import argparse
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from bs4 import Tag
+
+from logic.parsing.dictionary_store import DictionaryStore
+from logic.parsing.encoded_file_loader import EncodedFileLoader
+from logic.parsing.html_parser import HtmlParser
+from logic.parsing.websites.linguee_lemma_extractor import LemmaFacts, LingueeLemmaExtractor
+from logic.parsing.websites.linguee_parser import LingueeParser
+
+
+def extract_with_selectors(parser: LingueeParser, lemma: Tag) -> LemmaFacts:
+    """The extraction as done before the single-pass extractor: one CSS query per fact"""
+    word = HtmlParser.get_text_content(lemma, '.tag_lemma a.dictLink')
+    context = HtmlParser.get_text_content(lemma, '.tag_lemma_context')
+    # get_variants read the word type for the category and the tags, NounVariantAugmenter once more for the gender
+    parser.get_word_category(lemma)
+    parser._process_word_type_tags(lemma)
+    parser.get_gender(lemma)
+    word_type = HtmlParser.get_text_content(lemma, '.tag_wordtype')
+    word_type = LingueeLemmaExtractor.english_word_type(word_type) if word_type else word_type
+    definitions = [definition for translation in HtmlParser.find_elements(lemma, '.tag_trans')
+                   if (definition := LingueeLemmaExtractor.get_definition(translation))]
+    return LemmaFacts(word, context, word_type, definitions, parser.get_examples(lemma))
+
+
+def measure(extract: Callable[[Tag], LemmaFacts], lemmas: List[Tag], repeat: int) -> float:
+    """Return the average time in seconds to extract every lemma once"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for lemma in lemmas:
+            extract(lemma)
+    return (time.perf_counter() - start) / repeat
+
+
+def run(path: str | None, repeat: int, directory: str | None = None) -> None:
+    """
+    Compare the selector-based and the single-pass lemma extraction on every stored Linguee page.
+
+    Args:
+        path: Dictionary store, defaults to the shared store's
+        repeat: Number of timed passes over all lemmas
+        directory: Read the pages saved in this directory instead of the store, e.g. both interfaces' pages in cache/
+    """
+    if directory:
+        pages = [(path.name, EncodedFileLoader.load(path)) for path in sorted(Path(directory).iterdir())
+                 if DictionaryStore.parse_saved_page_name(path.name)]
+    else:
+        pages = DictionaryStore(path).items("linguee", LingueeParser.LANGUAGE_PAIR)
+    if not pages:
+        print("No stored Linguee pages, import some with: python -m logic.parsing.dictionary_store import")
+        return
+
+    parser = LingueeParser("")
+    lemmas: List[Tag] = []
+    for query, html in pages:
+        # Trees are built up front, only the extraction is timed
+        parser.soup = HtmlParser.create_soup(html, parse_only=parser.parse_only)
+        lemmas.extend(parser.get_variant_elements())
+
+    mismatches = [lemma for lemma in lemmas
+                  if extract_with_selectors(parser, lemma) != LingueeLemmaExtractor.extract(lemma)]
+    selectors = measure(lambda lemma: extract_with_selectors(parser, lemma), lemmas, repeat)
+    single_pass = measure(LingueeLemmaExtractor.extract, lemmas, repeat)
+
+    print(f"Pages:        {len(pages)}")
+    print(f"Lemmas:       {len(lemmas)}")
+    print(f"Mismatches:   {len(mismatches)}")
+    print(f"Selectors:    {selectors / len(lemmas) * 1e6:.1f} µs per lemma")
+    print(f"Single pass:  {single_pass / len(lemmas) * 1e6:.1f} µs per lemma")
+    print(f"Speedup:      {selectors / single_pass:.1f}x")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the single-pass Linguee lemma extractor against CSS selectors")
+    parser.add_argument('--db', help="Dictionary store, defaults to $DICTIONARY_STORE_DB")
+    parser.add_argument('--repeat', type=int, default=50, help="Number of timed passes over all lemmas")
+    parser.add_argument('--directory', help="Read saved pages from this directory instead of the store")
+    args = parser.parse_args()
+    run(args.db, args.repeat, args.directory)
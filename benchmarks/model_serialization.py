@@ -0,0 +1,134 @@
+import argparse
+import io
+import json
+import sys
+import time
+import tracemalloc
+from typing import Callable, List
+
+from logic.export.jsonl_exporter import JsonlExporter
+from model.enums.conjugates_with import ConjugatesWith
+from model.enums.verb_group import VerbGroup
+from model.enums.word_category import WordCategory
+from model.enums.word_gender import WordGender
+from model.response import Response
+from model.variants.noun_variant import NounVariant
+from model.variants.variant import Variant
+from model.variants.verb_variant import VerbVariant
+
+
+class PlainVariant:
+    """Holds a variant's fields in a per-instance __dict__, like the models did before __slots__"""
+
+
+def make_variant(index: int) -> Variant:
+    """Build a variant with typical card content"""
+    if index % 2:
+        variant = VerbVariant()
+        variant.conjugates_with = ConjugatesWith.AVOIR
+        variant.conjugates_as = ["aimer"]
+        variant.verb_group = VerbGroup.FIRST
+    else:
+        variant = NounVariant()
+        variant.category = WordCategory.NOUN
+        variant.gender = WordGender.MASCULINE
+    variant.word = f"mot{index}"
+    variant.word_type_tags = ["noun", "masculine"] if index % 2 == 0 else ["verb"]
+    variant.english_definitions = ["word", "term"]
+    variant.examples = [f"Le mot numéro {index} est écrit ici."]
+    variant.transcription = "/mo/"
+    return variant
+
+
+def make_plain_variant(index: int) -> PlainVariant:
+    """Build the same variant as make_variant, stored in a __dict__"""
+    variant = make_variant(index)
+    plain = PlainVariant()
+    for name in variant._fields:
+        setattr(plain, name, getattr(variant, name, None))
+    return plain
+
+
+def make_responses(count: int, variants_per_response: int = 2) -> List[Response]:
+    responses = []
+    for index in range(0, count, variants_per_response):
+        response = Response(f"mot{index}")
+        response.variants = [make_variant(index + offset) for offset in range(variants_per_response)]
+        responses.append(response)
+    return responses
+
+
+def object_size(variant: Variant | PlainVariant) -> int:
+    """Size of the variant object itself plus its __dict__ if it has one, without the field values"""
+    size = sys.getsizeof(variant)
+    if hasattr(variant, '__dict__'):
+        size += sys.getsizeof(variant.__dict__)
+    return size
+
+
+def measure_memory(factory: Callable[[int], Variant | PlainVariant], count: int) -> float:
+    """Return the bytes allocated per variant, including its lists and strings"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    variants = [factory(index) for index in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del variants
+    return (after - before) / count
+
+
+def measure_seconds(function: Callable[[], object], repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def serialize_with_dumps(responses: List[Response]) -> str:
+    """How main.py wrote JSON lines before JsonlExporter"""
+    stream = io.StringIO()
+    for response in responses:
+        stream.write(json.dumps(response.to_dict(), ensure_ascii=False) + '\n')
+    return stream.getvalue()
+
+
+def serialize_with_exporter(responses: List[Response]) -> str:
+    stream = io.StringIO()
+    JsonlExporter().export(responses, stream)
+    return stream.getvalue()
+
+
+def run(count: int, repeat: int) -> None:
+    """
+    Measure variant memory and JSON lines throughput.
+
+    Args:
+        count: Number of variants created
+        repeat: Number of timed serializations, the best is reported
+    """
+    slotted = measure_memory(make_variant, count)
+    with_dict = measure_memory(make_plain_variant, count)
+    slotted_object = object_size(make_variant(0))
+    dict_object = object_size(make_plain_variant(0))
+    print(f"Variants:             {count}")
+    print(f"Object with __dict__: {dict_object} bytes, {with_dict:.0f} bytes with content")
+    print(f"Object with slots:    {slotted_object} bytes, {slotted:.0f} bytes with content "
+          f"({1 - slotted / with_dict:.0%} less)")
+
+    responses = make_responses(count)
+    if serialize_with_dumps(responses) != serialize_with_exporter(responses):
+        raise AssertionError("JsonlExporter output differs from json.dumps")
+    dumps = measure_seconds(lambda: serialize_with_dumps(responses), repeat)
+    exporter = measure_seconds(lambda: serialize_with_exporter(responses), repeat)
+    print(f"json.dumps per line:  {len(responses) / dumps:,.0f} responses/s")
+    print(f"JsonlExporter:        {len(responses) / exporter:,.0f} responses/s ({dumps / exporter:.2f}x)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark variant memory use and JSON lines serialization")
+    parser.add_argument('--count', type=int, default=200_000, help="Number of variants created")
+    parser.add_argument('--repeat', type=int, default=5, help="Number of timed serializations")
+    args = parser.parse_args()
+    run(args.count, args.repeat)
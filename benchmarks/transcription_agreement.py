@@ -0,0 +1,72 @@
+import argparse
+import time
+from typing import List
+
+from logic.parsing.websites.openipa_parser import OpenIPAParser
+from logic.services.french_transcriber import FrenchTranscriber
+from logic.services.transcription_store import TranscriptionStore
+
+# Notation that differs between transcribers without changing the pronunciation
+_IGNORED_CHARACTERS = str.maketrans("", "", "/[]. ˈˌ‿")
+
+
+def normalize(transcription: str) -> str:
+    return transcription.translate(_IGNORED_CHARACTERS)
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance between two strings"""
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def run(path: str | None, show: int) -> None:
+    """
+    Compare the offline transcriber against every OpenIPA transcription cached so far.
+
+    Args:
+        path: Transcription database, defaults to the shared store's
+        show: Number of disagreements to print
+    """
+    rows = TranscriptionStore(path).items(OpenIPAParser.SOURCE)
+    if not rows:
+        print("No cached OpenIPA transcriptions, run with TRANSCRIPTION_BACKEND=openipa first")
+        return
+
+    words: List[str] = [word for word, _ in rows]
+    transcriber = FrenchTranscriber()
+    start = time.perf_counter()
+    predictions = transcriber.transcribe_many(words)
+    elapsed = time.perf_counter() - start
+
+    exact = errors = length = 0
+    disagreements = []
+    for (word, expected), predicted in zip(rows, predictions):
+        expected, predicted = normalize(expected), normalize(predicted or "")
+        distance = edit_distance(predicted, expected)
+        exact += distance == 0
+        errors += distance
+        length += len(expected)
+        if distance:
+            disagreements.append((distance, word, predicted, expected))
+
+    total = len(rows)
+    print(f"Words compared:      {total}")
+    print(f"Exact agreement:     {exact / total:.1%}")
+    print(f"Character agreement: {1 - errors / max(length, 1):.1%}")
+    print(f"Transcription time:  {elapsed / total * 1e6:.1f} µs per word (cold cache)")
+    for distance, word, predicted, expected in sorted(disagreements, reverse=True)[:show]:
+        print(f"  {word}: rules {predicted} / openipa {expected}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Measure the offline transcriber against cached OpenIPA output")
+    parser.add_argument('--db', help="Transcription database, defaults to $TRANSCRIPTION_DB")
+    parser.add_argument('--show', type=int, default=20, help="Number of disagreements to print")
+    args = parser.parse_args()
+    run(args.db, args.show)
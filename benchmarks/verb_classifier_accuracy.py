@@ -0,0 +1,70 @@
+import argparse
+import json
+import sqlite3
+import time
+
+from model.enums.conjugates_with import ConjugatesWith
+from model.enums.verb_group import VerbGroup
+from logic.services.verb_metadata_store import VerbMetadataStore
+from logic.verb_classifier import VerbClassifier
+
+
+def run(path: str | None, min_confidence: float) -> None:
+    """
+    Compare the offline classifier against every verb scraped from Le Figaro so far.
+
+    Args:
+        path: Verb metadata database, defaults to the shared store's
+        min_confidence: Confidence from which the augmenter trusts the classifier
+    """
+    store = VerbMetadataStore(path)
+    with sqlite3.connect(store.path) as connection:
+        rows = [(infinitive, verb_group, conjugates_with, json.loads(conjugates_as))
+                for infinitive, verb_group, conjugates_with, conjugates_as in connection.execute(
+                    "SELECT infinitive, verb_group, conjugates_with, conjugates_as FROM verbs")]
+    if not rows:
+        print(f"No scraped verbs in {store.path}, prewarm the store first")
+        return
+
+    classifier = VerbClassifier()
+    start = time.perf_counter()
+    classifications = [classifier.classify(infinitive) for infinitive, *_ in rows]
+    elapsed = time.perf_counter() - start
+
+    group_hits = auxiliary_hits = model_hits = model_exact = confident = confident_hits = 0
+    for (infinitive, verb_group, conjugates_with, conjugates_as), classification in zip(rows, classifications):
+        group_ok = classification.verb_group == VerbGroup(verb_group)
+        auxiliary_ok = classification.conjugates_with == ConjugatesWith(conjugates_with)
+        # Le Figaro lists verbs conjugated the same way, the classifier names one model verb:
+        # they agree if the model is among the listed verbs, or if both are empty
+        predicted, scraped = set(classification.conjugates_as), set(conjugates_as)
+        model_ok = predicted == scraped or bool(predicted & scraped)
+        group_hits += group_ok
+        auxiliary_hits += auxiliary_ok
+        model_hits += model_ok
+        model_exact += predicted == scraped
+        if classification.confidence >= min_confidence:
+            confident += 1
+            confident_hits += group_ok and auxiliary_ok and model_ok
+            if not (group_ok and auxiliary_ok and model_ok):
+                print(f"Confident miss: {infinitive} -> {classification.verb_group.value}, "
+                      f"{classification.conjugates_with.value}, {classification.conjugates_as} "
+                      f"(scraped {verb_group}, {conjugates_with}, {conjugates_as})")
+
+    total = len(rows)
+    print(f"Verbs compared:        {total}")
+    print(f"Group accuracy:        {group_hits / total:.1%}")
+    print(f"Auxiliary accuracy:    {auxiliary_hits / total:.1%}")
+    print(f"Model agreement:       {model_hits / total:.1%} ({model_exact / total:.1%} exact lists)")
+    print(f"Coverage (>= {min_confidence}): {confident / total:.1%} of verbs skip Le Figaro")
+    if confident:
+        print(f"Accuracy when covered: {confident_hits / confident:.1%}")
+    print(f"Classification time:   {elapsed / total * 1e6:.1f} µs per verb")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Measure the offline verb classifier against scraped Le Figaro data")
+    parser.add_argument('--db', help="Verb metadata database, defaults to $VERB_METADATA_DB")
+    parser.add_argument('--min-confidence', type=float, default=0.8)
+    args = parser.parse_args()
+    run(args.db, args.min_confidence)
@@ -0,0 +1,81 @@
+import asyncio
+import atexit
+import threading
+from typing import Any, Awaitable, Callable, Coroutine, List, TypeVar
+
+T = TypeVar('T')
+
+
+class AsyncRunner:
+    """
+    Runs coroutines from synchronous code on one long-lived event loop.
+
+    The loop lives in a daemon thread, so objects bound to it (browsers, pages,
+    connection pools) can be shared by every call instead of being rebuilt by a
+    fresh asyncio.run() each time.
+    """
+
+    _loop: asyncio.AbstractEventLoop | None = None
+    _thread: threading.Thread | None = None
+    _lock = threading.Lock()
+    _shutdown_hooks: List[Callable[[], Awaitable[None]]] = []
+
+    @classmethod
+    def _get_loop(cls) -> asyncio.AbstractEventLoop:
+        """Return the background loop, starting it on first use"""
+        with cls._lock:
+            if cls._loop is None:
+                cls._loop = asyncio.new_event_loop()
+                cls._thread = threading.Thread(target=cls._loop.run_forever, name="AsyncRunner", daemon=True)
+                cls._thread.start()
+                atexit.register(cls.shutdown)
+            return cls._loop
+
+    @classmethod
+    def run(cls, coroutine: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """
+        Run a coroutine on the background loop and block until it finishes.
+
+        Args:
+            coroutine: The coroutine to run
+            timeout: Seconds to wait for the result, None to wait forever
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            RuntimeError: If called from the background loop itself, which would deadlock
+        """
+        loop = cls._get_loop()
+        if threading.current_thread() is cls._thread:
+            coroutine.close()
+            raise RuntimeError("AsyncRunner.run() cannot be called from inside the runner's own loop")
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result(timeout)
+
+    @classmethod
+    def add_shutdown_hook(cls, hook: Callable[[], Awaitable[None]]) -> None:
+        """Register a coroutine function to await on the background loop before it stops"""
+        cls._shutdown_hooks.append(hook)
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Run the shutdown hooks and stop the background loop"""
+        with cls._lock:
+            loop, thread = cls._loop, cls._thread
+            cls._loop, cls._thread = None, None
+        if loop is None:
+            return
+
+        async def run_hooks() -> None:
+            for hook in cls._shutdown_hooks:
+                try:
+                    await hook()
+                except Exception as e:
+                    print(f"Warning: Shutdown hook failed: {e}")
+
+        try:
+            asyncio.run_coroutine_threadsafe(run_hooks(), loop).result(timeout=30)
+        except Exception as e:
+            print(f"Warning: Failed to run shutdown hooks: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
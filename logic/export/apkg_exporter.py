@@ -0,0 +1,343 @@
+import argparse
+import hashlib
+import html
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import zipfile
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from model.response import Response
+
+
+class ApkgExporter:
+    """
+    Writes card data straight into an Anki package (.apkg).
+
+    A package is a zip holding the SQLite collection (collection.anki2), the
+    media files stored under numeric names, and a "media" JSON index mapping
+    those names back to file names. Notes are inserted in bulk transactions and
+    media are deduplicated by content hash and streamed from disk into the zip,
+    so exporting large decks needs neither row-by-row writes nor the media in memory.
+    """
+
+    _FIELD_SEPARATOR = "\x1f"
+    _BATCH_SIZE = 1000
+    _HASH_CHUNK_SIZE = 1024 * 1024
+
+    # Fixed model ids so re-exported decks update the same note types in Anki
+    _NOUN_MODEL_ID = 1735689600001
+    _VERB_MODEL_ID = 1735689600002
+    _WORD_MODEL_ID = 1735689600003
+
+    _COMMON_FIELDS = ["Word", "Category", "Definitions", "Examples", "Transcription", "Pronunciation", "Images"]
+    _MODEL_FIELDS = {
+        _NOUN_MODEL_ID: _COMMON_FIELDS + ["Gender"],
+        _VERB_MODEL_ID: _COMMON_FIELDS + ["VerbGroup", "ConjugatesWith", "ConjugatesAs"],
+        _WORD_MODEL_ID: _COMMON_FIELDS,
+    }
+    _MODEL_NAMES = {
+        _NOUN_MODEL_ID: "French Noun",
+        _VERB_MODEL_ID: "French Verb",
+        _WORD_MODEL_ID: "French Word",
+    }
+    _MODEL_BACK_EXTRAS = {
+        _NOUN_MODEL_ID: "{{#Gender}}<div class=extra>{{Gender}}</div>{{/Gender}}",
+        _VERB_MODEL_ID: (
+            "{{#VerbGroup}}<div class=extra>{{VerbGroup}} group</div>{{/VerbGroup}}"
+            "{{#ConjugatesWith}}<div class=extra>auxiliary: {{ConjugatesWith}}</div>{{/ConjugatesWith}}"
+            "{{#ConjugatesAs}}<div class=extra>conjugates as: {{ConjugatesAs}}</div>{{/ConjugatesAs}}"
+        ),
+        _WORD_MODEL_ID: "",
+    }
+
+    _CSS = (".card { font-family: arial; font-size: 20px; text-align: center; color: black; background-color: white; }\n"
+            ".extra { font-size: 16px; color: #555; }\n"
+            "img { max-height: 200px; }")
+
+    _SCHEMA = """
+        CREATE TABLE col (
+            id integer primary key, crt integer not null, mod integer not null, scm integer not null,
+            ver integer not null, dty integer not null, usn integer not null, ls integer not null,
+            conf text not null, models text not null, decks text not null, dconf text not null, tags text not null
+        );
+        CREATE TABLE notes (
+            id integer primary key, guid text not null, mid integer not null, mod integer not null,
+            usn integer not null, tags text not null, flds text not null, sfld integer not null,
+            csum integer not null, flags integer not null, data text not null
+        );
+        CREATE TABLE cards (
+            id integer primary key, nid integer not null, did integer not null, ord integer not null,
+            mod integer not null, usn integer not null, type integer not null, queue integer not null,
+            due integer not null, ivl integer not null, factor integer not null, reps integer not null,
+            lapses integer not null, left integer not null, odue integer not null, odid integer not null,
+            flags integer not null, data text not null
+        );
+        CREATE TABLE revlog (
+            id integer primary key, cid integer not null, usn integer not null, ease integer not null,
+            ivl integer not null, lastIvl integer not null, factor integer not null, time integer not null,
+            type integer not null
+        );
+        CREATE TABLE graves (usn integer not null, oid integer not null, type integer not null);
+        CREATE INDEX ix_notes_usn on notes (usn);
+        CREATE INDEX ix_cards_usn on cards (usn);
+        CREATE INDEX ix_revlog_usn on revlog (usn);
+        CREATE INDEX ix_cards_nid on cards (nid);
+        CREATE INDEX ix_cards_sched on cards (did, queue, due);
+        CREATE INDEX ix_revlog_cid on revlog (cid);
+        CREATE INDEX ix_notes_csum on notes (csum);
+    """
+
+    def __init__(self, deck_name: str = "French Vocabulary"):
+        """
+        Initialize the exporter.
+
+        Args:
+            deck_name: Name of the deck the notes are added to
+        """
+        self.deck_name = deck_name
+        # Deck id derived from the name, so re-exports land in the same deck
+        self.deck_id = int(hashlib.sha1(deck_name.encode('utf-8')).hexdigest()[:12], 16)
+        self._media_by_hash: Dict[str, str] = {}
+        self._media_paths: Dict[str, str] = {}
+
+    def export(self, responses: Iterable[Response], output_path: str | os.PathLike) -> int:
+        """
+        Export responses to an .apkg file.
+
+        Args:
+            responses: The responses to export, consumed lazily
+            output_path: Where to write the package
+
+        Returns:
+            int: The number of notes written
+        """
+        return self.export_dicts((response.to_dict() for response in responses), output_path)
+
+    def export_dicts(self, responses: Iterable[dict], output_path: str | os.PathLike) -> int:
+        """
+        Export serialized responses (as produced by Response.to_dict) to an .apkg file.
+
+        Args:
+            responses: The serialized responses, consumed lazily
+            output_path: Where to write the package
+
+        Returns:
+            int: The number of notes written
+        """
+        self._media_by_hash = {}
+        self._media_paths = {}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            collection_path = os.path.join(temp_dir, "collection.anki2")
+            note_count = self._write_collection(collection_path, responses)
+            self._write_package(collection_path, output_path)
+        return note_count
+
+    def _write_collection(self, collection_path: str, responses: Iterable[dict]) -> int:
+        connection = sqlite3.connect(collection_path)
+        try:
+            # The file is throwaway until it is zipped, so durability is not needed while building it
+            connection.execute("PRAGMA journal_mode = OFF")
+            connection.execute("PRAGMA synchronous = OFF")
+            connection.executescript(self._SCHEMA)
+            self._insert_collection_row(connection)
+
+            note_count = 0
+            rows = self._iter_rows(responses)
+            while batch := list(islice(rows, self._BATCH_SIZE)):
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO notes VALUES (?, ?, ?, ?, -1, '', ?, ?, ?, 0, '')",
+                        [note for note, _ in batch])
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO cards VALUES (?, ?, ?, 0, ?, -1, 0, 0, ?, 0, 0, 0, 0, 0, 0, 0, 0, '')",
+                        [card for _, card in batch])
+                note_count += len(batch)
+            return note_count
+        finally:
+            connection.close()
+
+    def _iter_rows(self, responses: Iterable[dict]) -> Iterator[Tuple[tuple, tuple]]:
+        """Yield (note row, card row) pairs for every variant of every response"""
+        now = int(time.time())
+        # Note and card ids are millisecond timestamps in Anki, so consecutive ids stay unique
+        base_id = int(time.time() * 1000)
+        position = 0
+        seen_guids = set()
+        for response in responses:
+            for variant in response.get('variants', []):
+                if not variant.get('word'):
+                    continue
+                # Stable guid per word and category, so re-imports update notes instead of duplicating them
+                guid = hashlib.sha1(f"{variant.get('category')}:{variant['word']}".encode('utf-8')).hexdigest()[:20]
+                if guid in seen_guids:
+                    continue
+                seen_guids.add(guid)
+
+                model_id, fields = self._note_fields(variant)
+                flds = self._FIELD_SEPARATOR.join(fields)
+                sort_field = html.unescape(fields[0])
+                checksum = int(hashlib.sha1(sort_field.encode('utf-8')).hexdigest()[:8], 16)
+                note_id = base_id + position
+                yield ((note_id, guid, model_id, now, flds, sort_field, checksum),
+                       (note_id, note_id, self.deck_id, now, position))
+                position += 1
+
+    def _note_fields(self, variant: dict) -> Tuple[int, List[str]]:
+        """Pick the note model for a variant and build its field values"""
+        category = variant.get('category') or ""
+        fields = [
+            html.escape(variant.get('word') or ""),
+            html.escape(category),
+            "<br>".join(html.escape(definition) for definition in variant.get('english_definitions') or []),
+            "<br>".join(html.escape(example) for example in variant.get('examples') or []),
+            html.escape(variant.get('transcription') or ""),
+            "".join(f"[sound:{name}]" for name in self._add_media(variant.get('pronunciations') or [])),
+            "".join(f'<img src="{html.escape(image)}">' for image in self._add_images(variant.get('images') or [])),
+        ]
+
+        if category == "noun":
+            return self._NOUN_MODEL_ID, fields + [html.escape(variant.get('gender') or "")]
+        if category == "verb":
+            return self._VERB_MODEL_ID, fields + [
+                html.escape(variant.get('verb_group') or ""),
+                html.escape(variant.get('conjugates_with') or ""),
+                html.escape(", ".join(variant.get('conjugates_as') or [])),
+            ]
+        return self._WORD_MODEL_ID, fields
+
+    def _hash_file(self, path: str) -> str:
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            while chunk := f.read(self._HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _add_media(self, paths: List[str]) -> List[str]:
+        """Register local media files and return their names inside the package, skipping duplicates and missing files"""
+        names = []
+        for path in paths:
+            if not os.path.isfile(path):
+                print(f"Warning: Media file not found, skipping: {path}")
+                continue
+            content_hash = self._hash_file(path)
+            name = self._media_by_hash.get(content_hash)
+            if name is None:
+                name = os.path.basename(path)
+                if name in self._media_paths:
+                    # Same file name but different content, disambiguate with the hash
+                    name = f"{content_hash[:12]}_{name}"
+                self._media_by_hash[content_hash] = name
+                self._media_paths[name] = path
+            if name not in names:
+                names.append(name)
+        return names
+
+    def _add_images(self, images: List[str]) -> List[str]:
+        """Embed downloaded images (e.g. thumbnails) as media and keep remote image URLs as they are"""
+        return [name for image in images
+                for name in (self._add_media([image]) if os.path.isfile(image) else [image])]
+
+    def _insert_collection_row(self, connection: sqlite3.Connection) -> None:
+        now = int(time.time())
+        models = {
+            str(model_id): self._model_json(model_id, now)
+            for model_id in self._MODEL_FIELDS
+        }
+        decks = {
+            "1": self._deck_json(1, "Default", now),
+            str(self.deck_id): self._deck_json(self.deck_id, self.deck_name, now),
+        }
+        conf = {
+            "nextPos": 1, "estTimes": True, "activeDecks": [1], "sortType": "noteFld", "timeLim": 0,
+            "sortBackwards": False, "addToCur": True, "curDeck": 1, "newBust": True, "dueCounts": True,
+            "curModel": None, "collapseTime": 1200,
+        }
+        dconf = {
+            "1": {
+                "id": 1, "name": "Default", "replayq": True, "timer": 0, "maxTaken": 60, "usn": 0,
+                "mod": 0, "autoplay": True,
+                "lapse": {"delays": [10], "leechAction": 0, "leechFails": 8, "minInt": 1, "mult": 0},
+                "rev": {"perDay": 100, "ease4": 1.3, "fuzz": 0.05, "minSpace": 1, "ivlFct": 1,
+                        "maxIvl": 36500, "bury": True},
+                "new": {"perDay": 20, "delays": [1, 10], "separate": True, "ints": [1, 4, 7],
+                        "initialFactor": 2500, "bury": True, "order": 1},
+            }
+        }
+        connection.execute(
+            "INSERT INTO col VALUES (1, ?, ?, ?, 11, 0, 0, 0, ?, ?, ?, ?, '{}')",
+            (now - now % 86400, now * 1000, now * 1000,
+             json.dumps(conf), json.dumps(models), json.dumps(decks), json.dumps(dconf)))
+
+    def _model_json(self, model_id: int, now: int) -> dict:
+        field_names = self._MODEL_FIELDS[model_id]
+        front = "<div>{{Word}}</div>{{#Transcription}}<div class=extra>{{Transcription}}</div>{{/Transcription}}"
+        back = ("{{FrontSide}}<hr id=answer>{{Definitions}}" + self._MODEL_BACK_EXTRAS[model_id] +
+                "{{#Examples}}<div class=extra>{{Examples}}</div>{{/Examples}}{{Pronunciation}}{{Images}}")
+        return {
+            "id": model_id,
+            "name": self._MODEL_NAMES[model_id],
+            "type": 0,
+            "mod": now,
+            "usn": -1,
+            "sortf": 0,
+            "did": self.deck_id,
+            "tmpls": [{"name": "Card 1", "ord": 0, "qfmt": front, "afmt": back,
+                       "did": None, "bqfmt": "", "bafmt": ""}],
+            "flds": [{"name": name, "ord": index, "sticky": False, "rtl": False,
+                      "font": "Arial", "size": 20, "media": []}
+                     for index, name in enumerate(field_names)],
+            "css": self._CSS,
+            "latexPre": "\\documentclass[12pt]{article}\n\\special{papersize=3in,5in}\n\\usepackage{amssymb,amsmath}\n"
+                        "\\pagestyle{empty}\n\\setlength{\\parindent}{0in}\n\\begin{document}\n",
+            "latexPost": "\\end{document}",
+            "tags": [],
+            "vers": [],
+            "req": [[0, "any", [0]]],
+        }
+
+    @staticmethod
+    def _deck_json(deck_id: int, name: str, now: int) -> dict:
+        return {
+            "id": deck_id, "name": name, "mod": now, "usn": -1, "desc": "", "dyn": 0, "conf": 1,
+            "collapsed": False, "extendNew": 10, "extendRev": 50,
+            "lrnToday": [0, 0], "revToday": [0, 0], "newToday": [0, 0], "timeToday": [0, 0],
+        }
+
+    def _write_package(self, collection_path: str, output_path: str | os.PathLike) -> None:
+        """Zip the collection and media, streaming every file from disk"""
+        output_path = Path(output_path)
+        temp_path = output_path.with_name(f".{output_path.name}.tmp")
+        media_index = {}
+        with zipfile.ZipFile(temp_path, 'w', compression=zipfile.ZIP_DEFLATED) as package:
+            package.write(collection_path, "collection.anki2")
+            for index, (name, path) in enumerate(self._media_paths.items()):
+                # Audio is already compressed, deflating it again only costs time
+                package.write(path, str(index), compress_type=zipfile.ZIP_STORED)
+                media_index[str(index)] = name
+            package.writestr("media", json.dumps(media_index))
+        os.replace(temp_path, output_path)
+
+
+def _read_jsonl(path: str) -> Iterator[dict]:
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Export a JSONL file of card responses to an Anki package")
+    parser.add_argument('input', help="JSONL file written by main.py --output")
+    parser.add_argument('output', help="The .apkg file to write")
+    parser.add_argument('--deck-name', default="French Vocabulary", help="Name of the Anki deck")
+    args = parser.parse_args()
+
+    count = ApkgExporter(args.deck_name).export_dicts(_read_jsonl(args.input), args.output)
+    print(f"Exported {count} notes to {args.output}", file=sys.stderr)
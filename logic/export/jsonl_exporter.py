@@ -0,0 +1,62 @@
+import json
+from typing import Iterable, List, TextIO
+
+from model.response import Response
+
+
+class JsonlExporter:
+    """
+    Writes responses to a text stream as JSON lines, one Response.to_dict() per line.
+
+    The output is identical to json.dumps(response.to_dict(), ensure_ascii=False)
+    per line, but a single encoder is reused instead of json.dumps building a new
+    one for every call with non-default options, and lines are written to the
+    stream in chunks rather than one write per response.
+    """
+
+    # to_dict() builds fresh trees without cycles, so the encoder's cycle tracking is skipped
+    _ENCODER = json.JSONEncoder(ensure_ascii=False, check_circular=False)
+    _CHUNK_SIZE = 256
+
+    def __init__(self, chunk_size: int | None = None):
+        """
+        Args:
+            chunk_size: Number of lines buffered per write, 1 writes each response as soon as it is encoded
+        """
+        self.chunk_size = chunk_size or self._CHUNK_SIZE
+
+    @classmethod
+    def dumps(cls, response: Response) -> str:
+        """Serialize one response as a single JSON line, without the line break"""
+        return cls._ENCODER.encode(response.to_dict())
+
+    def export(self, responses: Iterable[Response], stream: TextIO, flush: bool = False) -> int:
+        """
+        Write responses to a stream.
+
+        Args:
+            responses: The responses to write, consumed lazily
+            stream: A text stream opened for writing
+            flush: Flush the stream after each chunk
+
+        Returns:
+            int: The number of responses written
+        """
+        count = 0
+        lines: List[str] = []
+        for response in responses:
+            lines.append(self.dumps(response))
+            count += 1
+            if len(lines) >= self.chunk_size:
+                self._write(lines, stream, flush)
+        if lines:
+            self._write(lines, stream, flush)
+        return count
+
+    @staticmethod
+    def _write(lines: List[str], stream: TextIO, flush: bool) -> None:
+        lines.append("")
+        stream.write("\n".join(lines))
+        lines.clear()
+        if flush:
+            stream.flush()
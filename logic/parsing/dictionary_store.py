@@ -0,0 +1,263 @@
+import argparse
+import hashlib
+import os
+import re
+import shutil
+import sqlite3
+import threading
+import time
+import unicodedata
+import zlib
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
+
+from dotenv import load_dotenv
+
+from logic.parsing.encoded_file_loader import EncodedFileLoader
+
+load_dotenv()
+
+
+class DictionaryImportReport(NamedTuple):
+    """Outcome of importing a directory of saved pages"""
+    imported: int
+    skipped: int
+
+
+class DictionaryStore:
+    """
+    Indexed store of dictionary pages keyed by (source, normalized query, language pair).
+
+    Pages are kept as zlib-compressed UTF-8 in a single SQLite file and
+    deduplicated by content hash, so thousands of pages take little space and a
+    lookup is a primary-key read instead of probing file names. Hits and misses
+    are counted per source for the stats command.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS pages (
+            source TEXT NOT NULL,
+            query TEXT NOT NULL,
+            language_pair TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            origin TEXT,
+            stored_at REAL NOT NULL,
+            PRIMARY KEY (source, query, language_pair)
+        );
+        CREATE TABLE IF NOT EXISTS blobs (
+            content_hash TEXT PRIMARY KEY,
+            content BLOB NOT NULL,
+            size INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS pages_content_hash ON pages (content_hash);
+        CREATE TABLE IF NOT EXISTS lookups (
+            source TEXT PRIMARY KEY,
+            hits INTEGER NOT NULL DEFAULT 0,
+            misses INTEGER NOT NULL DEFAULT 0
+        );
+    """
+
+    # Pages saved from the browser, named after the page title in the English or the French interface
+    _SAVED_PAGE_NAME = re.compile(r"^(?P<query>.+) - (?P<title>English translation|Traduction anglaise) – Linguee\.html?$")
+    # Page titles in order of preference; both interfaces show the same English-French dictionary entries
+    _SAVED_PAGE_TITLES = ("English translation", "Traduction anglaise")
+    _LINGUEE_LANGUAGE_PAIR = "english-french"
+
+    _shared: 'DictionaryStore | None' = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: str | os.PathLike | None = None):
+        """
+        Open (or create) a store.
+
+        Args:
+            path: SQLite file to use, defaults to $DICTIONARY_STORE_DB or cache/dictionary.sqlite3
+        """
+        self.path = Path(path or os.getenv('DICTIONARY_STORE_DB', 'cache/dictionary.sqlite3'))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.executescript(self._SCHEMA)
+
+    @classmethod
+    def shared(cls) -> 'DictionaryStore':
+        """Return the process-wide store configured from the environment"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        return " ".join(unicodedata.normalize('NFC', query).casefold().split())
+
+    def get(self, source: str, query: str, language_pair: str, count: bool = True) -> str | None:
+        """
+        Look up a page.
+
+        Args:
+            source: The dictionary, e.g. "linguee"
+            query: The searched word
+            language_pair: The dictionary's language pair, e.g. "english-french"
+            count: Count the lookup as a hit or miss in the stats
+
+        Returns:
+            str | None: The page's HTML, or None if it is not stored
+        """
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT blobs.content FROM pages JOIN blobs USING (content_hash) "
+                "WHERE source = ? AND query = ? AND language_pair = ?",
+                (source, self.normalize_query(query), language_pair)).fetchone()
+            if count:
+                column = "hits" if row else "misses"
+                self._connection.execute(
+                    f"INSERT INTO lookups (source, {column}) VALUES (?, 1) "
+                    f"ON CONFLICT (source) DO UPDATE SET {column} = {column} + 1",
+                    (source,))
+        return zlib.decompress(row[0]).decode('utf-8') if row else None
+
+    def put(self, source: str, query: str, language_pair: str, html: str, origin: str | None = None,
+            replace: bool = True) -> bool:
+        """
+        Store a page.
+
+        Args:
+            source: The dictionary, e.g. "linguee"
+            query: The searched word
+            language_pair: The dictionary's language pair, e.g. "english-french"
+            html: The page's HTML
+            origin: Where the page came from (URL or file), for reference
+            replace: Replace a page already stored under the same key, otherwise keep it
+
+        Returns:
+            bool: Whether the page was stored
+        """
+        content = html.encode('utf-8')
+        content_hash = hashlib.sha256(content).hexdigest()
+        key = (source, self.normalize_query(query), language_pair)
+        with self._lock, self._connection:
+            replaced = self._connection.execute(
+                "SELECT content_hash FROM pages WHERE source = ? AND query = ? AND language_pair = ?", key).fetchone()
+            if replaced and not replace:
+                return False
+            if not self._connection.execute(
+                    "SELECT 1 FROM blobs WHERE content_hash = ?", (content_hash,)).fetchone():
+                self._connection.execute(
+                    "INSERT INTO blobs (content_hash, content, size) VALUES (?, ?, ?)",
+                    (content_hash, zlib.compress(content, 9), len(content)))
+            self._connection.execute(
+                "INSERT OR REPLACE INTO pages (source, query, language_pair, content_hash, origin, stored_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (*key, content_hash, origin, time.time()))
+            # Only the replaced page's blob can have become unused
+            if replaced and replaced[0] != content_hash:
+                self._connection.execute(
+                    "DELETE FROM blobs WHERE content_hash = ? "
+                    "AND NOT EXISTS (SELECT 1 FROM pages WHERE content_hash = ?)", (replaced[0], replaced[0]))
+        return True
+
+    def items(self, source: str, language_pair: str) -> List[Tuple[str, str]]:
+        """Return all (query, HTML) pairs stored for a source and language pair, without counting them as lookups"""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT pages.query, blobs.content FROM pages JOIN blobs USING (content_hash) "
+                "WHERE source = ? AND language_pair = ? ORDER BY pages.query", (source, language_pair)).fetchall()
+        return [(query, zlib.decompress(content).decode('utf-8')) for query, content in rows]
+
+    @classmethod
+    def parse_saved_page_name(cls, name: str) -> tuple[str, str, bool] | None:
+        """
+        Recognize a page saved from Linguee in the browser.
+
+        Returns:
+            tuple[str, str, bool] | None: The query, the language pair and whether the page is from the
+                preferred (English) interface, or None if the name is not a saved Linguee page
+        """
+        if match := cls._SAVED_PAGE_NAME.match(name):
+            return match.group('query'), cls._LINGUEE_LANGUAGE_PAIR, match.group('title') == cls._SAVED_PAGE_TITLES[0]
+        return None
+
+    @classmethod
+    def saved_page_paths(cls, directory: str | os.PathLike, query: str) -> List[Path]:
+        """The file names a Linguee page for a query may have been saved under, preferred interface first"""
+        return [Path(directory) / f"{query} - {title} – Linguee.htm" for title in cls._SAVED_PAGE_TITLES]
+
+    def import_file(self, path: str | os.PathLike) -> bool:
+        """
+        Import one saved Linguee page; its "_files" asset directory is not needed and ignored.
+
+        Pages from both interfaces are stored under the same key. A page from the
+        English interface replaces a stored one, a page from the French interface
+        is only stored if there is none yet.
+
+        Returns:
+            bool: Whether the file was recognized as a saved Linguee page
+        """
+        path = Path(path)
+        key = self.parse_saved_page_name(path.name)
+        if key is None:
+            return False
+        query, language_pair, preferred = key
+        self.put("linguee", query, language_pair, EncodedFileLoader.load(path), origin=str(path), replace=preferred)
+        return True
+
+    def import_directory(self, directory: str | os.PathLike, remove_imported: bool = False) -> DictionaryImportReport:
+        """
+        Import every saved Linguee page found directly in a directory.
+
+        Args:
+            directory: The directory holding the saved pages, usually cache/
+            remove_imported: Delete each imported page and its "_files" asset directory afterwards
+        """
+        imported = skipped = 0
+        for path in sorted(Path(directory).iterdir()):
+            if not path.is_file() or path.suffix not in ('.htm', '.html'):
+                continue
+            try:
+                if self.import_file(path):
+                    imported += 1
+                    if remove_imported:
+                        shutil.rmtree(path.with_name(f"{path.stem}_files"), ignore_errors=True)
+                        path.unlink()
+                    continue
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"Warning: Could not import {path}: {e}")
+            skipped += 1
+        return DictionaryImportReport(imported, skipped)
+
+    def stats(self) -> Dict[str, int | float]:
+        """Return page counts, stored sizes and lookup hit/miss counts"""
+        with self._lock:
+            pages = self._connection.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            blobs, size, compressed = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(LENGTH(content)), 0) FROM blobs").fetchone()
+            hits, misses = self._connection.execute(
+                "SELECT COALESCE(SUM(hits), 0), COALESCE(SUM(misses), 0) FROM lookups").fetchone()
+        return {
+            'pages': pages,
+            'distinct_pages': blobs,
+            'html_bytes': size,
+            'stored_bytes': compressed,
+            'file_bytes': self.path.stat().st_size,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / (hits + misses), 3) if hits + misses else 0.0,
+        }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Maintain the local dictionary page store")
+    parser.add_argument('command', choices=['import', 'stats'])
+    parser.add_argument('directory', nargs='?', default='cache', help="Directory of saved pages to import")
+    parser.add_argument('--remove-imported', action='store_true',
+                        help="Delete imported pages and their _files directories")
+    parser.add_argument('--db', help="Store file, defaults to $DICTIONARY_STORE_DB or cache/dictionary.sqlite3")
+    args = parser.parse_args()
+
+    store = DictionaryStore(args.db)
+    match args.command:
+        case 'import':
+            print(store.import_directory(args.directory, remove_imported=args.remove_imported))
+        case 'stats':
+            print(store.stats())
@@ -0,0 +1,106 @@
+import codecs
+import mmap
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Tuple
+
+from charset_normalizer import from_bytes
+
+
+class EncodedFileLoader:
+    """
+    Reads text files of unknown encoding (e.g. saved web pages) with a single read.
+
+    The file is memory-mapped and the encoding is taken from, in order: a byte
+    order mark, an HTML <meta charset> / http-equiv declaration near the start,
+    or charset_normalizer run on a small prefix only. The text is then decoded
+    straight from the mapped buffer. Detected encodings are cached per file
+    (path, size and modification time), so a file is only inspected once per process.
+    """
+
+    _BOMS = (
+        (codecs.BOM_UTF32_LE, 'utf-32'),
+        (codecs.BOM_UTF32_BE, 'utf-32'),
+        (codecs.BOM_UTF8, 'utf-8-sig'),
+        (codecs.BOM_UTF16_LE, 'utf-16'),
+        (codecs.BOM_UTF16_BE, 'utf-16'),
+    )
+    # <meta charset="..."> and <meta http-equiv="Content-Type" content="text/html; charset=...">
+    _META_CHARSET = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([a-zA-Z0-9_:.\-]+)""", re.IGNORECASE)
+    # HTML requires the declaration within the first 1024 bytes, real pages are sloppier
+    _META_SCAN_BYTES = 4096
+    _DETECTION_BYTES = 64 * 1024
+    # Used when nothing else works; every byte sequence decodes in cp1252 or latin-1
+    _FALLBACK_ENCODINGS = ('cp1252', 'latin-1')
+
+    _encodings: Dict[Tuple[str, int, int], str] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def detect_encoding(cls, data: bytes | mmap.mmap) -> str:
+        """
+        Determine the encoding of a buffer from its start.
+
+        Args:
+            data: The file content, only a prefix of it is inspected
+
+        Returns:
+            str: A Python codec name
+        """
+        for bom, encoding in cls._BOMS:
+            if data[:len(bom)] == bom:
+                return encoding
+
+        if match := cls._META_CHARSET.search(data[:cls._META_SCAN_BYTES]):
+            declared = match.group(1).decode('ascii', errors='ignore')
+            try:
+                return codecs.lookup(declared).name
+            except LookupError:
+                pass
+
+        best = from_bytes(bytes(data[:cls._DETECTION_BYTES])).best()
+        return best.encoding if best else cls._FALLBACK_ENCODINGS[0]
+
+    @classmethod
+    def _cache_key(cls, path: Path) -> Tuple[str, int, int]:
+        stat = path.stat()
+        return str(path.resolve()), stat.st_size, stat.st_mtime_ns
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> str:
+        """
+        Read and decode a file.
+
+        Args:
+            path: The file to read
+
+        Returns:
+            str: The decoded text
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        path = Path(path)
+        key = cls._cache_key(path)
+        with open(path, 'rb') as f:
+            if key[1] == 0:
+                return ""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                with cls._lock:
+                    encoding = cls._encodings.get(key)
+                if encoding is None:
+                    encoding = cls.detect_encoding(buffer)
+
+                for candidate in (encoding, *cls._FALLBACK_ENCODINGS):
+                    try:
+                        # Decodes from the mapped pages without copying the file into a bytes object first
+                        text = str(buffer, candidate)
+                    except UnicodeDecodeError:
+                        continue
+                    with cls._lock:
+                        cls._encodings[key] = candidate
+                    return text
+        # Unreachable, latin-1 decodes every byte sequence
+        raise UnicodeDecodeError(encoding, b"", 0, 0, f"Could not decode {path}")
@@ -0,0 +1,93 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Set, Tuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class ExtractionCache:
+    """
+    Caches what a parser extracted from a page, keyed by the page's content hash and the extractor version.
+
+    Records are stored as compact JSON, so rebuilding cards from unchanged
+    pages skips HTML parsing entirely. Entries made by another extractor
+    version are never served, and are deleted the first time a new version
+    stores something.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS extractions (
+            source TEXT NOT NULL,
+            page_hash TEXT NOT NULL,
+            extractor_version INTEGER NOT NULL,
+            records TEXT NOT NULL,
+            extracted_at REAL NOT NULL,
+            PRIMARY KEY (source, page_hash, extractor_version)
+        );
+    """
+
+    _shared: 'ExtractionCache | None' = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: str | os.PathLike | None = None):
+        """
+        Args:
+            path: SQLite file to use, defaults to $EXTRACTION_CACHE_DB or cache/extractions.sqlite3
+        """
+        self.path = Path(path or os.getenv('EXTRACTION_CACHE_DB', 'cache/extractions.sqlite3'))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.executescript(self._SCHEMA)
+        # (source, version) pairs whose older entries have been purged already
+        self._purged: Set[Tuple[str, int]] = set()
+
+    @classmethod
+    def shared(cls) -> 'ExtractionCache':
+        """Return the process-wide cache configured from the environment"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def page_hash(html: str) -> str:
+        return hashlib.sha256(html.encode('utf-8')).hexdigest()
+
+    def get(self, source: str, page_hash: str, extractor_version: int) -> List[dict] | None:
+        """
+        Look up the records extracted from a page.
+
+        Args:
+            source: The parser, e.g. "linguee"
+            page_hash: The page's hash, see page_hash()
+            extractor_version: The extractor version currently in use
+
+        Returns:
+            List[dict] | None: The records, or None if the page was not extracted by this version yet
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT records FROM extractions WHERE source = ? AND page_hash = ? AND extractor_version = ?",
+                (source, page_hash, extractor_version)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, source: str, page_hash: str, extractor_version: int, records: List[dict]) -> None:
+        """Store the records extracted from a page"""
+        data = json.dumps(records, ensure_ascii=False, separators=(',', ':'))
+        with self._lock, self._connection:
+            if (source, extractor_version) not in self._purged:
+                self._connection.execute(
+                    "DELETE FROM extractions WHERE source = ? AND extractor_version != ?", (source, extractor_version))
+                self._purged.add((source, extractor_version))
+            self._connection.execute(
+                "INSERT OR REPLACE INTO extractions (source, page_hash, extractor_version, records, extracted_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (source, page_hash, extractor_version, data, time.time()))
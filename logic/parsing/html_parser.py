@@ -1,8 +1,47 @@
+import os
 from typing import List, Optional
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer, Tag
+from dotenv import load_dotenv
+
+load_dotenv()
 
 
 class HtmlParser:
+    # Tree builder used when HTML_PARSER_BACKEND is not set; html.parser is the pure-Python fallback
+    _DEFAULT_BACKEND = "lxml"
+    _FALLBACK_BACKEND = "html.parser"
+    _backend: str | None = None
+
+    @classmethod
+    def get_backend(cls) -> str:
+        """
+        Get the BeautifulSoup tree builder to use, as configured by HTML_PARSER_BACKEND.
+
+        Falls back to html.parser if the configured builder is not installed.
+        """
+        if cls._backend is None:
+            backend = os.getenv('HTML_PARSER_BACKEND', cls._DEFAULT_BACKEND)
+            try:
+                BeautifulSoup("", backend)
+            except FeatureNotFound:
+                print(f"Warning: HTML parser backend '{backend}' is not available, using '{cls._FALLBACK_BACKEND}'")
+                backend = cls._FALLBACK_BACKEND
+            cls._backend = backend
+        return cls._backend
+
+    @classmethod
+    def set_backend(cls, backend: str | None) -> None:
+        """Override the configured tree builder, None re-reads HTML_PARSER_BACKEND"""
+        cls._backend = None
+        if backend is not None:
+            BeautifulSoup("", backend)  # Raises FeatureNotFound for unknown builders
+            cls._backend = backend
+
+    @classmethod
+    def create_soup(cls, markup: str | bytes, parse_only: SoupStrainer | None = None) -> BeautifulSoup:
+        """Parse markup with the configured tree builder"""
+        return BeautifulSoup(markup, cls.get_backend(), parse_only=parse_only)
+
     @staticmethod
     def get_text(element: Optional[Tag]) -> Optional[str]:
         """Safely get text from a BeautifulSoup element"""
@@ -0,0 +1,361 @@
+import asyncio
+import atexit
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Mapping, NamedTuple
+from urllib.parse import parse_qsl, quote, unquote, urlencode, urlsplit, urlunsplit
+
+import httpx
+import requests
+from dotenv import load_dotenv
+
+from logic.parsing.http_session import HttpSession
+from logic.parsing.site_limiter import SiteLimiter
+
+load_dotenv()
+
+
+class OfflineCacheMissError(LookupError):
+    """Raised in offline mode when a URL is not in the cache"""
+
+
+class CachedResponse(NamedTuple):
+    """The body of an HTTP response, either fresh from the network or served from the cache"""
+    url: str
+    content: bytes
+    encoding: str | None
+    from_cache: bool
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+
+class _Lookup(NamedTuple):
+    """A cache index lookup for one URL, with the stored body if it could be read"""
+    normalized_url: str
+    key: str
+    entry: tuple | None
+    content: bytes | None
+
+
+class HttpCache:
+    """
+    Persistent on-disk cache for GET requests, keyed by normalized URL.
+
+    Bodies are stored zlib-compressed and content-addressed, so identical pages
+    fetched through different URLs are stored once. An SQLite index keeps the
+    validators (ETag / Last-Modified) used to revalidate stale entries, and the
+    access times used to evict the least recently used entries once the cache
+    grows over its size cap.
+    """
+
+    _DAY = 24 * 60 * 60
+    _DEFAULT_TTL = 7 * _DAY
+
+    # Freshness lifetime per host, hosts not listed here use _DEFAULT_TTL
+    _SITE_TTLS: Dict[str, float] = {
+        "www.linguee.com": 30 * _DAY,
+        "leconjugueur.lefigaro.fr": 365 * _DAY,  # Conjugation tables do not change
+    }
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            key TEXT PRIMARY KEY,
+            url TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            encoding TEXT,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at REAL NOT NULL,
+            last_access REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS blobs (
+            content_hash TEXT PRIMARY KEY,
+            size INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+        CREATE INDEX IF NOT EXISTS entries_content_hash ON entries (content_hash);
+    """
+    # Cache hits only update the LRU order, so their access times are written in batches
+    _ACCESS_BATCH_SIZE = 100
+
+    _shared: 'HttpCache | None' = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, directory: str | os.PathLike | None = None, max_bytes: int | None = None,
+                 offline: bool | None = None, ttls: Dict[str, float] | None = None,
+                 session: requests.Session | None = None):
+        """
+        Open (or create) a cache directory.
+
+        Args:
+            directory: Where to keep the index and bodies, defaults to $HTTP_CACHE_DIR or cache/http
+            max_bytes: Size cap for the stored (compressed) bodies, defaults to $HTTP_CACHE_MAX_MB
+            offline: Serve only from the cache and never touch the network, defaults to $HTTP_CACHE_OFFLINE
+            ttls: Per-host freshness lifetimes in seconds, merged over the built-in ones
+            session: Session used for network requests, defaults to the shared HttpSession
+        """
+        self.directory = Path(directory or os.getenv('HTTP_CACHE_DIR', 'cache/http'))
+        self.max_bytes = max_bytes if max_bytes is not None else int(os.getenv('HTTP_CACHE_MAX_MB', '512')) * 1024 * 1024
+        self.offline = offline if offline is not None else os.getenv('HTTP_CACHE_OFFLINE', '') in ('1', 'true', 'yes')
+        self.ttls = {**self._SITE_TTLS, **(ttls or {})}
+        self.session = session or HttpSession.shared()
+
+        (self.directory / 'blobs').mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.directory / 'index.sqlite3', check_same_thread=False)
+        self._connection.executescript(self._SCHEMA)
+        self._pending_access: Dict[str, float] = {}
+
+    @classmethod
+    def shared(cls) -> 'HttpCache':
+        """Return the process-wide cache configured from the environment"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+                atexit.register(cls._shared.flush)
+            return cls._shared
+
+    def flush(self) -> None:
+        """Write the access times of recent cache hits to the index"""
+        with self._lock, self._connection:
+            self._flush_access()
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """
+        Normalize a URL so that equivalent spellings share a cache entry.
+
+        Lowercases the scheme and host, drops default ports and fragments,
+        canonicalizes percent-encoding and sorts the query parameters.
+        """
+        parts = urlsplit(url.strip())
+        scheme = parts.scheme.lower()
+        host = (parts.hostname or '').lower()
+        if parts.port and (scheme, parts.port) not in (('http', 80), ('https', 443)):
+            host = f"{host}:{parts.port}"
+        path = quote(unquote(parts.path), safe="/:@!$&'()*+,;=-._~") or '/'
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        return urlunsplit((scheme, host, path, query, ''))
+
+    @staticmethod
+    def _key(normalized_url: str) -> str:
+        return hashlib.sha256(normalized_url.encode('utf-8')).hexdigest()
+
+    def _blob_path(self, content_hash: str) -> Path:
+        return self.directory / 'blobs' / content_hash[:2] / f"{content_hash}.zz"
+
+    def _ttl(self, url: str) -> float:
+        return self.ttls.get(urlsplit(url).hostname or '', self._DEFAULT_TTL)
+
+    def _read_blob(self, content_hash: str) -> bytes | None:
+        try:
+            return zlib.decompress(self._blob_path(content_hash).read_bytes())
+        except (OSError, zlib.error) as e:
+            print(f"Warning: Corrupt or missing cache blob {content_hash}: {e}")
+            return None
+
+    def _write_blob(self, content: bytes) -> str:
+        """Store a body under its content hash and return the hash"""
+        content_hash = hashlib.sha256(content).hexdigest()
+        path = self._blob_path(content_hash)
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            compressed = zlib.compress(content, 6)
+            # Write through a temp file so a crash never leaves a truncated blob behind
+            temp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            temp_path.write_bytes(compressed)
+            os.replace(temp_path, path)
+            self._connection.execute(
+                "INSERT OR REPLACE INTO blobs (content_hash, size) VALUES (?, ?)",
+                (content_hash, len(compressed)))
+        return content_hash
+
+    def _lookup(self, key: str) -> tuple | None:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT content_hash, encoding, etag, last_modified, fetched_at FROM entries WHERE key = ?",
+                (key,)).fetchone()
+
+    def _touch(self, key: str, refreshed: bool = False) -> None:
+        now = time.time()
+        with self._lock:
+            if not refreshed:
+                self._pending_access[key] = now
+                if len(self._pending_access) >= self._ACCESS_BATCH_SIZE:
+                    with self._connection:
+                        self._flush_access()
+                return
+            self._pending_access.pop(key, None)
+            with self._connection:
+                self._connection.execute(
+                    "UPDATE entries SET fetched_at = ?, last_access = ? WHERE key = ?", (now, now, key))
+
+    def _flush_access(self) -> None:
+        """Write the batched access times, the caller holds the lock"""
+        if self._pending_access:
+            self._connection.executemany(
+                "UPDATE entries SET last_access = ? WHERE key = ?",
+                [(last_access, key) for key, last_access in self._pending_access.items()])
+            self._pending_access.clear()
+
+    def _store(self, key: str, url: str, content: bytes, encoding: str | None,
+               etag: str | None, last_modified: str | None) -> None:
+        now = time.time()
+        with self._lock, self._connection:
+            content_hash = self._write_blob(content)
+            replaced = self._connection.execute("SELECT content_hash FROM entries WHERE key = ?", (key,)).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(key, url, content_hash, encoding, etag, last_modified, fetched_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, content_hash, encoding, etag, last_modified, now, now))
+            self._pending_access.pop(key, None)
+            # Only the replaced entry's body can have become unused
+            if replaced and replaced[0] != content_hash:
+                self._release_blob(replaced[0])
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the stored bodies fit under max_bytes"""
+        total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        # The LRU order must include the hits not written yet
+        self._flush_access()
+        for key, content_hash in self._connection.execute(
+                "SELECT key, content_hash FROM entries ORDER BY last_access").fetchall():
+            self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= self._release_blob(content_hash)
+            if total <= self.max_bytes:
+                break
+
+    def _release_blob(self, content_hash: str) -> int:
+        """Remove a body if no entry points at it any more and return the number of bytes freed"""
+        if self._connection.execute("SELECT 1 FROM entries WHERE content_hash = ? LIMIT 1", (content_hash,)).fetchone():
+            return 0
+        row = self._connection.execute("SELECT size FROM blobs WHERE content_hash = ?", (content_hash,)).fetchone()
+        self._blob_path(content_hash).unlink(missing_ok=True)
+        self._connection.execute("DELETE FROM blobs WHERE content_hash = ?", (content_hash,))
+        return row[0] if row else 0
+
+    def _lookup_url(self, url: str) -> _Lookup:
+        normalized_url = self.normalize_url(url)
+        key = self._key(normalized_url)
+        entry = self._lookup(key)
+        return _Lookup(normalized_url, key, entry, self._read_blob(entry[0]) if entry else None)
+
+    def _lookup_fresh(self, url: str) -> tuple[_Lookup, CachedResponse | None]:
+        """Look up a URL, returning the lookup and the cached copy if it may be served without the network"""
+        lookup = self._lookup_url(url)
+        return lookup, self._serve_fresh(url, lookup)
+
+    def _serve_fresh(self, url: str, lookup: _Lookup) -> CachedResponse | None:
+        """Return the cached copy if it may be served without the network, None if a request is needed"""
+        if lookup.content is not None:
+            _, encoding, _, _, fetched_at = lookup.entry
+            if self.offline or time.time() - fetched_at < self._ttl(lookup.normalized_url):
+                self._touch(lookup.key)
+                return CachedResponse(url, lookup.content, encoding, True)
+        elif self.offline:
+            raise OfflineCacheMissError(f"'{url}' is not cached and the HTTP cache is in offline mode")
+        return None
+
+    @staticmethod
+    def _conditional_headers(lookup: _Lookup, headers: Dict[str, str] | None) -> Dict[str, str]:
+        """Add the validators of a stale cached copy to the request headers"""
+        headers = dict(headers or {})
+        if lookup.content is not None:
+            _, _, etag, last_modified, _ = lookup.entry
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def _serve_stale(self, url: str, lookup: _Lookup, error: Exception) -> CachedResponse:
+        """Fall back to the stale cached copy when revalidation failed, re-raising if there is none"""
+        if lookup.content is None:
+            raise error
+        print(f"Warning: Revalidating '{url}' failed, serving stale copy: {error}")
+        return CachedResponse(url, lookup.content, lookup.entry[1], True)
+
+    def _complete(self, url: str, lookup: _Lookup, status_code: int, content: bytes, encoding: str | None,
+                  headers: Mapping[str, str]) -> CachedResponse:
+        """Turn a network response into a CachedResponse, refreshing or storing the cache entry"""
+        if status_code == 304 and lookup.content is not None:
+            self._touch(lookup.key, refreshed=True)
+            return CachedResponse(url, lookup.content, lookup.entry[1], True)
+
+        if status_code == 200:
+            self._store(lookup.key, lookup.normalized_url, content, encoding,
+                        headers.get('ETag'), headers.get('Last-Modified'))
+        return CachedResponse(url, content, encoding, False)
+
+    def get(self, url: str, **kwargs) -> CachedResponse:
+        """
+        GET a URL through the cache.
+
+        Fresh entries are served without touching the network. Stale entries are
+        revalidated with their ETag / Last-Modified validators, and served as-is if
+        the revalidation fails. Non-200 responses are returned but not stored.
+
+        Args:
+            url: The URL to fetch
+            **kwargs: Extra arguments passed on to Session.get
+
+        Returns:
+            CachedResponse: The response body and its encoding
+
+        Raises:
+            OfflineCacheMissError: If offline mode is on and the URL is not cached
+        """
+        lookup, cached = self._lookup_fresh(url)
+        if cached:
+            return cached
+
+        headers = self._conditional_headers(lookup, kwargs.pop('headers', None))
+        try:
+            with SiteLimiter.limit(url):
+                response = self.session.get(url, headers=headers, **kwargs)
+        except requests.RequestException as e:
+            return self._serve_stale(url, lookup, e)
+
+        return self._complete(url, lookup, response.status_code, response.content,
+                              response.encoding or response.apparent_encoding, response.headers)
+
+    async def get_async(self, url: str, **kwargs) -> CachedResponse:
+        """
+        GET a URL through the cache without blocking the event loop, see get().
+
+        Args:
+            url: The URL to fetch
+            **kwargs: Extra arguments passed on to httpx.AsyncClient.get
+
+        Returns:
+            CachedResponse: The response body and its encoding
+
+        Raises:
+            OfflineCacheMissError: If offline mode is on and the URL is not cached
+        """
+        # Index queries, blob reads and writes wait on the cache lock and the disk, so they run in a worker thread
+        lookup, cached = await asyncio.to_thread(self._lookup_fresh, url)
+        if cached:
+            return cached
+
+        headers = self._conditional_headers(lookup, kwargs.pop('headers', None))
+        try:
+            async with SiteLimiter.limit_async(url):
+                response = await HttpSession.shared_async().get(url, headers=headers, **kwargs)
+        except httpx.HTTPError as e:
+            return self._serve_stale(url, lookup, e)
+
+        return await asyncio.to_thread(self._complete, url, lookup, response.status_code, response.content,
+                                       response.charset_encoding or response.encoding, response.headers)
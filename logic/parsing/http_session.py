@@ -0,0 +1,85 @@
+import asyncio
+import os
+import threading
+import weakref
+
+import httpx
+import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+from logic.async_runner import AsyncRunner
+
+load_dotenv()
+
+
+class HttpSession:
+    """
+    Process-wide requests.Session shared by all parsers and services.
+
+    Reusing one session keeps TCP/TLS connections alive between requests to the
+    same host instead of doing a handshake for every page. The connection pool
+    is sized to cover the per-site concurrency allowed by SiteLimiter.
+    """
+
+    _shared: requests.Session | None = None
+    _shared_lock = threading.Lock()
+    # Async clients are bound to the loop they were created on, so there is one per loop
+    _async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = \
+        weakref.WeakKeyDictionary()
+
+    @classmethod
+    def shared(cls) -> requests.Session:
+        """Return the process-wide session, creating it on first use"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls.create()
+            return cls._shared
+
+    @classmethod
+    def create(cls, pool_connections: int | None = None, pool_maxsize: int | None = None) -> requests.Session:
+        """
+        Create a session with a keep-alive connection pool.
+
+        Args:
+            pool_connections: Number of hosts to keep pools for, defaults to $HTTP_POOL_HOSTS or 8
+            pool_maxsize: Connections kept per host, defaults to $HTTP_POOL_MAXSIZE or 8
+
+        Returns:
+            requests.Session: The configured session
+        """
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections or int(os.getenv('HTTP_POOL_HOSTS', '8')),
+            pool_maxsize=pool_maxsize or int(os.getenv('HTTP_POOL_MAXSIZE', '8')),
+        )
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    @classmethod
+    def shared_async(cls) -> httpx.AsyncClient:
+        """Return the keep-alive async client belonging to the running event loop, creating it if needed"""
+        loop = asyncio.get_running_loop()
+        client = cls._async_clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=int(os.getenv('HTTP_POOL_HOSTS', '8')) * int(os.getenv('HTTP_POOL_MAXSIZE', '8')),
+                    max_keepalive_connections=int(os.getenv('HTTP_POOL_MAXSIZE', '8')),
+                ),
+            )
+            cls._async_clients[loop] = client
+        return client
+
+    @classmethod
+    async def close_shared_async(cls) -> None:
+        """Close the async client of the running event loop, if one was created"""
+        client = cls._async_clients.pop(asyncio.get_running_loop(), None)
+        if client:
+            await client.aclose()
+
+
+# Close the shared async client when the background loop stops at interpreter exit
+AsyncRunner.add_shutdown_hook(HttpSession.close_shared_async)
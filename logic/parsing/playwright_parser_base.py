@@ -3,6 +3,8 @@ import abc
 from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright, Page
 
+from logic.parsing.html_parser import HtmlParser
+
 
 class PlaywrightParserBase(metaclass=abc.ABCMeta):
     """Base class for website parsers that need JavaScript support"""
@@ -24,7 +26,7 @@ class PlaywrightParserBase(metaclass=abc.ABCMeta):
         # Wait for the content to load - override in subclass if needed
         self._page.wait_for_load_state('networkidle')
         
-        return BeautifulSoup(self._page.content(), "html.parser")
+        return HtmlParser.create_soup(self._page.content())
 
     @abc.abstractmethod
     def compose_query_url(self) -> str:
@@ -1,24 +1,64 @@
 import abc
+import asyncio
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+from logic.parsing.http_cache import HttpCache
+from logic.parsing.html_parser import HtmlParser
 
 
 class RequestsParserBase(metaclass=abc.ABCMeta):
-    """Base class for website parsers that use requests + BeautifulSoup"""
+    """
+    Base class for website parsers that use requests + BeautifulSoup.
+
+    Construction does no I/O: the page is fetched and parsed the first time
+    soup is accessed, and then kept for the lifetime of the parser.
+    """
     
     query: str | None
-    soup: BeautifulSoup | None
+    # Restricts tree building to the matching elements, None parses the whole page
+    parse_only: SoupStrainer | None = None
 
     def __init__(self, query):
         self.query = query
-        self.soup = self.query_dictionary()
+        self._soup: BeautifulSoup | None = None
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        """The parsed page, loaded on first access"""
+        if self._soup is None:
+            self._soup = self.query_dictionary()
+        return self._soup
+
+    @soup.setter
+    def soup(self, value: BeautifulSoup | None) -> None:
+        self._soup = value
+
+    def release_soup(self) -> None:
+        """Drop the parsed page so its memory can be reclaimed; it is loaded again if soup is accessed"""
+        self._soup = None
 
     @abc.abstractmethod
     def compose_query_url(self)->str:
         pass
 
+    def fetch_page(self) -> str:
+        """Fetch the page's HTML through the HTTP cache"""
+        return HttpCache.shared().get(self.compose_query_url()).text
+
+    async def fetch_page_async(self) -> str:
+        """Async version of fetch_page"""
+        return (await HttpCache.shared().get_async(self.compose_query_url())).text
+
     def query_dictionary(self)->BeautifulSoup:
-        url = self.compose_query_url()
-        response = requests.get(url)
-        return BeautifulSoup(response.text, "html.parser")
\ No newline at end of file
+        return HtmlParser.create_soup(self.fetch_page(), parse_only=self.parse_only)
+
+    async def query_dictionary_async(self) -> BeautifulSoup:
+        """Fetch and parse the page without blocking the event loop; parsing runs in a worker thread"""
+        html = await self.fetch_page_async()
+        return await asyncio.to_thread(HtmlParser.create_soup, html, parse_only=self.parse_only)
+
+    async def load_async(self) -> None:
+        """Load the page ahead of time so the synchronous getters do no I/O"""
+        if self._soup is None:
+            self._soup = await self.query_dictionary_async()
\ No newline at end of file
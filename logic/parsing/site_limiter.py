@@ -0,0 +1,79 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Iterator
+from urllib.parse import urlparse
+
+
+class SiteLimiter:
+    """Caps the number of requests that may be in flight to each website at once"""
+
+    _DEFAULT_LIMIT = 4
+    _ASYNC_POLL_INTERVAL = 0.05
+
+    # Per-host concurrency limits, hosts not listed here use _DEFAULT_LIMIT
+    _limits: Dict[str, int] = {
+        "www.linguee.com": 2,
+        "leconjugueur.lefigaro.fr": 4,
+        "forvo.com": 2,
+        "www.openipa.org": 2,
+        "www.googleapis.com": 4,
+    }
+    _semaphores: Dict[str, threading.BoundedSemaphore] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def configure(cls, limits: Dict[str, int]) -> None:
+        """
+        Override the concurrency limits for the given hosts.
+
+        Args:
+            limits: Mapping of host name (e.g. "www.linguee.com") to the maximum
+                number of concurrent requests allowed to that host
+        """
+        with cls._lock:
+            for host, limit in limits.items():
+                if limit < 1:
+                    raise ValueError(f"Site limit for '{host}' must be at least 1, got {limit}")
+                cls._limits[host] = limit
+                # Drop the old semaphore so the new limit takes effect on next use
+                cls._semaphores.pop(host, None)
+
+    @classmethod
+    def _get_semaphore(cls, url: str) -> threading.BoundedSemaphore:
+        """Return the semaphore guarding the host of the given URL"""
+        host = urlparse(url).hostname or url
+        with cls._lock:
+            semaphore = cls._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(cls._limits.get(host, cls._DEFAULT_LIMIT))
+                cls._semaphores[host] = semaphore
+            return semaphore
+
+    @classmethod
+    @contextmanager
+    def limit(cls, url: str) -> Iterator[None]:
+        """Block until a request slot for the URL's host is free and hold it for the block"""
+        semaphore = cls._get_semaphore(url)
+        semaphore.acquire()
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+    @classmethod
+    @asynccontextmanager
+    async def limit_async(cls, url: str) -> AsyncIterator[None]:
+        """
+        Async counterpart of limit().
+
+        The slot is shared with synchronous callers, so it is polled rather than
+        awaited; this keeps the event loop free and is safe to cancel.
+        """
+        semaphore = cls._get_semaphore(url)
+        while not semaphore.acquire(blocking=False):
+            await asyncio.sleep(cls._ASYNC_POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            semaphore.release()
@@ -0,0 +1,197 @@
+import asyncio
+import os
+import random
+import weakref
+from typing import List
+
+from dotenv import load_dotenv
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, async_playwright
+
+from logic.async_runner import AsyncRunner
+
+load_dotenv()
+
+
+class PooledPage:
+    """A page checked out of the BrowserPool, together with the context that owns it"""
+
+    def __init__(self, browser: Browser, context: BrowserContext, page: Page):
+        self.browser = browser
+        self.context = context
+        self.page = page
+        self.navigations = 0
+
+    def is_healthy(self) -> bool:
+        """Check that the page can still be used"""
+        return self.browser.is_connected() and not self.page.is_closed()
+
+    def record_navigation(self) -> None:
+        self.navigations += 1
+
+
+class BrowserPool:
+    """
+    A bounded pool of reusable Chromium pages shared by all Playwright parsers.
+
+    A few browser processes are launched lazily and kept alive for the lifetime
+    of the event loop. Each pooled page has its own context and is recycled after
+    a fixed number of navigations or as soon as it fails a health check.
+    """
+
+    _USER_AGENTS = [
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    ]
+
+    _EXTRA_HTTP_HEADERS = {
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+        "Accept-Encoding": "gzip, deflate, br",
+        "DNT": "1",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+        "Sec-Fetch-Dest": "document",
+        "Sec-Fetch-Mode": "navigate",
+        "Sec-Fetch-Site": "none",
+        "Sec-Fetch-User": "?1",
+        "Pragma": "no-cache",
+        "Cache-Control": "no-cache",
+    }
+
+    # One pool per event loop, since Playwright objects cannot be shared between loops
+    _instances: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BrowserPool]" = weakref.WeakKeyDictionary()
+
+    def __init__(self, max_browsers: int | None = None, max_pages: int | None = None,
+                 max_navigations_per_page: int | None = None):
+        """
+        Initialize an empty pool, nothing is launched until the first acquire().
+
+        Args:
+            max_browsers: Number of Chromium processes to spread pages over
+            max_pages: Maximum number of pages checked out at the same time
+            max_navigations_per_page: Number of navigations after which a page and its context are recycled
+
+        Raises:
+            ValueError: If max_browsers or max_pages is less than 1
+        """
+        self.max_browsers = max_browsers if max_browsers is not None else int(os.getenv('BROWSER_POOL_BROWSERS', '1'))
+        self.max_pages = max_pages if max_pages is not None else int(os.getenv('BROWSER_POOL_PAGES', '4'))
+        if self.max_browsers < 1:
+            raise ValueError(f"max_browsers must be at least 1, got {self.max_browsers}")
+        if self.max_pages < 1:
+            raise ValueError(f"max_pages must be at least 1, got {self.max_pages}")
+        self.max_navigations_per_page = max_navigations_per_page or int(os.getenv('BROWSER_POOL_MAX_NAVIGATIONS', '50'))
+
+        self._playwright: Playwright | None = None
+        self._browsers: List[Browser] = []
+        self._next_browser = 0
+        self._idle: List[PooledPage] = []
+        self._page_slots = asyncio.Semaphore(self.max_pages)
+        self._launch_lock = asyncio.Lock()
+        self._closed = False
+
+    @classmethod
+    def shared(cls) -> 'BrowserPool':
+        """Return the pool belonging to the running event loop, creating it if needed"""
+        loop = asyncio.get_running_loop()
+        pool = cls._instances.get(loop)
+        if pool is None:
+            pool = cls()
+            cls._instances[loop] = pool
+        return pool
+
+    async def _get_browser(self) -> Browser:
+        """Return a connected browser, launching one if the pool is not full yet"""
+        # Launches are serialized so overlapping checkouts never start several Chromiums at once
+        async with self._launch_lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+
+            self._browsers = [browser for browser in self._browsers if browser.is_connected()]
+            if len(self._browsers) < self.max_browsers:
+                self._browsers.append(await self._playwright.chromium.launch(headless=True))
+
+            self._next_browser = (self._next_browser + 1) % len(self._browsers)
+            return self._browsers[self._next_browser]
+
+    async def _new_page(self) -> PooledPage:
+        """Create a fresh context and page on one of the pooled browsers"""
+        browser = await self._get_browser()
+        # Configure context with settings that help bypass Cloudflare
+        context = await browser.new_context(
+            user_agent=random.choice(self._USER_AGENTS),
+            viewport={"width": 1920, "height": 1080},
+            screen={"width": 1920, "height": 1080},
+            java_script_enabled=True,
+            bypass_csp=True,  # Bypass Content Security Policy
+            extra_http_headers=self._EXTRA_HTTP_HEADERS,
+        )
+        return PooledPage(browser, context, await context.new_page())
+
+    async def _discard(self, pooled_page: PooledPage) -> None:
+        """Close a page's context, ignoring errors from an already dead browser"""
+        try:
+            await pooled_page.context.close()
+        except Exception as e:
+            print(f"Warning: Failed to close browser context: {e}")
+
+    async def acquire(self) -> PooledPage:
+        """
+        Check out a page, waiting if all pages are in use.
+
+        Returns:
+            PooledPage: A healthy page that must be handed back with release()
+        """
+        if self._closed:
+            raise RuntimeError("BrowserPool is closed")
+
+        await self._page_slots.acquire()
+        try:
+            while self._idle:
+                pooled_page = self._idle.pop()
+                if pooled_page.is_healthy():
+                    return pooled_page
+                await self._discard(pooled_page)
+            return await self._new_page()
+        except BaseException:
+            self._page_slots.release()
+            raise
+
+    async def release(self, pooled_page: PooledPage) -> None:
+        """Return a page to the pool, recycling it if it is worn out or unhealthy"""
+        try:
+            if (self._closed or not pooled_page.is_healthy()
+                    or pooled_page.navigations >= self.max_navigations_per_page):
+                await self._discard(pooled_page)
+            else:
+                self._idle.append(pooled_page)
+        finally:
+            self._page_slots.release()
+
+    async def close(self) -> None:
+        """Close every page, browser and the Playwright driver"""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for pooled_page in idle:
+            await self._discard(pooled_page)
+        for browser in self._browsers:
+            try:
+                await browser.close()
+            except Exception as e:
+                print(f"Warning: Failed to close browser: {e}")
+        self._browsers = []
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+    @classmethod
+    async def close_shared(cls) -> None:
+        """Close the pool of the running event loop, if one was created"""
+        pool = cls._instances.pop(asyncio.get_running_loop(), None)
+        if pool:
+            await pool.close()
+
+
+# Close the shared browsers when the background loop stops at interpreter exit
+AsyncRunner.add_shutdown_hook(BrowserPool.close_shared)
@@ -1,36 +1,26 @@
+import asyncio
 import base64
-import os
 import re
-from pathlib import Path
-from pprint import pprint
-from typing import List, NamedTuple, Tuple
-from urllib.parse import urlparse
+from typing import List
 
-from bs4 import BeautifulSoup
-from playwright.async_api import Page, ElementHandle, Response
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
+from logic.parsing.site_limiter import SiteLimiter
+from logic.services.audio_store import AudioStore
 from logic.parsing.websites.playwright_parser_base import PlaywrightParserBase
 
 
-class AudioPaths(NamedTuple):
-    """Container for audio paths extracted from play button"""
-    mp3_path: str
-    ogg_path: str
-    high_quality_mp3_path: str | None
-    high_quality_ogg_path: str | None
-
-
 class ForvoParser(PlaywrightParserBase):
     """Parser for Forvo website that provides word pronunciations"""
 
     _PLAY_BUTTON_SELECTOR = ".pronunciations-list-fr .pronunciation .play"
     _PLAY_ONCLICK_PATTERN = r"Play\(\d+,\s*'(?P<mp3>[^']+)',\s*'(?P<ogg>[^']+)'(,\s*\S*?,\s*'(?P<high_mp3>[^']*)',\s*'(?P<high_ogg>[^']*).*\))?"
-    _DOWNLOAD_DIR = "audio_downloads"
+    _AUDIO_BASE_URL = "https://audio12.forvo.com/audios"
+    _MAX_CONCURRENT_DOWNLOADS = 4
 
     def __init__(self, query: str):
         super().__init__(query)
-        # Create download directory if it doesn't exist
-        os.makedirs(self._DOWNLOAD_DIR, exist_ok=True)
+        self._audio_store = AudioStore.shared()
 
     def compose_query_url(self) -> str:
         """Return the URL to query based on self.query"""
@@ -38,12 +28,6 @@ class ForvoParser(PlaywrightParserBase):
         encoded_query = self.query.replace(" ", "+")
         return f"https://forvo.com/word/{encoded_query}/#fr"
 
-    async def _setup_page(self) -> None:
-        """Initialize page and wait for content to load"""
-        await super()._setup_page()
-        # Wait for pronunciations to load
-        await self._page.wait_for_selector(self._PLAY_BUTTON_SELECTOR, timeout=5000)
-
     def _decode_path(self, encoded_path: str | None) -> str | None:
         """Decode a Base64 encoded path, return None if path is empty or invalid"""
         if not encoded_path:
@@ -60,94 +44,94 @@ class ForvoParser(PlaywrightParserBase):
             print(f"Warning: Failed to decode path '{encoded_path}': {e}")
             return None
 
-    def _get_local_path(self, url: str) -> str:
-        """Get the local path where the audio file would be saved"""
-        filename = os.path.basename(urlparse(url).path)
-        return os.path.join(self._DOWNLOAD_DIR, f"{self.query}_{filename}")
-
-    async def _check_audio_url(self, url: str) -> Tuple[bool, str | None]:
+    def _get_candidate_urls(self, onclick: str) -> List[str]:
         """
-        Check if audio URL is valid or already downloaded
-        Returns (is_valid, local_path) where local_path is set if file exists or None if needs download
-        """
-        try:
-            local_path = self._get_local_path(url)
-            
-            # Check if file already exists
-            if os.path.exists(local_path):
-                print(f"Audio file already exists at {local_path}")
-                return True, local_path
-
-            # If file doesn't exist, check if URL is valid
-            response = await self._page.context.request.head(url)
-            return response.ok, None
+        Build the audio URLs of a play button, in order of preference.
 
-        except Exception as e:
-            print(f"Warning: Failed to check URL '{url}': {e}")
-            return False, None
+        Returns:
+            List[str]: High-quality MP3, MP3, high-quality OGG, then OGG URLs, skipping missing ones
+        """
+        match = re.match(self._PLAY_ONCLICK_PATTERN, onclick)
+        if not match:
+            return []
+
+        candidates = [
+            ("mp3", self._decode_path(match.group('high_mp3'))),
+            ("mp3", self._decode_path(match.group('mp3'))),
+            ("ogg", self._decode_path(match.group('high_ogg'))),
+            ("ogg", self._decode_path(match.group('ogg'))),
+        ]
+        return [f"{self._AUDIO_BASE_URL}/{kind}/{path}" for kind, path in candidates if path]
 
     async def _download_audio(self, url: str) -> str | None:
-        """Download audio file and save to disk, return local path if successful"""
+        """
+        Download an audio file into the audio store, return local path if successful.
+
+        The store writes through a temp file and moves it into place, so a failed
+        or interrupted download never leaves a truncated file behind.
+        """
         try:
-            local_path = self._get_local_path(url)
-
-            # Download the file
-            response = await self._page.context.request.get(url)
-            if response.ok:
-                content = await response.body()
-                with open(local_path, 'wb') as f:
-                    f.write(content)
-                print(f"Downloaded audio to {local_path}")
-                return local_path
-            return None
+            async with SiteLimiter.limit_async(url):
+                response = await self._page.context.request.get(url)
+            if not response.ok:
+                return None
+
+            local_path = await asyncio.to_thread(self._audio_store.put, url, await response.body())
+            print(f"Downloaded audio to {local_path}")
+            return local_path
         except Exception as e:
             print(f"Warning: Failed to download audio from '{url}': {e}")
             return None
 
+    async def _download_first_available(self, urls: List[str], semaphore: asyncio.Semaphore) -> str | None:
+        """Download the first URL that works, falling back through the list; reuse an existing download"""
+        for url in urls:
+            if local_path := await asyncio.to_thread(self._audio_store.get, url):
+                print(f"Audio file already exists at {local_path}")
+                return local_path
+
+        for url in urls:
+            # No HEAD probe: a failed GET is just as cheap and moves on to the next format
+            async with semaphore:
+                if downloaded_path := await self._download_audio(url):
+                    return downloaded_path
+        return None
+
     async def get_pronunciation(self) -> List[str]:
-        """Gets all pronunciation URLs from the page and downloads them"""
+        """
+        Gets all pronunciation URLs from the page and downloads them concurrently.
+
+        An empty list means the word has no French recordings. Other failures
+        raise instead, so a lookup that went wrong is not remembered as a word
+        without pronunciations.
+
+        Raises:
+            RuntimeError: If the page lists recordings but none of them could be downloaded
+        """
+        await self._setup_page()
         try:
-            await self._setup_page()
-            
-            # Find all play button elements
-            play_buttons = await self._page.query_selector_all(self._PLAY_BUTTON_SELECTOR)
-
-            local_paths = []
-            for button in play_buttons:
-                onclick = await button.get_attribute("onclick")
-                if onclick:
-                    match = re.match(self._PLAY_ONCLICK_PATTERN, onclick)
-                    if match:
-                        # Create potential URLs
-                        mp3_decoded = self._decode_path(match.group('mp3'))
-                        ogg_decoded = self._decode_path(match.group('ogg'))
-                        high_mp3_decoded = self._decode_path(match.group('high_mp3'))
-                        high_ogg_decoded = self._decode_path(match.group('high_ogg'))
-
-                        # Build and check URLs
-                        urls_to_check = []
-                        if high_mp3_decoded:
-                            urls_to_check.append(f"https://audio12.forvo.com/audios/mp3/{high_mp3_decoded}")
-                        if mp3_decoded:
-                            urls_to_check.append(f"https://audio12.forvo.com/audios/mp3/{mp3_decoded}")
-                        if high_ogg_decoded:
-                            urls_to_check.append(f"https://audio12.forvo.com/audios/ogg/{high_ogg_decoded}")
-                        if ogg_decoded:
-                            urls_to_check.append(f"https://audio12.forvo.com/audios/ogg/{ogg_decoded}")
-
-                        # Try to download from each URL until successful
-                        for url in urls_to_check:
-                            is_valid, existing_path = await self._check_audio_url(url)
-                            if is_valid:
-                                if existing_path:
-                                    local_paths.append(existing_path)
-                                    break
-                                if local_path := await self._download_audio(url):
-                                    local_paths.append(local_path)
-                                    break
-            
-            return local_paths
-            
-        except Exception as e:
-            print(f"Warning: Failed to get pronunciations for '{self.query}': {e}")
-            return []
\ No newline at end of file
+            # Wait for pronunciations to load
+            await self._page.wait_for_selector(self._PLAY_BUTTON_SELECTOR, timeout=5000)
+        except PlaywrightTimeoutError:
+            # No play button showed up: Forvo has no French recording of the word
+            return []
+
+        # Find all play button elements
+        play_buttons = await self._page.query_selector_all(self._PLAY_BUTTON_SELECTOR)
+
+        candidate_lists = []
+        for button in play_buttons:
+            onclick = await button.get_attribute("onclick")
+            if onclick and (urls := self._get_candidate_urls(onclick)):
+                candidate_lists.append(urls)
+
+        semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_DOWNLOADS)
+        results = await asyncio.gather(
+            *(self._download_first_available(urls, semaphore) for urls in candidate_lists)
+        )
+
+        # Keep the page order, drop failures and recordings that turned out to be identical
+        local_paths = list(dict.fromkeys(local_path for local_path in results if local_path))
+        if candidate_lists and not local_paths:
+            raise RuntimeError(f"None of the {len(candidate_lists)} pronunciations of '{self.query}' could be downloaded")
+        return local_paths
@@ -23,7 +23,6 @@ class LeFigaroParser(RequestsParserBase):
             query: The word to search for
         """
         super().__init__(query)
-        self.soup = self.query_dictionary()
 
     def compose_query_url(self) -> str:
         """
@@ -0,0 +1,128 @@
+from typing import List, NamedTuple, Optional
+
+from bs4 import Tag
+
+
+class LemmaFacts(NamedTuple):
+    """Everything LingueeParser reads from one .lemma element"""
+    word: Optional[str]  # Text of the first ".tag_lemma a.dictLink"
+    context: Optional[str]  # Text of the first ".tag_lemma_context"
+    word_type: Optional[str]  # Text of the first ".tag_wordtype" in English terms, e.g. "noun, masculine"
+    english_definitions: List[str]  # One per ".tag_trans" with a dictionary link
+    examples: List[str]  # French sentence of each ".example_lines .example.line"
+
+    @property
+    def word_type_tags(self) -> List[str]:
+        """The word type split into normalized tags, e.g. ["noun", "masculine"]"""
+        if not self.word_type:
+            return []
+        return [tag.strip().lower() for tag in self.word_type.split(',')]
+
+
+class LingueeLemmaExtractor:
+    """
+    Extracts a Linguee lemma's facts in a single walk over its subtree.
+
+    The selector-based getters of LingueeParser run one soupsieve query per fact,
+    each compiling its selector and walking the lemma again. Here the subtree is
+    visited once, tracking whether the current element lies inside the lemma
+    heading or an example list, and each fact is taken from the first element
+    that matches, so the results equal those of the corresponding selectors.
+    Word types of pages saved from the French interface are translated to the
+    English terms, so both interfaces yield the same facts.
+    """
+
+    # Word types as the French interface shows them, mapped to the English interface's terms
+    _FRENCH_WORD_TYPES = {
+        "nom": "noun",
+        "verbe": "verb",
+        "adjectif": "adjective",
+        "adverbe": "adverb",
+        "préposition": "preposition",
+        "masculin": "masculine",
+        "féminin": "feminine",
+        "pluriel": "plural",
+    }
+
+    @classmethod
+    def english_word_type(cls, word_type: str) -> str:
+        """Translate a word type from the French interface, e.g. "nom, masculin" -> "noun, masculine"; English is kept as is"""
+        parts = word_type.split(',')
+        if not any(part.strip().lower() in cls._FRENCH_WORD_TYPES for part in parts):
+            return word_type
+        return ", ".join(cls._FRENCH_WORD_TYPES.get(part.strip().lower(), part.strip()) for part in parts)
+
+    @staticmethod
+    def get_definition(translation: Tag) -> Optional[str]:
+        """
+        Get the English definition of a .tag_trans element.
+
+        The dictionary link's own text comes first and its placeholder (e.g. "sth.")
+        is appended after it, wherever it appears inside the link.
+
+        Returns:
+            Optional[str]: The definition, or None if the element has no dictionary link or text
+        """
+        dict_link: Optional[Tag] = translation.find('a', class_='dictLink')
+        if not dict_link:
+            return None
+
+        # Get the main text content (excluding placeholder)
+        main_text: str = ""
+        for content in dict_link.contents:
+            if isinstance(content, str):
+                main_text += content.strip()
+            elif not content.get('class') or 'placeholder' not in content.get('class'):
+                main_text += content.get_text(strip=True)
+
+        # Look for placeholder text
+        placeholder: Optional[Tag] = dict_link.find(class_='placeholder')
+        definition = f"{main_text} {placeholder.get_text(strip=True)}" if placeholder else main_text
+        return definition or None
+
+    @classmethod
+    def extract(cls, lemma: Tag) -> LemmaFacts:
+        """
+        Extract a lemma's facts.
+
+        Args:
+            lemma: A ".exact .lemma" element
+
+        Returns:
+            LemmaFacts: The lemma's word, context, word type, definitions and examples
+        """
+        word: Optional[str] = None
+        context: Optional[str] = None
+        word_type: Optional[str] = None
+        definitions: List[str] = []
+        examples: List[str] = []
+
+        lemma_classes = lemma.get('class') or ()
+        # Depth-first in document order: (element, inside .tag_lemma, inside .example_lines)
+        stack = [(child, 'tag_lemma' in lemma_classes, 'example_lines' in lemma_classes)
+                 for child in reversed(lemma.contents) if isinstance(child, Tag)]
+        while stack:
+            element, in_heading, in_examples = stack.pop()
+            classes = element.get('class') or ()
+
+            if classes:
+                if word is None and in_heading and element.name == 'a' and 'dictLink' in classes:
+                    word = element.get_text(strip=True)
+                if context is None and 'tag_lemma_context' in classes:
+                    context = element.get_text(strip=True)
+                if word_type is None and 'tag_wordtype' in classes:
+                    word_type = cls.english_word_type(element.get_text(strip=True))
+                if 'tag_trans' in classes and (definition := cls.get_definition(element)):
+                    definitions.append(definition)
+                if in_examples and 'example' in classes and 'line' in classes:
+                    sentence: Optional[Tag] = element.find(class_='tag_s')
+                    if sentence is not None and (text := sentence.get_text(strip=True)):
+                        examples.append(text.strip())
+
+                in_heading = in_heading or 'tag_lemma' in classes
+                in_examples = in_examples or 'example_lines' in classes
+
+            stack.extend((child, in_heading, in_examples)
+                         for child in reversed(element.contents) if isinstance(child, Tag))
+
+        return LemmaFacts(word, context, word_type, definitions, examples)
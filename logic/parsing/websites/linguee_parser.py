@@ -1,61 +1,78 @@
+import asyncio
+import os
 from typing import List, Optional
-from bs4 import Tag, BeautifulSoup
+from bs4 import Tag, SoupStrainer
 from pathlib import Path
-import chardet
+from dotenv import load_dotenv
 
 from model.enums.word_category import WordCategory
 from model.enums.word_gender import WordGender
 from model.variants.variant import Variant
 from model.variants.noun_variant import NounVariant
 from model.variants.verb_variant import VerbVariant
+from logic.parsing.dictionary_store import DictionaryStore
+from logic.parsing.extraction_cache import ExtractionCache
 from logic.parsing.html_parser import HtmlParser
 from logic.parsing.requests_parser_base import RequestsParserBase
+from logic.parsing.websites.linguee_lemma_extractor import LemmaFacts, LingueeLemmaExtractor
+
+load_dotenv()
 
 
 class LingueeParser(RequestsParserBase):
-    soup: BeautifulSoup
+    # Everything the getters read lives under the exact-match entries
+    _EXACT_MATCHES_STRAINER = SoupStrainer(class_="exact")
+    LANGUAGE_PAIR = "english-french"
+    # Bump whenever the extraction changes what it returns, so cached extractions are not reused
+    EXTRACTOR_VERSION = 3
 
-    def __init__(self, query: str) -> None:
+    def __init__(self, query: str, partial_parse: bool | None = None) -> None:
         """
-        Initialize the parser with a query string.
+        Initialize the parser with a query string. The page is loaded lazily, see query_dictionary.
         
         Args:
             query: The word to search for
-            
-        Raises:
-            FileNotFoundError: If the cache file for the query doesn't exist
-            UnicodeDecodeError: If the file encoding cannot be determined or is invalid
+            partial_parse: Build the tree only for the exact-match dictionary entries instead of
+                the whole page, defaults to $LINGUEE_PARTIAL_PARSE (on unless set to 0)
         """
         super().__init__(query)
-        # TODO: Roll back to using compose_query_url and website_parser_base's fetch_html
-        # when rate limiting is resolved
-        cache_path: Path = Path("cache") / f"{query} - English translation – Linguee.htm"
-        if not cache_path.exists():
-            raise FileNotFoundError(f"Cache file not found for query '{query}'. Please ensure the file exists at: {cache_path}")
-        
-        # First try to detect the file encoding
-        with open(cache_path, 'rb') as f:
-            raw_data: bytes = f.read()
-            result = chardet.detect(raw_data)
-            encoding: str = result['encoding'] or 'latin-1'  # Fallback to latin-1 if detection fails
-        
-        # Try to read the file with the detected encoding
-        try:
-            with open(cache_path, 'r', encoding=encoding) as f:
-                self.soup = BeautifulSoup(f.read(), 'html.parser')
-        except UnicodeDecodeError as e:
-            # If the detected encoding fails, try common encodings for French text
-            for fallback_encoding in ['latin-1', 'iso-8859-1', 'cp1252']:
-                try:
-                    with open(cache_path, 'r', encoding=fallback_encoding) as f:
-                        self.soup = BeautifulSoup(f.read(), 'html.parser')
+        if partial_parse is None:
+            partial_parse = os.getenv('LINGUEE_PARTIAL_PARSE', '1') not in ('0', 'false', 'no')
+        self.parse_only = self._EXACT_MATCHES_STRAINER if partial_parse else None
+
+    def fetch_page(self) -> str:
+        """
+        Load the locally stored page for the query, or fetch it through the HTTP cache if there is none.
+
+        Returns:
+            str: The Linguee page's HTML
+
+        Raises:
+            OfflineCacheMissError: If the page is neither stored locally nor in the offline HTTP cache
+        """
+        html = self._load_stored_page()
+        if html is None:
+            return super().fetch_page()
+        return html
+
+    def _load_stored_page(self) -> Optional[str]:
+        """Look the page up in the dictionary store, importing a hand-saved page under cache/ on first use"""
+        store = DictionaryStore.shared()
+        html = store.get("linguee", self.query, self.LANGUAGE_PAIR)
+        if html is None:
+            # TODO: Drop the hand-saved pages once rate limiting is resolved
+            for saved_page in DictionaryStore.saved_page_paths(Path("cache"), self.query):
+                if saved_page.exists() and store.import_file(saved_page):
+                    html = store.get("linguee", self.query, self.LANGUAGE_PAIR, count=False)
                     break
-                except UnicodeDecodeError:
-                    continue
-            else:
-                raise UnicodeDecodeError(
-                    f"Could not decode file with any of the attempted encodings: {encoding}, latin-1, iso-8859-1, cp1252"
-                ) from e
+        return html
+
+    async def fetch_page_async(self) -> str:
+        """Async version of fetch_page; the local store is read in a worker thread"""
+        html = await asyncio.to_thread(self._load_stored_page)
+        if html is None:
+            return await super().fetch_page_async()
+        return html
 
     def compose_query_url(self) -> str:
         """
@@ -64,7 +81,7 @@ class LingueeParser(RequestsParserBase):
         Returns:
             str: The complete URL for searching the word on Linguee
         """
-        return f'https://www.linguee.com/english-french/search?source=auto&query={self.query}'
+        return f'https://www.linguee.com/{self.LANGUAGE_PAIR}/search?source=auto&query={self.query}'
 
     def get_variant_elements(self) -> List[Tag]:
         """
@@ -97,9 +114,21 @@ class LingueeParser(RequestsParserBase):
         
         return examples
 
+    async def get_variants_async(self) -> List[Variant]:
+        """Async version of get_variants: the page is fetched without blocking the event loop and parsed in a worker thread"""
+        if self._soup is not None:
+            return self.get_variants()
+        html = await self.fetch_page_async()
+        return await asyncio.to_thread(self._get_variants_from_page, html)
+
     def get_variants(self) -> List[Variant]:
         """
         Gets all variants of the word from the lemma class.
+
+        The extracted variants are cached per page content and EXTRACTOR_VERSION, so
+        an unchanged page is not parsed again. Every fact the rest of the pipeline
+        needs is copied into plain fields on the variants, and the parsed page is
+        released afterwards so it can be freed.
         
         Returns:
             List[Variant]: A list of Variant objects (NounVariant or VerbVariant) containing variant information
@@ -107,71 +136,91 @@ class LingueeParser(RequestsParserBase):
         Note:
             Currently supports noun and verb variants only. Other word categories are skipped.
         """
+        if self._soup is not None:
+            # Already parsed, e.g. by load_async
+            return self._extract_variants()
+        return self._get_variants_from_page(self.fetch_page())
+
+    def _get_variants_from_page(self, html: str) -> List[Variant]:
+        """Serve the variants from the extraction cache, or parse the page and cache what is extracted"""
+        cache = ExtractionCache.shared()
+        page_hash = cache.page_hash(html)
+        records = cache.get("linguee", page_hash, self.EXTRACTOR_VERSION)
+        if records is not None:
+            return [self._variant_from_record(record) for record in records]
+
+        self.soup = HtmlParser.create_soup(html, parse_only=self.parse_only)
+        variants = self._extract_variants()
+        cache.put("linguee", page_hash, self.EXTRACTOR_VERSION, [self._variant_to_record(variant) for variant in variants])
+        return variants
+
+    @staticmethod
+    def _new_variant(category: WordCategory) -> Variant:
+        """Create the variant type matching a word category"""
+        match category:
+            case WordCategory.NOUN:
+                return NounVariant()
+            case WordCategory.VERB:
+                return VerbVariant()
+            case _:
+                return Variant()
+
+    @staticmethod
+    def _variant_to_record(variant: Variant) -> dict:
+        """The extracted facts of a variant, as stored in the extraction cache"""
+        return {
+            'word': variant.word,
+            'context': variant.context,
+            'category': variant.category.value,
+            'word_type_tags': variant.word_type_tags,
+            'english_definitions': variant.english_definitions,
+            'examples': variant.examples,
+        }
+
+    @classmethod
+    def _variant_from_record(cls, record: dict) -> Variant:
+        """Rebuild a freshly extracted variant from its extraction cache record"""
+        category = WordCategory(record['category'])
+        variant = cls._new_variant(category)
+        variant.category = category
+        variant.word = record['word']
+        variant.context = record['context']
+        variant.word_type_tags = record['word_type_tags']
+        if isinstance(variant, NounVariant):
+            variant.gender = cls.get_gender_from_tags(variant.word_type_tags)
+        variant.english_definitions = record['english_definitions']
+        variant.examples = record['examples']
+        return variant
+
+    def _extract_variants(self) -> List[Variant]:
+        """Walk the parsed page's exact matches once each and build a variant for each supported lemma"""
         variants: List[Variant] = []
-        variant_elements: List[Tag] = self.get_variant_elements()
 
-        for variant_element in variant_elements:
-            # Get the main word
-            word: Optional[str] = HtmlParser.get_text_content(variant_element, '.tag_lemma a.dictLink')
-            if not word:
+        for variant_element in self.get_variant_elements():
+            facts: LemmaFacts = LingueeLemmaExtractor.extract(variant_element)
+            if not facts.word:
                 continue
-                
-            # Check for context and append it if exists
-            context: Optional[str] = HtmlParser.get_text_content(variant_element, '.tag_lemma_context')
-            if context:
-                word = f"{word} {context}"
-                
-            category: Optional[WordCategory] = self.get_word_category(variant_element) 
+
+            category: Optional[WordCategory] = WordCategory.from_str(facts.word_type) if facts.word_type else None
             if not category:
                 continue
 
             # Create appropriate variant type based on category
-            variant: Optional[Variant]
-            match category:
-                case WordCategory.NOUN:
-                    variant = NounVariant()
-                case WordCategory.VERB:
-                    variant = VerbVariant()
-                case _:
-                    variant = Variant()
-
+            variant: Variant = self._new_variant(category)
             variant.category = category
-            variant.word = word
-            variant.element = variant_element  # Store the HTML element
+            # Append the context if exists
+            variant.word = f"{facts.word} {facts.context}" if facts.context else facts.word
+            variant.context = facts.context
+            variant.word_type_tags = facts.word_type_tags
+            if isinstance(variant, NounVariant):
+                variant.gender = self.get_gender_from_tags(variant.word_type_tags)
+            variant.english_definitions = facts.english_definitions
+            variant.examples = facts.examples
 
-            # Get all English definitions
-            translation_elements: List[Tag] = HtmlParser.find_elements(variant.element, '.tag_trans')
-            variant.english_definitions = []
-            
-            for elem in translation_elements:
-                dict_link: Optional[Tag] = elem.find('a', class_='dictLink')
-                if not dict_link:
-                    continue
-                    
-                # Get the main text content (excluding placeholder)
-                main_text: str = ""
-                for content in dict_link.contents:
-                    if isinstance(content, str):
-                        main_text += content.strip()
-                    elif not content.get('class') or 'placeholder' not in content.get('class'):
-                        main_text += content.get_text(strip=True)
-                
-                # Look for placeholder text
-                placeholder: Optional[Tag] = dict_link.find(class_='placeholder')
-                if placeholder:
-                    placeholder_text: str = placeholder.get_text(strip=True)
-                    definition: str = f"{main_text} {placeholder_text}"
-                else:
-                    definition: str = main_text
-                    
-                if definition:
-                    variant.english_definitions.append(definition)
-
-            # Get example sentences
-            variant.examples = self.get_examples(variant_element)
-            
             variants.append(variant)
-            
+
+        # Nothing refers to the tree anymore, drop it instead of keeping the whole page alive
+        self.release_soup()
         return variants
 
     def _process_word_type_tags(self, element: Tag) -> List[str]:
@@ -200,8 +249,19 @@ class LingueeParser(RequestsParserBase):
         Returns:
             Optional[WordGender]: The gender enum value if found and valid, None otherwise
         """
-        tags: List[str] = self._process_word_type_tags(variant_element)
-        
+        return self.get_gender_from_tags(self._process_word_type_tags(variant_element))
+
+    @staticmethod
+    def get_gender_from_tags(tags: List[str]) -> Optional[WordGender]:
+        """
+        Get the gender of a word from its processed word type tags.
+
+        Args:
+            tags: Word type tags as returned by _process_word_type_tags
+
+        Returns:
+            Optional[WordGender]: The gender enum value if found and valid, None otherwise
+        """
         # Look for gender tag anywhere in the list
         for tag in tags:
             match tag:
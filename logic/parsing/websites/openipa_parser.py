@@ -1,11 +1,36 @@
+import asyncio
+import os
+import weakref
+from typing import Dict, Iterable, List
+
+from dotenv import load_dotenv
+
 from logic.parsing.websites.playwright_parser_base import PlaywrightParserBase
+from logic.services.transcription_store import TranscriptionStore
+
+load_dotenv()
 
 
 class OpenIPAParser(PlaywrightParserBase):
     """Parser for OpenIPA website that provides IPA transcriptions for French words"""
 
+    SOURCE = "openipa"
+
     _INPUT_SELECTOR = '[class^="TextInput_input"]'
     _RESULT_SELECTOR = '[class^="ResultDisplay_display-ipa"]'
+    _RESULT_TIMEOUT_MS = 5000
+
+    # Resolves once the combined result text is non-empty and differs from the text before the input changed
+    _RESULT_CHANGED_SCRIPT = """
+        ([selector, previous]) => {
+            const text = Array.from(document.querySelectorAll(selector)).map(e => e.textContent || '').join('');
+            return text !== '' && text !== previous;
+        }
+    """
+
+    def __init__(self, query: str = ""):
+        super().__init__(query)
+        self._page_loaded = False
 
     def compose_query_url(self) -> str:
         """Return the URL to query based on self.query"""
@@ -16,29 +41,148 @@ class OpenIPAParser(PlaywrightParserBase):
         await super()._setup_page()
         # Wait for the input field to be ready
         await self._page.wait_for_selector(self._INPUT_SELECTOR)
+        self._page_loaded = True
+
+    async def _read_result(self) -> str:
+        """Combine the text of all result elements"""
+        result_elements = await self._page.query_selector_all(self._RESULT_SELECTOR)
+        texts = [await element.text_content() for element in result_elements]
+        return "".join(text for text in texts if text)
+
+    async def _transcribe_on_page(self, word: str) -> str | None:
+        """
+        Type a word into the already loaded page and wait for the result to change.
+
+        Raises:
+            TimeoutError: If the result did not change in time. A homophone of the previous
+                word leaves it unchanged too, so the caller retries on a freshly loaded page.
+        """
+        previous = await self._read_result()
+        await self._page.fill(self._INPUT_SELECTOR, word)
+        try:
+            await self._page.wait_for_function(
+                self._RESULT_CHANGED_SCRIPT, arg=[self._RESULT_SELECTOR, previous], timeout=self._RESULT_TIMEOUT_MS)
+        except Exception as e:
+            raise TimeoutError(f"OpenIPA result did not change within {self._RESULT_TIMEOUT_MS} ms") from e
+        return await self._read_result() or None
+
+    async def _transcribe(self, word: str) -> str | None:
+        """Transcribe a word, reloading the page and retrying once if the result did not change"""
+        if not self._page_loaded:
+            await self._setup_page()
+        try:
+            return await self._transcribe_on_page(word)
+        except TimeoutError:
+            # An empty result on the reloaded page rules out a homophone of the previous word
+            await self._setup_page()
+            return await self._transcribe_on_page(word)
+
+    async def get_transcriptions(self, words: Iterable[str]) -> Dict[str, str | None]:
+        """
+        Transcribe many words on one page, loading OpenIPA only once.
+
+        Stored transcriptions are served from the TranscriptionStore, the others are
+        typed into the page one after another and stored once transcribed.
+
+        Args:
+            words: The words to transcribe
+
+        Returns:
+            Dict[str, str | None]: Each word mapped to its transcription, None if it failed
+        """
+        store = TranscriptionStore.shared()
+        words = list(dict.fromkeys(words))
+        transcriptions: Dict[str, str | None] = store.get_many(self.SOURCE, words)
+
+        for word in words:
+            if word in transcriptions:
+                continue
+            try:
+                transcription = await self._transcribe(word)
+            except Exception as e:
+                print(f"Warning: Failed to get transcription for '{word}': {e}")
+                transcription = None
+            if transcription:
+                store.put(self.SOURCE, word, transcription)
+            transcriptions[word] = transcription
+        return transcriptions
 
     async def get_transcription(self) -> str | None:
         """Gets the IPA transcription for the word by combining all matching result elements"""
+        return (await self.get_transcriptions([self.query]))[self.query]
+
+
+class OpenIPABatcher:
+    """
+    Collects transcription requests from concurrent callers and feeds them to one OpenIPA page.
+
+    The page stays loaded while words keep arriving and is only released after
+    being idle for a short while, so a whole deck pays the page load once
+    instead of once per variant.
+    """
+
+    _instances: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, OpenIPABatcher]" = weakref.WeakKeyDictionary()
+
+    def __init__(self, idle_timeout: float | None = None):
+        """
+        Args:
+            idle_timeout: Seconds the page is kept loaded without new words, defaults to $OPENIPA_IDLE_TIMEOUT or 2
+        """
+        self.idle_timeout = idle_timeout if idle_timeout is not None else float(os.getenv('OPENIPA_IDLE_TIMEOUT', '2'))
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._arrived = asyncio.Event()
+        self._worker: asyncio.Task | None = None
+
+    @classmethod
+    def shared(cls) -> 'OpenIPABatcher':
+        """Return the batcher belonging to the running event loop, creating it if needed"""
+        loop = asyncio.get_running_loop()
+        batcher = cls._instances.get(loop)
+        if batcher is None:
+            batcher = cls()
+            cls._instances[loop] = batcher
+        return batcher
+
+    async def transcribe(self, word: str) -> str | None:
+        """Transcribe a word, batched together with the words other callers request meanwhile"""
+        if (stored := TranscriptionStore.shared().get(OpenIPAParser.SOURCE, word)) is not None:
+            return stored
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(word, []).append(future)
+        self._arrived.set()
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+        return await future
+
+    async def _run(self) -> None:
+        """Transcribe pending words on one page until no new words arrive within idle_timeout"""
+        batch: Dict[str, List[asyncio.Future]] = {}
         try:
-            await self._setup_page()
-            
-            # Type the query into the input field
-            await self._page.fill(self._INPUT_SELECTOR, self.query)
-            
-            # Wait for the result to appear with a timeout
-            await self._page.wait_for_selector(self._RESULT_SELECTOR, timeout=5000)
-            
-            # Get all result elements and combine their text content
-            result_elements = await self._page.query_selector_all(self._RESULT_SELECTOR)
-            if result_elements:
-                transcription = ""
-                for element in result_elements:
-                    text = await element.text_content()
-                    if text:
-                        transcription += text
-                return transcription if transcription else None
-                
-            return None
+            async with OpenIPAParser() as parser:
+                while True:
+                    if not self._pending:
+                        self._arrived.clear()
+                        try:
+                            await asyncio.wait_for(self._arrived.wait(), self.idle_timeout)
+                        except asyncio.TimeoutError:
+                            break
+                    batch, self._pending = self._pending, {}
+                    results = await parser.get_transcriptions(batch)
+                    for word, futures in batch.items():
+                        for future in futures:
+                            if not future.done():
+                                future.set_result(results.get(word))
         except Exception as e:
-            print(f"Warning: Failed to get transcription for '{self.query}': {e}")
-            return None 
\ No newline at end of file
+            print(f"Warning: OpenIPA batch failed: {e}")
+            # Fail the batch being transcribed as well as the words that arrived meanwhile
+            pending, self._pending = self._pending, {}
+            for futures in (*batch.values(), *pending.values()):
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+        finally:
+            self._worker = None
+            # Words that arrived while the page was being released start a new session
+            if self._pending:
+                self._worker = asyncio.create_task(self._run())
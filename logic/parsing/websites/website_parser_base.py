@@ -1,8 +1,10 @@
 import abc
 
-import requests
 from bs4 import BeautifulSoup
 
+from logic.parsing.html_parser import HtmlParser
+from logic.parsing.http_session import HttpSession
+
 
 class RequestsParserBase(metaclass=abc.ABCMeta):
     """Base class for website parsers that use requests + BeautifulSoup"""
@@ -20,5 +22,5 @@ class RequestsParserBase(metaclass=abc.ABCMeta):
 
     def query_dictionary(self)->BeautifulSoup:
         url = self.compose_query_url()
-        response = requests.get(url)
-        return BeautifulSoup(response.text, "html.parser")
\ No newline at end of file
+        response = HttpSession.shared().get(url)
+        return HtmlParser.create_soup(response.text)
\ No newline at end of file
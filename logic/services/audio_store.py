@@ -0,0 +1,261 @@
+import argparse
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, NamedTuple
+from urllib.parse import urlparse
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class AudioStoreReport(NamedTuple):
+    """Outcome of a gc() or verify() run"""
+    checked: int
+    removed_files: int
+    removed_entries: int
+
+
+class AudioStore:
+    """
+    Content-addressed store for downloaded pronunciations.
+
+    Files are named after the SHA-256 of their content and sharded into
+    objects/ab/cd/ directories, so the same recording reached from different
+    queries is stored once and no directory grows unboundedly. An SQLite index
+    maps each recording (its format and path on the Forvo audio server) to the
+    content hash, giving O(1) lookups without touching the file system.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS recordings (
+            recording_key TEXT PRIMARY KEY,
+            content_hash TEXT NOT NULL,
+            source_url TEXT NOT NULL,
+            added_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS files (
+            content_hash TEXT PRIMARY KEY,
+            path TEXT NOT NULL,
+            size INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS recordings_content_hash ON recordings (content_hash);
+    """
+    _HASH_CHUNK_SIZE = 1024 * 1024
+    _PART_FILE_GRACE_PERIOD = 60 * 60
+
+    _shared: 'AudioStore | None' = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, directory: str | os.PathLike | None = None):
+        """
+        Open (or create) a store.
+
+        Args:
+            directory: Root of the store, defaults to $AUDIO_STORE_DIR or audio_downloads
+        """
+        self.directory = Path(directory or os.getenv('AUDIO_STORE_DIR', 'audio_downloads'))
+        self.objects_directory = self.directory / 'objects'
+        self.objects_directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.directory / 'index.sqlite3', check_same_thread=False)
+        self._connection.executescript(self._SCHEMA)
+        self._migrate_paths()
+
+    def _migrate_paths(self) -> None:
+        """Rewrite paths stored relative to the working directory by earlier versions to paths inside the store"""
+        with self._lock, self._connection:
+            rows = self._connection.execute(
+                "SELECT content_hash, path FROM files WHERE path NOT LIKE 'objects/%'").fetchall()
+            for content_hash, path in rows:
+                self._connection.execute(
+                    "UPDATE files SET path = ? WHERE content_hash = ?",
+                    (self._relative_path(content_hash, Path(path).suffix), content_hash))
+
+    @classmethod
+    def shared(cls) -> 'AudioStore':
+        """Return the process-wide store configured from the environment"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def recording_key(url: str) -> str:
+        """
+        Identify a recording independently of the audio server it was served from.
+
+        e.g. https://audio12.forvo.com/audios/mp3/8/w/8w_9302600_49_503493.mp3 -> mp3/8/w/8w_9302600_49_503493.mp3
+        """
+        path = urlparse(url).path
+        _, _, key = path.partition('/audios/')
+        return key or path.lstrip('/')
+
+    @staticmethod
+    def _relative_path(content_hash: str, extension: str) -> str:
+        """Where a file is kept, relative to the store directory; this is what the index stores"""
+        return f"objects/{content_hash[:2]}/{content_hash[2:4]}/{content_hash}{extension}"
+
+    def _resolve(self, relative_path: str) -> Path:
+        """The location of an indexed file, independent of the working directory"""
+        return self.directory / relative_path
+
+    def get(self, url: str) -> str | None:
+        """
+        Look up a recording.
+
+        Args:
+            url: The recording's URL
+
+        Returns:
+            str | None: Local path of the stored file, or None if the recording is not stored
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT files.path FROM recordings JOIN files USING (content_hash) WHERE recording_key = ?",
+                (self.recording_key(url),)).fetchone()
+        return str(self._resolve(row[0])) if row else None
+
+    def put(self, url: str, content: bytes) -> str:
+        """
+        Store a downloaded recording, reusing an existing file with identical content.
+
+        Args:
+            url: The URL the content was downloaded from
+            content: The audio file's bytes
+
+        Returns:
+            str: Local path of the stored file
+        """
+        content_hash = hashlib.sha256(content).hexdigest()
+        extension = os.path.splitext(urlparse(url).path)[1].lower()
+        relative_path = self._relative_path(content_hash, extension)
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT path FROM files WHERE content_hash = ?", (content_hash,)).fetchone()
+            if row and self._resolve(row[0]).exists():
+                relative_path = row[0]
+            else:
+                self._write_atomically(self._resolve(relative_path), content)
+
+            with self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO files (content_hash, path, size) VALUES (?, ?, ?)",
+                    (content_hash, relative_path, len(content)))
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO recordings (recording_key, content_hash, source_url, added_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (self.recording_key(url), content_hash, url, time.time()))
+        return str(self._resolve(relative_path))
+
+    @staticmethod
+    def _write_atomically(path: Path, content: bytes) -> None:
+        """Write through a temp file so readers never see a partially written file"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".part")
+        try:
+            with os.fdopen(file_descriptor, 'wb') as f:
+                f.write(content)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def _hash_file(self, path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            while chunk := f.read(self._HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def gc(self) -> AudioStoreReport:
+        """
+        Remove files no recording refers to, index entries whose file is gone, and leftover temp files.
+
+        Returns:
+            AudioStoreReport: What was checked and removed
+        """
+        with self._lock, self._connection:
+            removed_entries = self._connection.execute(
+                "DELETE FROM files WHERE content_hash NOT IN (SELECT content_hash FROM recordings)").rowcount
+
+            # Compared as resolved paths, so the store's location and the working directory do not matter
+            known_paths: Dict[Path, str] = {
+                self._resolve(path).resolve(): content_hash
+                for content_hash, path in self._connection.execute("SELECT content_hash, path FROM files")
+            }
+            for path, content_hash in known_paths.items():
+                if not path.exists():
+                    self._connection.execute("DELETE FROM files WHERE content_hash = ?", (content_hash,))
+                    removed_entries += self._connection.execute(
+                        "DELETE FROM recordings WHERE content_hash = ?", (content_hash,)).rowcount
+
+            checked = removed_files = 0
+            for path in self.objects_directory.rglob('*'):
+                if not path.is_file():
+                    continue
+                checked += 1
+                # A recent temp file may belong to a download that is still being written
+                if path.suffix == '.part' and time.time() - path.stat().st_mtime < self._PART_FILE_GRACE_PERIOD:
+                    continue
+                if path.resolve() not in known_paths:
+                    path.unlink()
+                    removed_files += 1
+        return AudioStoreReport(checked, removed_files, removed_entries)
+
+    def verify(self) -> AudioStoreReport:
+        """
+        Re-hash every stored file and drop those whose content no longer matches their hash.
+
+        Returns:
+            AudioStoreReport: What was checked and removed
+        """
+        with self._lock:
+            files = self._connection.execute("SELECT content_hash, path FROM files").fetchall()
+
+        corrupt = []
+        for content_hash, path in files:
+            try:
+                if self._hash_file(self._resolve(path)) != content_hash:
+                    corrupt.append((content_hash, path))
+            except OSError:
+                corrupt.append((content_hash, path))
+
+        removed_entries = 0
+        with self._lock, self._connection:
+            for content_hash, path in corrupt:
+                print(f"Warning: Removing corrupt or missing audio file {self._resolve(path)}")
+                self._resolve(path).unlink(missing_ok=True)
+                self._connection.execute("DELETE FROM files WHERE content_hash = ?", (content_hash,))
+                removed_entries += self._connection.execute(
+                    "DELETE FROM recordings WHERE content_hash = ?", (content_hash,)).rowcount
+        return AudioStoreReport(len(files), len(corrupt), removed_entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of recordings, distinct files and total stored bytes"""
+        with self._lock:
+            recordings = self._connection.execute("SELECT COUNT(*) FROM recordings").fetchone()[0]
+            files, size = self._connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM files").fetchone()
+        return {'recordings': recordings, 'files': files, 'bytes': size}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Maintain the pronunciation audio store")
+    parser.add_argument('command', choices=['gc', 'verify', 'stats'])
+    parser.add_argument('--directory', help="Store directory, defaults to $AUDIO_STORE_DIR or audio_downloads")
+    args = parser.parse_args()
+
+    store = AudioStore(args.directory)
+    match args.command:
+        case 'gc':
+            print(store.gc())
+        case 'verify':
+            print(store.verify())
+        case 'stats':
+            print(store.stats())
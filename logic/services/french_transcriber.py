@@ -0,0 +1,278 @@
+import argparse
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+_VOWELS = "aeiouyàâäéèêëîïôöùûüœæ"
+_CONSONANTS = "bcçdfghjklmnpqrstvwxz"
+
+# Context shorthands usable in the rule table: V a vowel, C a consonant,
+# N what may follow a nasal vowel (anything but a vowel, n, m or h, or the end of the word)
+_CONTEXT_MACROS = {
+    "V": f"[{_VOWELS}]",
+    "C": f"[{_CONSONANTS}]",
+    "N": f"(?:[^{_VOWELS}nmh]|$)",
+}
+
+# (graphemes, left context, right context, phonemes); the contexts are regular expressions
+# using the shorthands above, matched against the text before and after the graphemes.
+# At each position the longest matching graphemes win, ties go to the earlier rule.
+_RULES: List[Tuple[str, str, str, str]] = [
+    # Vowel digraphs and trigraphs
+    ("eaux", "", "$", "o"),
+    ("eau", "", "", "o"),
+    ("au", "", "", "o"),
+    ("aient", "", "$", "ɛ"),
+    ("iement", "", "$", "imɑ̃"),
+    ("aill", "", "", "aj"),
+    ("ail", "", "$", "aj"),
+    ("ain", "", "N", "ɛ̃"),
+    ("aim", "", "N", "ɛ̃"),
+    ("ai", "", "", "ɛ"),
+    ("aî", "", "", "ɛ"),
+    ("ay", "", "V", "ɛj"),
+    ("ay", "", "", "ɛ"),
+    ("eill", "", "", "ɛj"),
+    ("eil", "", "", "ɛj"),
+    ("ein", "", "N", "ɛ̃"),
+    ("ei", "", "", "ɛ"),
+    ("euil", "", "", "œj"),
+    ("ueil", "[cg]", "", "œj"),
+    ("eu", "", "[rlfbvpn]", "œ"),
+    ("eu", "", "", "ø"),
+    ("œil", "", "", "œj"),
+    ("œu", "", "r", "œ"),
+    ("œu", "", "", "ø"),
+    ("oin", "", "N", "wɛ̃"),
+    ("oi", "", "", "wa"),
+    ("oî", "", "", "wa"),
+    ("oy", "", "V", "waj"),
+    ("ouill", "", "", "uj"),
+    ("ou", "", "V", "w"),
+    ("ou", "", "", "u"),
+    ("où", "", "", "u"),
+    ("oû", "", "", "u"),
+    ("ill", "C", "", "ij"),
+    # Nasal vowels
+    ("ien", "", "N", "jɛ̃"),
+    ("an", "", "N", "ɑ̃"),
+    ("am", "", "N", "ɑ̃"),
+    ("en", "", "N", "ɑ̃"),
+    ("em", "", "N", "ɑ̃"),
+    ("in", "", "N", "ɛ̃"),
+    ("im", "", "N", "ɛ̃"),
+    ("yn", "", "N", "ɛ̃"),
+    ("ym", "", "N", "ɛ̃"),
+    ("on", "", "N", "ɔ̃"),
+    ("om", "", "N", "ɔ̃"),
+    ("un", "", "N", "œ̃"),
+    ("um", "", "N", "œ̃"),
+    # Word-final e patterns; "V.*" on the left means there is an earlier vowel, i.e. the word is not a monosyllable
+    ("er", "V.*", "$", "e"),
+    ("ez", "", "$", "e"),
+    ("et", "V.*", "$", "ɛ"),
+    ("ed", "", "s?$", "e"),
+    ("es", "V.*", "$", ""),
+    ("e", "V.*", "$", ""),
+    # Other e: silent after a vowel, open before two consonants (except a consonant + l/r cluster), schwa otherwise
+    ("e", "(?<![qg])V", "C", ""),
+    ("e", "", "x", "ɛ"),
+    ("e", "", "[lcf]$", "ɛ"),
+    ("e", "", "(?!(?:[bcdfgkptv][lr]|ch|ph|th|gn))CC", "ɛ"),
+    ("e", "", "", "ə"),
+    # Single vowels
+    ("é", "", "", "e"),
+    ("è", "", "", "ɛ"),
+    ("ê", "", "", "ɛ"),
+    ("ë", "", "", "ɛ"),
+    ("a", "", "", "a"),
+    ("à", "", "", "a"),
+    ("â", "", "", "a"),
+    ("i", "", "V", "j"),
+    ("i", "", "", "i"),
+    ("î", "", "", "i"),
+    ("ï", "", "", "i"),
+    ("y", "^", "V", "j"),
+    ("y", "", "", "i"),
+    ("o", "", "(?:[stdpxz]s?|se)$", "o"),
+    ("o", "", "C", "ɔ"),
+    ("o", "", "", "o"),
+    ("ô", "", "", "o"),
+    ("u", "(?:^|[^qg])", "[aeiéèêo]", "ɥ"),
+    ("u", "", "", "y"),
+    ("û", "", "", "y"),
+    ("ù", "", "", "y"),
+    # Consonants
+    ("qu", "", "", "k"),
+    ("q", "", "", "k"),
+    ("gu", "", "[eiyéèêë]", "g"),
+    ("gn", "", "", "ɲ"),
+    ("ge", "", "[aoâôu]", "ʒ"),
+    ("gg", "", "", "g"),
+    ("g", "", "[eiyéèêë]", "ʒ"),
+    ("g", "n", "s?$", ""),
+    ("g", "", "", "g"),
+    ("ch", "", "", "ʃ"),
+    ("ph", "", "", "f"),
+    ("th", "", "", "t"),
+    ("h", "", "", ""),
+    ("cc", "", "[eiyéèê]", "ks"),
+    ("cc", "", "", "k"),
+    ("ck", "", "", "k"),
+    ("c", "", "[eiyéèêë]", "s"),
+    ("c", "n", "s?$", ""),
+    ("c", "", "", "k"),
+    ("ç", "", "", "s"),
+    ("ss", "", "", "s"),
+    ("s", "V", "V", "z"),
+    ("s", "", "$", ""),
+    ("s", "", "", "s"),
+    ("x", "^e", "V", "gz"),
+    ("x", "", "$", ""),
+    ("x", "", "", "ks"),
+    ("ti", "[^s]", "on", "sj"),
+    ("tt", "", "", "t"),
+    ("t", "", "s?$", ""),
+    ("t", "", "", "t"),
+    ("dd", "", "", "d"),
+    ("d", "", "s?$", ""),
+    ("d", "", "", "d"),
+    ("pp", "", "", "p"),
+    ("p", "", "s?$", ""),
+    ("p", "m", "t", ""),
+    ("p", "", "", "p"),
+    ("z", "", "$", ""),
+    ("z", "", "", "z"),
+    ("rr", "", "", "ʁ"),
+    ("r", "", "", "ʁ"),
+    ("ll", "", "", "l"),
+    ("l", "", "", "l"),
+    ("mm", "", "", "m"),
+    ("m", "", "", "m"),
+    ("nn", "", "", "n"),
+    ("n", "", "", "n"),
+    ("bb", "", "", "b"),
+    ("b", "", "", "b"),
+    ("ff", "", "", "f"),
+    ("f", "", "", "f"),
+    ("v", "", "", "v"),
+    ("w", "", "", "w"),
+    ("k", "", "", "k"),
+    ("j", "", "", "ʒ"),
+]
+
+# Words the rules get wrong: function words, pronounced final consonants, loanwords and irregular spellings
+_EXCEPTIONS: Dict[str, str] = {
+    "le": "lə", "de": "də", "je": "ʒə", "me": "mə", "te": "tə", "se": "sə", "ne": "nə", "ce": "sə", "que": "kə",
+    "les": "le", "des": "de", "mes": "me", "tes": "te", "ses": "se", "ces": "se", "et": "e", "est": "ɛ",
+    "es": "ɛ", "eu": "y", "eus": "y", "eut": "y", "un": "œ̃", "une": "yn", "os": "ɔs", "plus": "plys",
+    "fils": "fis", "sens": "sɑ̃s", "bus": "bys", "tennis": "tenis", "gens": "ʒɑ̃", "pays": "pei",
+    "mer": "mɛʁ", "fer": "fɛʁ", "ver": "vɛʁ", "cher": "ʃɛʁ", "chère": "ʃɛʁ", "hier": "jɛʁ", "fier": "fjɛʁ",
+    "hiver": "ivɛʁ", "enfer": "ɑ̃fɛʁ", "amer": "amɛʁ", "super": "sypɛʁ", "cancer": "kɑ̃sɛʁ",
+    "femme": "fam", "monsieur": "məsjø", "messieurs": "mesjø", "second": "səgɔ̃", "seconde": "səgɔ̃d",
+    "oignon": "ɔɲɔ̃", "août": "ut", "ville": "vil", "mille": "mil", "tranquille": "tʁɑ̃kil",
+    "sept": "sɛt", "six": "sis", "dix": "dis", "huit": "ɥit", "vingt": "vɛ̃", "cinq": "sɛ̃k",
+    "avec": "avɛk", "donc": "dɔ̃k", "ouest": "wɛst", "est-ce": "ɛs", "clef": "kle", "yeux": "jø",
+    "ennui": "ɑ̃nɥi", "emmener": "ɑ̃mne", "ennuyer": "ɑ̃nɥije", "album": "albɔm", "club": "klœb",
+    "aujourd'hui": "oʒuʁdɥi", "ours": "uʁs", "mœurs": "mœʁs", "tous": "tus", "faisons": "fəzɔ̃",
+    "fait": "fɛ", "sud": "syd", "net": "nɛt", "jamais": "ʒamɛ", "temps": "tɑ̃", "corps": "kɔʁ",
+}
+
+
+class FrenchTranscriber:
+    """
+    Offline rule-based French grapheme-to-phoneme transcriber.
+
+    Words are looked up in an exceptions dictionary first, and otherwise
+    rewritten left to right with the longest matching rule of a context-sensitive
+    rule table. Rules are indexed by their first letter so each position only
+    tries the handful of rules that can apply, and transcriptions are memoized
+    per token, which makes whole word lists cheap.
+    """
+
+    _shared: 'FrenchTranscriber | None' = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, exceptions: Dict[str, str] | None = None):
+        """
+        Args:
+            exceptions: Extra word -> IPA entries, merged over the built-in exceptions
+        """
+        self.exceptions = {**_EXCEPTIONS, **(exceptions or {})}
+        self._rules_by_letter: Dict[str, List[Tuple[str, re.Pattern | None, re.Pattern | None, str]]] = {}
+        for _, (graphemes, left, right, phonemes) in sorted(
+                enumerate(_RULES), key=lambda rule: (-len(rule[1][0]), rule[0])):
+            self._rules_by_letter.setdefault(graphemes[0], []).append((
+                graphemes,
+                re.compile(f"(?:{self._expand(left)})$") if left else None,
+                re.compile(self._expand(right)) if right else None,
+                phonemes,
+            ))
+        self._transcribe_token = lru_cache(maxsize=65536)(self._transcribe_token_uncached)
+
+    @classmethod
+    def shared(cls) -> 'FrenchTranscriber':
+        """Return the process-wide transcriber"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def _expand(context: str) -> str:
+        for macro, expansion in _CONTEXT_MACROS.items():
+            context = context.replace(macro, expansion)
+        return context
+
+    def _transcribe_token_uncached(self, token: str) -> str:
+        """Transcribe a single lowercase word without spaces"""
+        if token in self.exceptions:
+            return self.exceptions[token]
+        # Elided words ("l'homme", "s'asseoir") are transcribed piecewise and joined
+        if "'" in token:
+            return "".join(self._transcribe_token(part) for part in token.split("'") if part)
+
+        phonemes = []
+        position = 0
+        while position < len(token):
+            for graphemes, left, right, output in self._rules_by_letter.get(token[position], ()):
+                end = position + len(graphemes)
+                if (token.startswith(graphemes, position)
+                        and (left is None or left.search(token, 0, position))
+                        and (right is None or right.match(token, end))):
+                    phonemes.append(output)
+                    position = end
+                    break
+            else:
+                # Characters no rule knows (digits, punctuation) are dropped
+                position += 1
+        return "".join(phonemes)
+
+    def transcribe(self, text: str) -> str | None:
+        """
+        Transcribe a word or expression to IPA.
+
+        Args:
+            text: The word, e.g. "se lever" or "livrer (qqn./qqch.)"; parenthesized context is ignored
+
+        Returns:
+            str | None: The IPA transcription, or None if the text contains no letters
+        """
+        text = re.sub(r"\(.*?\)", " ", text.lower()).replace("’", "'")
+        tokens = [token for token in re.split(r"[\s\-]+", text) if token]
+        transcription = " ".join(filter(None, (self._transcribe_token(token) for token in tokens)))
+        return transcription or None
+
+    def transcribe_many(self, words: Iterable[str]) -> List[str | None]:
+        """Transcribe a whole word list, in order"""
+        return [self.transcribe(word) for word in words]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Transcribe French words to IPA without the network")
+    parser.add_argument('words', nargs='+')
+    args = parser.parse_args()
+
+    for word, transcription in zip(args.words, FrenchTranscriber.shared().transcribe_many(args.words)):
+        print(f"{word}\t{transcription}")
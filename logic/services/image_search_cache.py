@@ -0,0 +1,132 @@
+import hashlib
+import json
+import mimetypes
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import List, NamedTuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class ImageResult(NamedTuple):
+    """One image search hit"""
+    link: str
+    thumbnail: str | None
+
+
+class ImageSearchCache:
+    """
+    Persistent cache of image search results and downloaded thumbnails.
+
+    Results are keyed by the normalized query and the number of requested
+    results, and expire after a TTL. Thumbnails are stored content-addressed,
+    so the same picture found through different queries is kept once.
+    """
+
+    _DAY = 24 * 60 * 60
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS searches (
+            query TEXT NOT NULL,
+            num_results INTEGER NOT NULL,
+            results TEXT NOT NULL,
+            fetched_at REAL NOT NULL,
+            PRIMARY KEY (query, num_results)
+        );
+        CREATE TABLE IF NOT EXISTS thumbnails (
+            url TEXT PRIMARY KEY,
+            path TEXT NOT NULL
+        );
+    """
+
+    _shared: 'ImageSearchCache | None' = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: str | os.PathLike | None = None, ttl: float | None = None,
+                 thumbnail_directory: str | os.PathLike | None = None):
+        """
+        Open (or create) a cache.
+
+        Args:
+            path: SQLite file to use, defaults to $IMAGE_SEARCH_CACHE_DB or cache/image_search.sqlite3
+            ttl: Seconds a search result stays valid, defaults to $IMAGE_SEARCH_TTL_DAYS (90 days)
+            thumbnail_directory: Where thumbnails are stored, defaults to $IMAGE_THUMBNAIL_DIR or image_downloads
+        """
+        self.path = Path(path or os.getenv('IMAGE_SEARCH_CACHE_DB', 'cache/image_search.sqlite3'))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl if ttl is not None else float(os.getenv('IMAGE_SEARCH_TTL_DAYS', '90')) * self._DAY
+        self.thumbnail_directory = Path(thumbnail_directory or os.getenv('IMAGE_THUMBNAIL_DIR', 'image_downloads'))
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.executescript(self._SCHEMA)
+
+    @classmethod
+    def shared(cls) -> 'ImageSearchCache':
+        """Return the process-wide cache configured from the environment"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Normalize Unicode, case and whitespace so equivalent queries share an entry"""
+        return " ".join(unicodedata.normalize('NFC', query).casefold().split())
+
+    def get(self, query: str, num_results: int) -> List[ImageResult] | None:
+        """
+        Look up a search.
+
+        Returns:
+            List[ImageResult] | None: The cached results (possibly empty), or None if missing or expired
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT results, fetched_at FROM searches WHERE query = ? AND num_results = ?",
+                (self.normalize_query(query), num_results)).fetchone()
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        return [ImageResult(*result) for result in json.loads(row[0])]
+
+    def put(self, query: str, num_results: int, results: List[ImageResult]) -> None:
+        """Store the results of a search, including empty ones so they are not repeated either"""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO searches (query, num_results, results, fetched_at) VALUES (?, ?, ?, ?)",
+                (self.normalize_query(query), num_results, json.dumps(results, ensure_ascii=False), time.time()))
+
+    def get_thumbnail(self, url: str) -> str | None:
+        """Return the local path of a downloaded thumbnail, or None if it was not downloaded yet"""
+        with self._lock:
+            row = self._connection.execute("SELECT path FROM thumbnails WHERE url = ?", (url,)).fetchone()
+        return row[0] if row and os.path.exists(row[0]) else None
+
+    def put_thumbnail(self, url: str, content: bytes, content_type: str | None) -> str:
+        """
+        Store a downloaded thumbnail, reusing an existing file with identical content.
+
+        Returns:
+            str: Local path of the stored file
+        """
+        content_hash = hashlib.sha256(content).hexdigest()
+        extension = mimetypes.guess_extension((content_type or '').split(';')[0].strip()) or '.jpg'
+        path = self.thumbnail_directory / content_hash[:2] / f"{content_hash}{extension}"
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write through a temp file so readers never see a partially written file
+            file_descriptor, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".part")
+            with os.fdopen(file_descriptor, 'wb') as f:
+                f.write(content)
+            os.replace(temp_path, path)
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO thumbnails (url, path) VALUES (?, ?)", (url, str(path)))
+        return str(path)
@@ -1,36 +1,181 @@
 from typing import Optional, List
+import asyncio
 import os
+import threading
 from googleapiclient.discovery import build
 from dotenv import load_dotenv
 
+from logic.parsing.http_session import HttpSession
+from logic.parsing.site_limiter import SiteLimiter
+from logic.services.image_search_cache import ImageResult, ImageSearchCache
+from logic.services.quota_limiter import QuotaLimiter
+from logic.single_flight import SingleFlight
+
 load_dotenv()
 
 class ImageSearchService:
-    def __init__(self):
+    _API_URL = "https://www.googleapis.com/customsearch/v1"
+
+    _shared: 'ImageSearchService | None' = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, cache: ImageSearchCache | None = None, quota: QuotaLimiter | None = None,
+                 download_thumbnails: bool | None = None):
+        """
+        Args:
+            cache: Search result cache, defaults to the shared ImageSearchCache
+            quota: Limiter for Custom Search calls, defaults to $GOOGLE_CSE_DAILY_QUOTA calls per day
+                spaced by $GOOGLE_CSE_MIN_INTERVAL seconds
+            download_thumbnails: Return local thumbnail files instead of image URLs,
+                defaults to $IMAGE_THUMBNAILS
+        """
         self.api_key = os.getenv('GOOGLE_API_KEY')
         self.cse_id = os.getenv('GOOGLE_CSE_ID')
         if not self.api_key or not self.cse_id:
             raise ValueError("Google API credentials not found in environment variables")
-        
+
         self.service = build("customsearch", "v1", developerKey=self.api_key)
+        self.cache = cache or ImageSearchCache.shared()
+        self.quota = quota or QuotaLimiter(
+            "google_cse",
+            daily_quota=int(os.getenv('GOOGLE_CSE_DAILY_QUOTA', '100')),
+            min_interval=float(os.getenv('GOOGLE_CSE_MIN_INTERVAL', '0.6')),
+        )
+        if download_thumbnails is None:
+            download_thumbnails = os.getenv('IMAGE_THUMBNAILS', '') in ('1', 'true', 'yes')
+        self.download_thumbnails = download_thumbnails
+
+    @classmethod
+    def shared(cls) -> 'ImageSearchService':
+        """Return the process-wide service, so the discovery document is only built once"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def _parse_items(result: dict) -> List[ImageResult]:
+        return [ImageResult(item['link'], item.get('image', {}).get('thumbnailLink'))
+                for item in result.get('items', [])]
 
     def search_image(self, query: str, num_results: int = 5) -> List[str]:
         """
         Search for images using Google Custom Search API
-        Returns a list of image URLs, or empty list if no results found
+        Returns a list of image URLs (or local thumbnail paths), or empty list if no results found
         """
         try:
-            result = self.service.cse().list(
-                q=query,
-                cx=self.cse_id,
-                searchType='image',
-                num=num_results
-            ).execute()
-
-            if 'items' in result:
-                return [item['link'] for item in result['items']]
+            results = self._search_deduplicated(query, num_results)
+            return self._to_images(results) if self.download_thumbnails else [result.link for result in results]
+
+        except Exception as e:
+            print(f"Error searching for images: {e}")
             return []
-            
+
+    def _search_deduplicated(self, query: str, num_results: int) -> List[ImageResult]:
+        """Serve a search from the cache, or join an identical search already in flight, or run it"""
+        if (cached := self.cache.get(query, num_results)) is not None:
+            return cached
+        return SingleFlight.shared().run_sync(
+            "images", (self.cache.normalize_query(query), num_results), lambda: self._search(query, num_results))
+
+    def _search(self, query: str, num_results: int) -> List[ImageResult]:
+        """Call the Custom Search API and cache the results"""
+        self.quota.acquire()
+        result = self.service.cse().list(
+            q=query,
+            cx=self.cse_id,
+            searchType='image',
+            num=num_results
+        ).execute()
+        results = self._parse_items(result)
+        self.cache.put(query, num_results, results)
+        return results
+
+    def _to_images(self, results: List[ImageResult]) -> List[str]:
+        """Download the results' thumbnails, falling back to the full image URL for any that fail"""
+        images = []
+        for result in results:
+            path = None
+            if result.thumbnail:
+                path = self.cache.get_thumbnail(result.thumbnail) or SingleFlight.shared().run_sync(
+                    "thumbnail", result.thumbnail, lambda: self._download_thumbnail(result.thumbnail))
+            image = path or result.link
+            # Different results may share the same picture
+            if image not in images:
+                images.append(image)
+        return images
+
+    def _download_thumbnail(self, url: str) -> str | None:
+        """Download a thumbnail into the cache, return its local path if successful"""
+        try:
+            with SiteLimiter.limit(url):
+                response = HttpSession.shared().get(url, timeout=10)
+            response.raise_for_status()
+            return self.cache.put_thumbnail(url, response.content, response.headers.get('Content-Type'))
+        except Exception as e:
+            print(f"Warning: Failed to download thumbnail '{url}': {e}")
+            return None
+
+    async def search_image_async(self, query: str, num_results: int = 5) -> List[str]:
+        """
+        Search for images using the Custom Search REST API, without blocking the event loop
+        Returns a list of image URLs (or local thumbnail paths), or empty list if no results found
+        """
+        try:
+            results = await self._search_deduplicated_async(query, num_results)
+            if self.download_thumbnails:
+                return await self._to_images_async(results)
+            return [result.link for result in results]
+
         except Exception as e:
             print(f"Error searching for images: {e}")
-            return [] 
\ No newline at end of file
+            return []
+
+    async def _search_deduplicated_async(self, query: str, num_results: int) -> List[ImageResult]:
+        """Async version of _search_deduplicated, reading the cache in a worker thread"""
+        if (cached := await asyncio.to_thread(self.cache.get, query, num_results)) is not None:
+            return cached
+        return await SingleFlight.shared().run(
+            "images", (self.cache.normalize_query(query), num_results), lambda: self._search_async(query, num_results))
+
+    async def _search_async(self, query: str, num_results: int) -> List[ImageResult]:
+        """Call the Custom Search REST API and cache the results"""
+        await self.quota.acquire_async()
+        params = {
+            'key': self.api_key,
+            'cx': self.cse_id,
+            'q': query,
+            'searchType': 'image',
+            'num': num_results,
+        }
+        async with SiteLimiter.limit_async(self._API_URL):
+            response = await HttpSession.shared_async().get(self._API_URL, params=params)
+        response.raise_for_status()
+        results = self._parse_items(response.json())
+        await asyncio.to_thread(self.cache.put, query, num_results, results)
+        return results
+
+    async def _to_images_async(self, results: List[ImageResult]) -> List[str]:
+        """Async version of _to_images, downloading all thumbnails concurrently"""
+        async def to_image(result: ImageResult) -> str:
+            if not result.thumbnail:
+                return result.link
+            path = await asyncio.to_thread(self.cache.get_thumbnail, result.thumbnail)
+            path = path or await SingleFlight.shared().run(
+                "thumbnail", result.thumbnail, lambda: self._download_thumbnail_async(result.thumbnail))
+            return path or result.link
+
+        # Different results may share the same picture
+        return list(dict.fromkeys(await asyncio.gather(*(to_image(result) for result in results))))
+
+    async def _download_thumbnail_async(self, url: str) -> str | None:
+        """Async version of _download_thumbnail"""
+        try:
+            async with SiteLimiter.limit_async(url):
+                response = await HttpSession.shared_async().get(url, timeout=10)
+            response.raise_for_status()
+            return await asyncio.to_thread(
+                self.cache.put_thumbnail, url, response.content, response.headers.get('Content-Type'))
+        except Exception as e:
+            print(f"Warning: Failed to download thumbnail '{url}': {e}")
+            return None
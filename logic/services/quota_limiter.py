@@ -0,0 +1,99 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+
+class QuotaExceededError(RuntimeError):
+    """Raised when an API's daily quota is used up"""
+
+
+class QuotaLimiter:
+    """
+    Spaces out calls to a metered API and enforces its daily quota across runs.
+
+    The number of calls made today is kept in SQLite, so restarting the program
+    does not reset it. Days follow the API's quota time zone (Google resets its
+    quotas at midnight Pacific time).
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS usage (
+            api TEXT NOT NULL,
+            day TEXT NOT NULL,
+            calls INTEGER NOT NULL,
+            PRIMARY KEY (api, day)
+        );
+    """
+
+    def __init__(self, api: str, daily_quota: int, min_interval: float = 0.0,
+                 path: str | os.PathLike | None = None, quota_timezone: str = "America/Los_Angeles"):
+        """
+        Args:
+            api: Name the usage is recorded under
+            daily_quota: Maximum number of calls per day
+            min_interval: Minimum number of seconds between two calls
+            path: SQLite file to use, defaults to $QUOTA_DB or cache/quota.sqlite3
+            quota_timezone: Time zone in which the API's day starts
+        """
+        self.api = api
+        self.daily_quota = daily_quota
+        self.min_interval = min_interval
+        try:
+            self._timezone = ZoneInfo(quota_timezone)
+        except ZoneInfoNotFoundError:
+            self._timezone = timezone.utc
+        self.path = Path(path or os.getenv('QUOTA_DB', 'cache/quota.sqlite3'))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.executescript(self._SCHEMA)
+
+    def _today(self) -> str:
+        return datetime.now(self._timezone).date().isoformat()
+
+    def used_today(self) -> int:
+        """Return the number of calls recorded today"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT calls FROM usage WHERE api = ? AND day = ?", (self.api, self._today())).fetchone()
+        return row[0] if row else 0
+
+    def _reserve(self) -> float:
+        """
+        Count a call against today's quota and reserve its time slot.
+
+        Returns:
+            float: Seconds to wait before making the call
+
+        Raises:
+            QuotaExceededError: If today's quota is used up
+        """
+        with self._lock, self._connection:
+            day = self._today()
+            row = self._connection.execute(
+                "SELECT calls FROM usage WHERE api = ? AND day = ?", (self.api, day)).fetchone()
+            calls = row[0] if row else 0
+            if calls >= self.daily_quota:
+                raise QuotaExceededError(f"Daily quota of {self.daily_quota} calls to {self.api} is used up")
+            self._connection.execute(
+                "INSERT OR REPLACE INTO usage (api, day, calls) VALUES (?, ?, ?)", (self.api, day, calls + 1))
+
+            now = time.monotonic()
+            wait = max(0.0, self._next_slot - now)
+            self._next_slot = max(now, self._next_slot) + self.min_interval
+            return wait
+
+    def acquire(self) -> None:
+        """Block until a call may be made; raises QuotaExceededError if the quota is used up"""
+        time.sleep(self._reserve())
+
+    async def acquire_async(self) -> None:
+        """Wait until a call may be made without blocking the event loop, see acquire()"""
+        # The reservation is an SQLite transaction, so it runs in a worker thread
+        await asyncio.sleep(await asyncio.to_thread(self._reserve))
@@ -0,0 +1,116 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class TranscriptionStore:
+    """
+    Persistent store of IPA transcriptions keyed by source and word.
+
+    A word is transcribed by a given source (e.g. "openipa") once; later runs read
+    the stored result from an in-process LRU or the SQLite file instead.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS transcriptions (
+            source TEXT NOT NULL,
+            word TEXT NOT NULL,
+            transcription TEXT NOT NULL,
+            transcribed_at REAL NOT NULL,
+            PRIMARY KEY (source, word)
+        );
+    """
+
+    _shared: 'TranscriptionStore | None' = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: str | os.PathLike | None = None, lru_size: int = 4096):
+        """
+        Open (or create) a store.
+
+        Args:
+            path: SQLite file to use, defaults to $TRANSCRIPTION_DB or cache/transcriptions.sqlite3
+            lru_size: Number of transcriptions kept in memory in front of the database
+        """
+        self.path = Path(path or os.getenv('TRANSCRIPTION_DB', 'cache/transcriptions.sqlite3'))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lru_size = lru_size
+        self._lru: OrderedDict[Tuple[str, str], str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.executescript(self._SCHEMA)
+
+    @classmethod
+    def shared(cls) -> 'TranscriptionStore':
+        """Return the process-wide store configured from the environment"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def normalize(word: str) -> str:
+        return word.strip().lower()
+
+    def _remember(self, key: Tuple[str, str], transcription: str) -> None:
+        """Put a transcription at the front of the LRU, evicting the oldest one if it is full"""
+        self._lru[key] = transcription
+        self._lru.move_to_end(key)
+        if len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
+
+    def get(self, source: str, word: str) -> str | None:
+        """
+        Look up a transcription.
+
+        Args:
+            source: The transcription source, e.g. "openipa"
+            word: The transcribed word
+
+        Returns:
+            str | None: The stored transcription, or None if the word was not transcribed yet
+        """
+        key = (source, self.normalize(word))
+        with self._lock:
+            if key in self._lru:
+                self._lru.move_to_end(key)
+                return self._lru[key]
+
+            row = self._connection.execute(
+                "SELECT transcription FROM transcriptions WHERE source = ? AND word = ?", key).fetchone()
+            if row is None:
+                return None
+            self._remember(key, row[0])
+            return row[0]
+
+    def put(self, source: str, word: str, transcription: str) -> None:
+        """Store a transcription"""
+        key = (source, self.normalize(word))
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO transcriptions (source, word, transcription, transcribed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (*key, transcription, time.time()))
+            self._remember(key, transcription)
+
+    def items(self, source: str) -> List[Tuple[str, str]]:
+        """Return all (word, transcription) pairs stored for a source"""
+        with self._lock:
+            return self._connection.execute(
+                "SELECT word, transcription FROM transcriptions WHERE source = ? ORDER BY word", (source,)).fetchall()
+
+    def get_many(self, source: str, words: Iterable[str]) -> Dict[str, str]:
+        """Look up several words at once, returning only those that are stored"""
+        found = {}
+        for word in words:
+            if (transcription := self.get(source, word)) is not None:
+                found[word] = transcription
+        return found
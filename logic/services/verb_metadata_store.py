@@ -0,0 +1,186 @@
+import argparse
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, NamedTuple
+
+from dotenv import load_dotenv
+
+from model.enums.conjugates_with import ConjugatesWith
+from model.enums.verb_group import VerbGroup
+from logic.parsing.websites.lefigaro_parser import LeFigaroParser
+
+load_dotenv()
+
+
+class VerbMetadata(NamedTuple):
+    """Conjugation facts about an infinitive, which never change once known"""
+    verb_group: VerbGroup
+    conjugates_with: ConjugatesWith
+    conjugates_as: List[str]
+
+
+class VerbMetadataStore:
+    """
+    Persistent store of verb group, auxiliary and conjugation models keyed by infinitive.
+
+    Lookups go through an in-process LRU first and the SQLite file second, so a
+    verb scraped from Le Figaro once is never fetched again, in this run or later ones.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS verbs (
+            infinitive TEXT PRIMARY KEY,
+            verb_group TEXT NOT NULL,
+            conjugates_with TEXT NOT NULL,
+            conjugates_as TEXT NOT NULL,
+            fetched_at REAL NOT NULL
+        );
+    """
+
+    _shared: 'VerbMetadataStore | None' = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: str | os.PathLike | None = None, lru_size: int = 2048):
+        """
+        Open (or create) a store.
+
+        Args:
+            path: SQLite file to use, defaults to $VERB_METADATA_DB or cache/verb_metadata.sqlite3
+            lru_size: Number of verbs kept in memory in front of the database
+        """
+        self.path = Path(path or os.getenv('VERB_METADATA_DB', 'cache/verb_metadata.sqlite3'))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lru_size = lru_size
+        self._lru: OrderedDict[str, VerbMetadata] = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.executescript(self._SCHEMA)
+
+    @classmethod
+    def shared(cls) -> 'VerbMetadataStore':
+        """Return the process-wide store configured from the environment"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def normalize(infinitive: str) -> str:
+        return infinitive.strip().lower()
+
+    def _remember(self, key: str, metadata: VerbMetadata) -> None:
+        """Put a verb at the front of the LRU, evicting the oldest one if it is full"""
+        self._lru[key] = metadata
+        self._lru.move_to_end(key)
+        if len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
+
+    def get(self, infinitive: str) -> VerbMetadata | None:
+        """
+        Look up a verb without touching the network.
+
+        Args:
+            infinitive: The verb's infinitive
+
+        Returns:
+            VerbMetadata | None: The stored metadata, or None if the verb is unknown
+        """
+        key = self.normalize(infinitive)
+        with self._lock:
+            if key in self._lru:
+                self._lru.move_to_end(key)
+                return self._lru[key]
+
+            row = self._connection.execute(
+                "SELECT verb_group, conjugates_with, conjugates_as FROM verbs WHERE infinitive = ?",
+                (key,)).fetchone()
+            if row is None:
+                return None
+
+            metadata = VerbMetadata(VerbGroup(row[0]), ConjugatesWith(row[1]), json.loads(row[2]))
+            self._remember(key, metadata)
+            return metadata
+
+    def put(self, infinitive: str, metadata: VerbMetadata) -> None:
+        """Store a verb's metadata"""
+        key = self.normalize(infinitive)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO verbs (infinitive, verb_group, conjugates_with, conjugates_as, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, metadata.verb_group.value, metadata.conjugates_with.value,
+                 json.dumps(metadata.conjugates_as, ensure_ascii=False), time.time()))
+            self._remember(key, metadata)
+
+    def fetch(self, infinitive: str) -> VerbMetadata:
+        """
+        Get a verb's metadata, scraping Le Figaro and storing the result on a miss.
+
+        Args:
+            infinitive: The verb's infinitive
+
+        Returns:
+            VerbMetadata: The verb's metadata
+
+        Raises:
+            ValueError: If Le Figaro does not provide complete information for the verb
+        """
+        if metadata := self.get(infinitive):
+            return metadata
+
+        parser = LeFigaroParser(self.normalize(infinitive))
+        metadata = VerbMetadata(parser.get_verb_group(), parser.get_conjugates_with(), parser.get_conjugates_as())
+        self.put(infinitive, metadata)
+        return metadata
+
+    async def fetch_async(self, infinitive: str) -> VerbMetadata:
+        """Async version of fetch(), loading the Le Figaro page and querying the store without blocking the event loop"""
+        if metadata := await asyncio.to_thread(self.get, infinitive):
+            return metadata
+
+        parser = LeFigaroParser(self.normalize(infinitive))
+        await parser.load_async()
+        metadata = VerbMetadata(parser.get_verb_group(), parser.get_conjugates_with(), parser.get_conjugates_as())
+        await asyncio.to_thread(self.put, infinitive, metadata)
+        return metadata
+
+    def prewarm(self, infinitives: Iterable[str], max_workers: int = 4) -> int:
+        """
+        Fetch every verb of a word list that is not stored yet.
+
+        Args:
+            infinitives: The verbs to fetch
+            max_workers: Number of verbs fetched at the same time
+
+        Returns:
+            int: The number of verbs now available in the store
+        """
+        def fetch_quietly(infinitive: str) -> bool:
+            try:
+                self.fetch(infinitive)
+                return True
+            except Exception as e:
+                print(f"Warning: Could not prewarm '{infinitive}': {e}")
+                return False
+
+        words = (word for word in (self.normalize(word) for word in infinitives) if word)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return sum(executor.map(fetch_quietly, words))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Prewarm the verb metadata store from a word list")
+    parser.add_argument('word_list', help="File with one infinitive per line")
+    parser.add_argument('-w', '--workers', type=int, default=4, help="Number of verbs fetched at the same time")
+    args = parser.parse_args()
+
+    with open(args.word_list, encoding='utf-8') as f:
+        count = VerbMetadataStore.shared().prewarm(f, max_workers=args.workers)
+    print(f"{count} verbs available in the store")
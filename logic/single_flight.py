@@ -0,0 +1,150 @@
+import asyncio
+import os
+import re
+import threading
+import unicodedata
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """
+    Coalesces duplicate lookups within a process.
+
+    Lookups are keyed by (source, key). While one is running, every other caller
+    asking for the same key awaits the same future instead of starting its own
+    request, and once it has finished its result is remembered in a bounded LRU,
+    so later callers in the same run get it straight away. Failures and None
+    results are not remembered, so they are retried by the next caller.
+    """
+
+    _shared: 'SingleFlight | None' = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_results: int | None = None):
+        """
+        Args:
+            max_results: Number of finished results remembered, defaults to $SINGLE_FLIGHT_CACHE_SIZE or 4096
+        """
+        self.max_results = max_results or int(os.getenv('SINGLE_FLIGHT_CACHE_SIZE', '4096'))
+        self._results: OrderedDict[Tuple[str, Hashable], Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Tuple[str, Hashable], Future] = {}
+        # asyncio futures are bound to their loop, so async lookups are coalesced per loop
+        self._in_flight_async: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, Hashable], asyncio.Future]]" = \
+            weakref.WeakKeyDictionary()
+
+    @classmethod
+    def shared(cls) -> 'SingleFlight':
+        """Return the process-wide instance configured from the environment"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def normalize_word(word: str) -> str:
+        """
+        Reduce a headword to the form lookups are keyed by.
+
+        Drops a Linguee context such as "(qqn./qqch.)", normalizes Unicode and
+        case, and collapses whitespace, e.g. "Livrer  (qqn./qqch.)" -> "livrer".
+        """
+        word = re.sub(r"\(.*?\)", " ", word)
+        return " ".join(unicodedata.normalize('NFC', word).casefold().split())
+
+    def _cached(self, key: Tuple[str, Hashable]) -> Tuple[bool, Any]:
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return True, self._results[key]
+        return False, None
+
+    def _remember(self, key: Tuple[str, Hashable], result: Any) -> None:
+        if result is None:
+            return
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            if len(self._results) > self.max_results:
+                self._results.popitem(last=False)
+
+    def forget(self, source: str, key: Hashable) -> None:
+        """Drop a remembered result, so the next lookup runs again"""
+        with self._lock:
+            self._results.pop((source, key), None)
+
+    async def run(self, source: str, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run an async lookup unless the same one is running or has finished already.
+
+        Args:
+            source: What is looked up, e.g. "openipa" or "forvo"
+            key: The normalized lookup key, e.g. from normalize_word()
+            fetch: Starts the lookup; only called if no result is remembered or in flight
+
+        Returns:
+            T: The lookup's result, shared with every caller of the same key
+        """
+        flight_key = (source, key)
+        found, result = self._cached(flight_key)
+        if found:
+            return result
+
+        in_flight = self._in_flight_async.setdefault(asyncio.get_running_loop(), {})
+        if flight_key in in_flight:
+            # Shielded so one waiter being cancelled does not cancel the lookup for the others
+            return await asyncio.shield(in_flight[flight_key])
+
+        future = in_flight[flight_key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await fetch()
+            self._remember(flight_key, result)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            # Waiters get a plain error even if this lookup was cancelled, e.g. by its stage timing out
+            future.set_exception(e if isinstance(e, Exception) else RuntimeError(f"{source} lookup of {key!r} was cancelled"))
+            # Mark the exception as retrieved in case nobody else was waiting
+            future.exception()
+            raise
+        finally:
+            del in_flight[flight_key]
+
+    def run_sync(self, source: str, key: Hashable, fetch: Callable[[], T]) -> T:
+        """Blocking version of run() for lookups made from worker threads"""
+        flight_key = (source, key)
+        found, result = self._cached(flight_key)
+        if found:
+            return result
+
+        with self._lock:
+            # Another thread may have finished the lookup since the check above
+            if flight_key in self._results:
+                return self._results[flight_key]
+            future = self._in_flight.get(flight_key)
+            owner = future is None
+            if owner:
+                future = self._in_flight[flight_key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            result = fetch()
+            self._remember(flight_key, result)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[flight_key]
@@ -1,10 +1,24 @@
+from typing import Iterable
+
 from model.enums.word_category import WordCategory
+from model.variants.variant import Variant
 from logic.variant_augmenters.variant_augmenter import VariantAugmenter
 
 
 def create_variant_augmenter(category: WordCategory) -> VariantAugmenter:
-    """Factory function to create the appropriate variant augmenter based on word category"""
+    """Get the shared variant augmenter for a word category"""
     return VariantAugmenter.create(category)
 
 
-__all__ = ['VariantAugmenter', 'create_variant_augmenter']
+def augment_variants(variants: Iterable[Variant]) -> None:
+    """Augment variants concurrently, each with the augmenter for its category"""
+    VariantAugmenter.augment_all(variants)
+
+
+
+async def augment_variants_async(variants: Iterable[Variant]) -> None:
+    """Augment variants concurrently on the running event loop"""
+    await VariantAugmenter.augment_all_async(variants)
+
+
+__all__ = ['VariantAugmenter', 'create_variant_augmenter', 'augment_variants', 'augment_variants_async']
@@ -1,27 +1,66 @@
-from abc import ABC, abstractmethod
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from typing import TypeVar
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Dict, Iterable, Tuple, TypeVar
+
+from dotenv import load_dotenv
 
 from model.enums.word_category import WordCategory
 from model.variants.variant import Variant
+from logic.async_runner import AsyncRunner
+from logic.single_flight import SingleFlight
+from logic.services.french_transcriber import FrenchTranscriber
 from logic.services.image_search_service import ImageSearchService
-from logic.parsing.websites.openipa_parser import OpenIPAParser
+from logic.parsing.websites.openipa_parser import OpenIPABatcher, OpenIPAParser
 from logic.parsing.websites.forvo_parser import ForvoParser
 
+load_dotenv()
+
 T = TypeVar('T', bound=Variant)
 
 
 class VariantAugmenter():
-    def __init__(self):
-        self.image_service = ImageSearchService()
-        self._executor = ThreadPoolExecutor(max_workers=1)
+    # One long-lived augmenter per word category, see create()
+    _registry: Dict[WordCategory, 'VariantAugmenter'] = {}
+    _registry_lock = threading.Lock()
+
+    @property
+    def image_service(self) -> ImageSearchService:
+        """The shared image search service, created on first use"""
+        return ImageSearchService.shared()
 
     @abstractmethod
     def can_augment(self, variant: Variant) -> bool:
         """Check if this augmenter can handle the given variant"""
         return True
 
+    # Augmentation stages in the order they are listed on a card; all enabled stages run at the same time
+    STAGES = ("images", "transcription", "pronunciations", "category")
+
+    # Seconds a stage may take by default, used only when neither its own nor the shared timeout is set
+    _DEFAULT_STAGE_TIMEOUT = 60
+    _DEFAULT_STAGE_TIMEOUTS: Dict[str, float] = {
+        "category": 20,
+    }
+
+    @staticmethod
+    def enabled_stages() -> Tuple[str, ...]:
+        """The stages listed in $AUGMENTATION_STAGES, only category-specific data by default"""
+        configured = os.getenv('AUGMENTATION_STAGES', 'category')
+        stages = tuple(stage.strip() for stage in configured.split(',') if stage.strip())
+        for stage in stages:
+            if stage not in VariantAugmenter.STAGES:
+                raise ValueError(f"Unknown augmentation stage '{stage}', expected one of {VariantAugmenter.STAGES}")
+        return stages
+
+    def _stage_timeout(self, stage: str) -> float:
+        """Seconds a stage may take: $AUGMENTATION_<STAGE>_TIMEOUT, else $AUGMENTATION_STAGE_TIMEOUT, else the default"""
+        configured = os.getenv(f'AUGMENTATION_{stage.upper()}_TIMEOUT') or os.getenv('AUGMENTATION_STAGE_TIMEOUT')
+        if configured:
+            return float(configured)
+        return self._DEFAULT_STAGE_TIMEOUTS.get(stage, self._DEFAULT_STAGE_TIMEOUT)
+
     def augment(self, variant: Variant) -> None:
         """
         Augments the variant with additional data:
@@ -29,62 +68,114 @@ class VariantAugmenter():
         - Images based on word and definition
         - IPA transcription from OpenIPA
         - Pronunciations from Forvo
+
+        Failed or timed out stages are recorded in variant.errors instead of raising.
         """
-        #self._search_images(variant)
-        #self._add_transcription(variant)
-        #self._add_pronunciations(variant)
-        self._add_category_specific_data(variant)
+        # Run on the shared loop so the pooled browser is reused between calls
+        AsyncRunner.run(self.augment_async(variant))
+
+    async def augment_async(self, variant: Variant) -> None:
+        """Run all enabled stages for the variant concurrently, see augment()"""
+        stages = {
+            "images": self._search_images_async,
+            "transcription": self._add_transcription_async,
+            "pronunciations": self._add_pronunciations_async,
+            "category": self._add_category_specific_data_async,
+        }
+        await asyncio.gather(*(
+            self._run_stage(stage, stages[stage], variant) for stage in self.enabled_stages()
+        ))
+
+    async def _run_stage(self, stage: str, run: Callable[[Variant], Awaitable[None]], variant: Variant) -> None:
+        """Run one stage under its timeout, capturing any failure on the variant"""
+        timeout = self._stage_timeout(stage)
+        try:
+            await asyncio.wait_for(run(variant), timeout)
+        except asyncio.TimeoutError:
+            variant.errors[stage] = f"Timed out after {timeout:g}s"
+            print(f"Warning: Augmentation stage '{stage}' timed out for '{variant.word}'")
+        except Exception as e:
+            # Keep only the first line, some libraries (Playwright) attach multi-line banners
+            message = next(iter(str(e).splitlines()), "")
+            variant.errors[stage] = f"{type(e).__name__}: {message}"
+            print(f"Warning: Augmentation stage '{stage}' failed for '{variant.word}': {message}")
 
     def _add_category_specific_data(self, variant: Variant) -> None:
         """Add category-specific data to the variant"""
         pass
 
-    def _search_images(self, variant: Variant) -> None:
+    async def _add_category_specific_data_async(self, variant: Variant) -> None:
+        # Category data may scrape with blocking requests, so it runs in a worker thread
+        await asyncio.to_thread(self._add_category_specific_data, variant)
+
+    async def _search_images_async(self, variant: Variant) -> None:
         """Search for images using word and first definition"""
         if variant.english_definitions:
             search_query = f"{variant.word} ({variant.english_definitions[0]})"
-            variant.images = self.image_service.search_image(search_query)
+            # The first call builds the search service, which loads the API discovery document
+            image_service = await asyncio.to_thread(lambda: self.image_service)
+            variant.images = await image_service.search_image_async(search_query)
 
-    def _add_transcription(self, variant: Variant) -> None:
-        """Add IPA transcription using OpenIPA"""
-        try:
-            # Create a new event loop in the thread
-            future = self._executor.submit(
-                lambda: asyncio.run(self._run_async_transcription(variant.word))
-            )
-            # Get the result from the future
-            transcription = future.result()
-            if transcription:
-                variant.transcription = transcription
-        except Exception as e:
-            print(f"Warning: Failed to add transcription for '{variant.word}': {e}")
-
-    def _add_pronunciations(self, variant: Variant) -> None:
-        """Add pronunciations from Forvo"""
-        try:
-            # Create a new event loop in the thread
-            future = self._executor.submit(
-                lambda: asyncio.run(self._run_async_pronunciations(variant.word))
-            )
-            # Get the result from the future
-            pronunciations = future.result()
-            if pronunciations:
-                variant.pronunciations = pronunciations
-        except Exception as e:
-            print(f"Warning: Failed to add pronunciations for '{variant.word}': {e}")
+    async def _add_transcription_async(self, variant: Variant) -> None:
+        """Add IPA transcription using the backend selected by $TRANSCRIPTION_BACKEND (openipa or rules)"""
+        word = SingleFlight.normalize_word(variant.word)
+        match os.getenv('TRANSCRIPTION_BACKEND', 'openipa'):
+            case 'openipa':
+                # Variants sharing a headword share one lookup, which is batched with the other words
+                # so the OpenIPA page is loaded once for all of them
+                transcription = await SingleFlight.shared().run(
+                    OpenIPAParser.SOURCE, word, lambda: OpenIPABatcher.shared().transcribe(word))
+            case 'rules':
+                transcription = FrenchTranscriber.shared().transcribe(word)
+            case backend:
+                raise ValueError(f"Unknown transcription backend '{backend}', expected 'openipa' or 'rules'")
+        if transcription:
+            variant.transcription = transcription
 
-    async def _run_async_transcription(self, word: str) -> str | None:
-        """Run the async transcription retrieval in a new event loop"""
-        async with OpenIPAParser(word) as parser:
-            return await parser.get_transcription()
+    async def _add_pronunciations_async(self, variant: Variant) -> None:
+        """Add pronunciations from Forvo, looked up once per headword"""
+        word = SingleFlight.normalize_word(variant.word)
+        pronunciations = await SingleFlight.shared().run("forvo", word, lambda: self._fetch_pronunciations(word))
+        if pronunciations:
+            variant.pronunciations = list(pronunciations)
 
-    async def _run_async_pronunciations(self, word: str) -> list[str]:
-        """Run the async pronunciation retrieval in a new event loop"""
+    @staticmethod
+    async def _fetch_pronunciations(word: str) -> list[str]:
+        """Get the pronunciations of a word from Forvo, on a pooled browser page"""
         async with ForvoParser(word) as parser:
             return await parser.get_pronunciation()
 
+    @classmethod
+    def augment_all(cls, variants: Iterable[Variant]) -> None:
+        """Augment many variants at once, see augment_all_async()"""
+        AsyncRunner.run(cls.augment_all_async(variants))
+
+    @classmethod
+    async def augment_all_async(cls, variants: Iterable[Variant]) -> None:
+        """
+        Augment many variants concurrently, each with the augmenter for its category.
+
+        All stages of all variants run at the same time, limited only by
+        SiteLimiter and the browser pool, so a word takes about as long as its
+        slowest source rather than the sum of all of them.
+        """
+        await asyncio.gather(*(cls.create(variant.category).augment_async(variant) for variant in variants))
+
+    @classmethod
+    def create(cls, category: WordCategory) -> 'VariantAugmenter':
+        """
+        Get the variant augmenter for a word category.
+
+        Augmenters are stateless between variants, so one instance per category is
+        created on first use and shared by all later calls and threads.
+        """
+        with cls._registry_lock:
+            if category not in cls._registry:
+                cls._registry[category] = cls._create_uncached(category)
+            return cls._registry[category]
+
     @staticmethod
-    def create(category: WordCategory) -> 'VariantAugmenter':
+    def _create_uncached(category: WordCategory) -> 'VariantAugmenter':
         """Factory method to create the appropriate variant augmenter based on word category"""
         match category:
             case WordCategory.NOUN:
@@ -94,8 +185,4 @@ class VariantAugmenter():
                 from logic.variant_augmenters.verb_variant_augmenter import VerbVariantAugmenter
                 return VerbVariantAugmenter()
             case _:
-                return VariantAugmenter()
-
-    def __del__(self):
-        """Cleanup thread pool executor"""
-        self._executor.shutdown(wait=False) 
\ No newline at end of file
+                return VariantAugmenter()
\ No newline at end of file
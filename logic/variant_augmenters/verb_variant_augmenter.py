@@ -1,4 +1,4 @@
-from bs4 import Tag
+import os
 
 from model.enums.word_category import WordCategory
 from model.enums.conjugates_with import ConjugatesWith
@@ -6,7 +6,8 @@ from model.enums.verb_group import VerbGroup
 from model.variants.variant import Variant
 from model.variants.verb_variant import VerbVariant
 from logic.variant_augmenters.variant_augmenter import VariantAugmenter
-from logic.parsing.websites.lefigaro_parser import LeFigaroParser
+from logic.services.verb_metadata_store import VerbMetadata, VerbMetadataStore
+from logic.verb_classifier import VerbClassifier
 
 
 class VerbVariantAugmenter(VariantAugmenter):
@@ -15,25 +16,63 @@ class VerbVariantAugmenter(VariantAugmenter):
     # Valid auxiliary verbs in French
     _VALID_AUXILIARIES = {"être", "avoir"}
 
+    def __init__(self):
+        super().__init__()
+        self.verb_metadata_store = VerbMetadataStore.shared()
+        self.verb_classifier = VerbClassifier()
+        self.min_classifier_confidence = float(os.getenv('VERB_CLASSIFIER_MIN_CONFIDENCE', '0.8'))
+
     def can_augment(self, variant: Variant) -> bool:
         """Check if this augmenter can handle the given variant"""
         return variant.category == WordCategory.VERB
 
     def _add_category_specific_data(self, variant: Variant) -> None:
         """Add verb-specific data to the variant"""
-        if not isinstance(variant, VerbVariant):
-            return
+        if isinstance(variant, VerbVariant) and not self._add_local_data(variant):
+            # Get verb group, auxiliary verb, and conjugation model, from Le Figaro only if not stored yet.
+            # A ValueError for incomplete data is recorded on the variant by the augmentation stage.
+            self._apply_metadata(variant, self.verb_metadata_store.fetch(self._get_infinitive(variant)))
+
+    async def _add_category_specific_data_async(self, variant: Variant) -> None:
+        """Async version of _add_category_specific_data, scraping Le Figaro without blocking the event loop"""
+        if isinstance(variant, VerbVariant) and not self._add_local_data(variant):
+            self._apply_metadata(variant, await self.verb_metadata_store.fetch_async(self._get_infinitive(variant)))
+
+    def _add_local_data(self, variant: VerbVariant) -> bool:
+        """
+        Fill the variant from the store, or its group and auxiliary from the offline classifier.
+
+        The classifier cannot tell which verbs Le Figaro lists as conjugated the
+        same way, so a verb that is not stored still needs Le Figaro. Its
+        confident answers are kept if Le Figaro fails.
+
+        Returns:
+            bool: Whether the variant was filled in completely, without touching the network
+        """
+        infinitive = self._get_infinitive(variant)
+        if metadata := self.verb_metadata_store.get(infinitive):
+            self._apply_metadata(variant, metadata)
+            return True
+
+        verb_group, group_confidence = self.verb_classifier.get_verb_group(infinitive)
+        conjugates_with, auxiliary_confidence = self.verb_classifier.get_conjugates_with(infinitive)
+        if min(group_confidence, auxiliary_confidence) >= self.min_classifier_confidence:
+            variant.verb_group = verb_group
+            variant.conjugates_with = conjugates_with
+        return False
 
-        # Create LeFigaroParser with the variant's word
-        parser = LeFigaroParser(variant.word)
+    @staticmethod
+    def _apply_metadata(variant: VerbVariant, metadata: VerbMetadata) -> None:
+        variant.verb_group = metadata.verb_group
+        variant.conjugates_with = metadata.conjugates_with
+        variant.conjugates_as = list(metadata.conjugates_as)
 
-        # Get verb group, auxiliary verb, and conjugation model from Le Figaro
-        try:
-            variant.verb_group = parser.get_verb_group()
-            variant.conjugates_with = parser.get_conjugates_with()
-            variant.conjugates_as = parser.get_conjugates_as()
-        except ValueError as e:
-            print(f"Warning: {str(e)}")
+    @staticmethod
+    def _get_infinitive(variant: Variant) -> str:
+        """Get the bare infinitive, without a Linguee context such as (qqn./qqch.)"""
+        if variant.context and variant.word.endswith(variant.context):
+            return variant.word[:-len(variant.context)].strip()
+        return variant.word
 
     def _create_augmented_variant(self, variant: Variant) -> VerbVariant:
         """Create a new verb variant with the same base properties"""
@@ -42,6 +81,8 @@ class VerbVariantAugmenter(VariantAugmenter):
         augmented.category = variant.category
         augmented.english_definitions = variant.english_definitions.copy()
         augmented.examples = variant.examples.copy()
-        augmented.element = variant.element
+        augmented.context = variant.context
+        augmented.word_type_tags = variant.word_type_tags.copy()
+        augmented.errors = variant.errors.copy()
         return augmented
 
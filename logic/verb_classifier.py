@@ -0,0 +1,151 @@
+import re
+from typing import List, NamedTuple, Tuple
+
+from model.enums.conjugates_with import ConjugatesWith
+from model.enums.verb_group import VerbGroup
+
+
+class VerbClassification(NamedTuple):
+    """Locally inferred conjugation facts with the confidence of the weakest of them"""
+    verb_group: VerbGroup
+    conjugates_with: ConjugatesWith
+    conjugates_as: List[str]
+    confidence: float
+
+
+class VerbClassifier:
+    """
+    Rule-based classifier for French verbs that works without the network.
+
+    The group follows from the ending plus a compact exception table: -er verbs
+    are first group except aller, -ir verbs are second group (-issant) unless
+    they belong to the closed set of irregular -ir verbs, and the rest is third
+    group. The auxiliary is être for pronominal verbs and the small closed set of
+    movement / change-of-state verbs, avoir otherwise. Every answer carries a
+    confidence so callers can fall back to Le Figaro for the uncertain cases.
+    """
+
+    _THIRD_GROUP_VERBS = {"aller", "avoir", "être", "s'en aller"}
+
+    # Third-group -ir verbs, matched as suffixes so that compounds (devenir, recouvrir...) are covered
+    _THIRD_GROUP_IR_SUFFIXES = (
+        "venir", "tenir", "courir", "mourir", "ouvrir", "couvrir", "offrir", "souffrir", "cueillir",
+        "quérir", "dormir", "mentir", "sentir", "pentir", "vêtir", "fuir", "bouillir", "faillir", "saillir",
+        "ouïr", "gésir",
+    )
+    # Endings shared by second- and third-group verbs (répartir vs partir, asservir vs servir...)
+    _AMBIGUOUS_IR_SUFFIXES = ("partir", "sortir", "servir")
+
+    # Verbs that always take être
+    _ETRE_VERBS = {
+        "aller", "arriver", "entrer", "mourir", "naître", "renaître", "partir", "repartir", "rester",
+        "tomber", "retomber", "venir", "devenir", "revenir", "parvenir", "survenir", "intervenir",
+        "advenir", "provenir", "redevenir", "décéder", "éclore",
+    }
+    # Verbs that take être when intransitive and avoir when transitive
+    _ETRE_OR_AVOIR_VERBS = {
+        "monter", "remonter", "descendre", "redescendre", "sortir", "ressortir", "rentrer",
+        "retourner", "passer", "repasser", "apparaître",
+    }
+
+    # First-group spelling-change endings and the model verb Le Figaro conjugates them after
+    _FIRST_GROUP_MODELS = (
+        ("envoyer", "envoyer"),
+        ("cer", "placer"),
+        ("ger", "manger"),
+        ("ayer", "payer"),
+        ("oyer", "employer"),
+        ("uyer", "employer"),
+    )
+    # e / é followed by consonants before -er: the stem vowel may change before a silent ending
+    # (lever, céder, sevrer, régner, célébrer, protéger), double the consonant (appeler, jeter) or stay
+    # (chercher), which only Le Figaro can tell
+    _STEM_CHANGE_CANDIDATE = re.compile(r"[eé][^aeiouyàâäéèêëîïôöùûüœæ]+er$")
+
+    _CERTAIN = 1.0
+    _LIKELY = 0.95
+    _PLAUSIBLE = 0.8
+    _UNCERTAIN = 0.5
+
+    @staticmethod
+    def _split_pronominal(infinitive: str) -> Tuple[str, bool]:
+        """Strip a reflexive pronoun, returning the bare verb and whether it was pronominal"""
+        verb = infinitive.strip().lower()
+        for prefix in ("se ", "s'", "s’"):
+            if verb.startswith(prefix):
+                return verb[len(prefix):].strip(), True
+        return verb, False
+
+    def get_verb_group(self, infinitive: str) -> Tuple[VerbGroup, float]:
+        """
+        Infer the verb group of an infinitive.
+
+        Returns:
+            Tuple[VerbGroup, float]: The group and the confidence in it
+        """
+        verb, _ = self._split_pronominal(infinitive)
+        if verb in self._THIRD_GROUP_VERBS:
+            return VerbGroup.THIRD, self._CERTAIN
+        if verb.endswith("er"):
+            return VerbGroup.FIRST, self._LIKELY
+        if verb.endswith("oir") or verb.endswith("re"):
+            return VerbGroup.THIRD, self._LIKELY
+        if verb.endswith("ir") or verb.endswith("ïr"):
+            if verb.endswith(self._AMBIGUOUS_IR_SUFFIXES):
+                return VerbGroup.THIRD, self._UNCERTAIN
+            if verb.endswith(self._THIRD_GROUP_IR_SUFFIXES):
+                return VerbGroup.THIRD, self._PLAUSIBLE
+            return VerbGroup.SECOND, self._PLAUSIBLE
+        return VerbGroup.THIRD, self._UNCERTAIN
+
+    def get_conjugates_with(self, infinitive: str) -> Tuple[ConjugatesWith, float]:
+        """
+        Infer the auxiliary verb of an infinitive.
+
+        Returns:
+            Tuple[ConjugatesWith, float]: The auxiliary and the confidence in it
+        """
+        verb, pronominal = self._split_pronominal(infinitive)
+        if pronominal:
+            return ConjugatesWith.ETRE, self._CERTAIN
+        if verb in self._ETRE_OR_AVOIR_VERBS:
+            return ConjugatesWith.ETRE, self._UNCERTAIN
+        if verb in self._ETRE_VERBS:
+            return ConjugatesWith.ETRE, self._LIKELY
+        return ConjugatesWith.AVOIR, self._LIKELY
+
+    def get_conjugates_as(self, infinitive: str, verb_group: VerbGroup) -> Tuple[List[str], float]:
+        """
+        Infer the model verb an infinitive conjugates like.
+
+        Returns:
+            Tuple[List[str], float]: The model verbs (empty if the verb is its own model) and the confidence
+        """
+        verb, _ = self._split_pronominal(infinitive)
+        match verb_group:
+            case VerbGroup.FIRST:
+                if self._STEM_CHANGE_CANDIDATE.search(verb):
+                    return [], self._UNCERTAIN
+                model = next((model for suffix, model in self._FIRST_GROUP_MODELS if verb.endswith(suffix)), "aimer")
+            case VerbGroup.SECOND:
+                model = "haïr" if verb.endswith("haïr") else "finir"
+            case _:
+                # Third group models are too irregular to guess
+                return [], self._UNCERTAIN
+        return ([] if model == verb else [model]), self._PLAUSIBLE
+
+    def classify(self, infinitive: str) -> VerbClassification:
+        """
+        Classify an infinitive.
+
+        Args:
+            infinitive: The verb, optionally pronominal (e.g. "se lever")
+
+        Returns:
+            VerbClassification: The inferred facts; confidence is the lowest of the individual ones
+        """
+        verb_group, group_confidence = self.get_verb_group(infinitive)
+        conjugates_with, auxiliary_confidence = self.get_conjugates_with(infinitive)
+        conjugates_as, model_confidence = self.get_conjugates_as(infinitive, verb_group)
+        return VerbClassification(verb_group, conjugates_with, conjugates_as,
+                                  min(group_confidence, auxiliary_confidence, model_confidence))
@@ -1,47 +1,299 @@
+import argparse
 import json
+import os
+import sys
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Deque, Dict, Iterable, Iterator, Set, TextIO
 
 from model.response import Response
-from logic.variant_augmenters import create_variant_augmenter
+from logic.async_runner import AsyncRunner
+from logic.variant_augmenters import augment_variants_async
+from logic.export.apkg_exporter import ApkgExporter
+from logic.export.jsonl_exporter import JsonlExporter
+from logic.parsing.site_limiter import SiteLimiter
 from logic.parsing.websites.linguee_parser import LingueeParser
 
 """
-TODO: 
+TODO:
 6. Implement getting prononciation.
 7. Implement getting "conjugates with"
 8. Implement getting "conjugates as"
 """
 
+DEFAULT_MAX_WORKERS = 8
+CHECKPOINT_INTERVAL = 25  # Responses written between two checkpoints of a JSONL batch
 
-def create_anki_card(query: str) -> Response:
+
+async def create_anki_card_async(query: str) -> Response:
+    """
+    Create the card for a query on the running event loop.
+
+    Nothing blocks the loop: pages are fetched with the async HTTP client, parsed
+    in worker threads, and all variants are augmented concurrently, so this can
+    be awaited from an async web service.
+    """
     query = query.strip()
 
     # Create a single response with all variants
-    response = Response()
+    response = Response(query)
 
     # Get all variants from Linguee
     linguee_parser = LingueeParser(query)
-    variants = linguee_parser.get_variants()
-
-    # Augment each variant with category-specific data
-    for variant in variants:
-        try:
-            augmenter = create_variant_augmenter(variant.category)
-            augmenter.linguee_parser = linguee_parser  # Set the parser after creation
-            augmenter.augment(variant)
-        except NotImplementedError:
-            # TODO: Support other word categories (verbs, adjectives, etc.)
-            continue
-        except ValueError as e:
-            print(f"Warning: {e}")
-            continue
-    
+    variants = await linguee_parser.get_variants_async()
+
+    # Augment all variants at once; failed stages are recorded in each variant's errors
+    await augment_variants_async(variants)
+
     # Add variants to response
     response.variants.extend(variants)
 
     return response
 
 
+def create_anki_card(query: str) -> Response:
+    """Synchronous wrapper around create_anki_card_async, running it on the shared event loop"""
+    return AsyncRunner.run(create_anki_card_async(query))
+
+
+def _create_anki_card_safe(query: str) -> Response:
+    """Create a card, turning any failure into an error response so one word cannot stop a batch"""
+    try:
+        return create_anki_card(query)
+    except Exception as e:
+        print(f"Warning: Failed to create card for '{query}': {e}")
+        response = Response(query.strip())
+        response.error = f"{type(e).__name__}: {e}"
+        return response
+
+
+def create_anki_cards(queries: Iterable[str], max_workers: int = DEFAULT_MAX_WORKERS) -> Iterator[Response]:
+    """
+    Create cards for many queries concurrently.
+
+    Queries are consumed lazily and at most max_workers words are processed at once;
+    requests to each website are additionally capped by SiteLimiter. Responses are
+    yielded as soon as they are finished, so they may come out in a different order
+    than the queries. A word that fails yields a Response with its error set.
+
+    Args:
+        queries: The words to create cards for
+        max_workers: Maximum number of words processed at the same time
+
+    Returns:
+        Iterator[Response]: The finished responses in completion order
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+    query_iterator = (query for query in queries if query.strip())
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        in_flight: Dict[Future, str] = {
+            executor.submit(_create_anki_card_safe, query): query
+            for query in islice(query_iterator, max_workers)
+        }
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                del in_flight[future]
+                # Keep the pool full without reading the whole input up front
+                for query in islice(query_iterator, 1):
+                    in_flight[executor.submit(_create_anki_card_safe, query)] = query
+                yield future.result()
+
+
+def _parse_query_line(line: str) -> str | None:
+    """Extract the query from a JSONL input line: either a JSON string or an object with a "query" key"""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        value = json.loads(line)
+    except json.JSONDecodeError:
+        print(f"Warning: Skipping invalid JSON line: {line[:80]}")
+        return None
+    if isinstance(value, dict):
+        value = value.get('query')
+    if not isinstance(value, str) or not value.strip():
+        print(f"Warning: Skipping line without a query: {line[:80]}")
+        return None
+    return value.strip()
+
+
+def _read_checkpoint(checkpoint_path: str) -> tuple[int, int]:
+    """Return (first input line not fully processed, output size when it was handed out) from a checkpoint file"""
+    try:
+        with open(checkpoint_path, encoding='utf-8') as f:
+            checkpoint = json.load(f)
+        return checkpoint['input_line'], checkpoint['output_offset']
+    except FileNotFoundError:
+        return 0, 0
+
+
+def _write_checkpoint(checkpoint_path: str, input_line: int, output_offset: int) -> None:
+    """Atomically replace the checkpoint file"""
+    temp_path = f"{checkpoint_path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump({'input_line': input_line, 'output_offset': output_offset}, f)
+    os.replace(temp_path, checkpoint_path)
+
+
+def _prepare_output(output_path: str, output_offset: int) -> Set[str]:
+    """
+    Make an existing output file safe to append to and collect the queries it already holds.
+
+    A line cut off by a crash is truncated away. Only the part written after the last
+    checkpoint's output offset is read; everything before it belongs to input lines
+    before the checkpoint's input line.
+    """
+    done: Set[str] = set()
+    if not os.path.exists(output_path):
+        return done
+
+    with open(output_path, 'rb+') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(min(output_offset, size))
+        valid_end = f.tell()
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                done.add(json.loads(line)['query'])
+            except (json.JSONDecodeError, KeyError, TypeError):
+                break
+            valid_end += len(line)
+        if valid_end < size:
+            print(f"Warning: Truncating {size - valid_end} bytes of incomplete output in {output_path}")
+            f.truncate(valid_end)
+    return done
+
+
+def run_jsonl_batch(input_file: TextIO, output_path: str, max_workers: int = DEFAULT_MAX_WORKERS) -> int:
+    """
+    Create cards for every query in a JSONL stream and append them to a JSONL file.
+
+    Input is read lazily, one Response.to_dict() is written per line and flushed as
+    soon as it is ready. Progress is checkpointed next to the output file, so a rerun
+    with the same input resumes where the previous run stopped: input lines before
+    the checkpoint are skipped without being processed, and queries already in the
+    output after it are skipped as well. Memory use does not grow with the input.
+
+    Args:
+        input_file: The JSONL input, one JSON string or {"query": ...} object per line
+        output_path: The JSONL file to append responses to
+        max_workers: Maximum number of words processed at the same time
+
+    Returns:
+        int: The number of responses written by this run
+    """
+    checkpoint_path = f"{output_path}.checkpoint"
+    resume_line, output_offset = _read_checkpoint(checkpoint_path)
+    done = _prepare_output(output_path, output_offset)
+
+    # Input lines handed to the batch but not written yet, mapped to the output size when they were
+    # handed out; the smallest one is the resume point. Responses finished out of order are all written
+    # after that size, so resuming reads them back from there instead of processing them again.
+    pending: Dict[int, int] = {}
+    pending_by_query: Dict[str, Deque[int]] = defaultdict(deque)
+    next_line = resume_line
+    output_end = 0
+
+    def queries() -> Iterator[str]:
+        nonlocal next_line
+        for line_number, line in enumerate(islice(input_file, resume_line, None), start=resume_line):
+            next_line = line_number + 1
+            query = _parse_query_line(line)
+            if query is None or query in done:
+                continue
+            pending[line_number] = output_end
+            pending_by_query[query].append(line_number)
+            yield query
+
+    written = 0
+    with open(output_path, 'a', encoding='utf-8') as output:
+        output_end = output.tell()
+        for response in create_anki_cards(queries(), max_workers=max_workers):
+            output.write(JsonlExporter.dumps(response) + '\n')
+            output.flush()
+            output_end = output.tell()
+            written += 1
+
+            line_numbers = pending_by_query[response.query]
+            del pending[line_numbers.popleft()]
+            if not line_numbers:
+                del pending_by_query[response.query]
+
+            if written % CHECKPOINT_INTERVAL == 0:
+                os.fsync(output.fileno())
+                resume_at = min(pending, default=None)
+                if resume_at is None:
+                    _write_checkpoint(checkpoint_path, next_line, output_end)
+                else:
+                    _write_checkpoint(checkpoint_path, resume_at, pending[resume_at])
+
+        os.fsync(output.fileno())
+        _write_checkpoint(checkpoint_path, next_line, output.tell())
+    return written
+
+
+def _parse_site_limit(value: str) -> tuple[str, int]:
+    """Parse a HOST=LIMIT command line argument"""
+    host, separator, limit = value.partition('=')
+    if not separator or not limit.isdigit():
+        raise argparse.ArgumentTypeError(f"Expected HOST=LIMIT, got '{value}'")
+    return host, int(limit)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Create Anki flashcard data for French words")
+    parser.add_argument('queries', nargs='*', help="Words to create cards for (defaults to 'sans')")
+    parser.add_argument('-f', '--file', help="Read additional words from a file, one per line")
+    parser.add_argument('-i', '--input', help="JSONL file of queries to process in batch, '-' for stdin")
+    parser.add_argument('-o', '--output', help="JSONL file to append responses to, resumable (requires --input)")
+    parser.add_argument('--apkg', help="Write the cards to this Anki package instead of printing them")
+    parser.add_argument('--deck-name', default="French Vocabulary", help="Name of the Anki deck for --apkg")
+    parser.add_argument('-w', '--workers', type=int, default=DEFAULT_MAX_WORKERS,
+                        help="Maximum number of words processed at the same time")
+    parser.add_argument('--site-limit', type=_parse_site_limit, action='append', default=[],
+                        metavar='HOST=LIMIT', help="Maximum concurrent requests to a host")
+    args = parser.parse_args()
+    if bool(args.input) != bool(args.output):
+        parser.error("--input and --output must be used together")
+    if not args.queries and not args.file and not args.input:
+        args.queries = ['sans']
+    return args
+
+
+def _iter_queries(args: argparse.Namespace) -> Iterator[str]:
+    yield from args.queries
+    if args.file:
+        with open(args.file, encoding='utf-8') as f:
+            for line in f:
+                yield line.strip()
+
+
 if __name__ == '__main__':
-    response = create_anki_card('sans')
-    serialized_response = json.dumps(response.to_dict(), indent=2, ensure_ascii=False)
-    print(serialized_response)
\ No newline at end of file
+    args = _parse_args()
+    SiteLimiter.configure(dict(args.site_limit))
+
+    if args.input:
+        if args.input == '-':
+            count = run_jsonl_batch(sys.stdin, args.output, max_workers=args.workers)
+        else:
+            with open(args.input, encoding='utf-8') as input_file:
+                count = run_jsonl_batch(input_file, args.output, max_workers=args.workers)
+        print(f"Wrote {count} responses to {args.output}", file=sys.stderr)
+    elif args.apkg:
+        count = ApkgExporter(args.deck_name).export(
+            create_anki_cards(_iter_queries(args), max_workers=args.workers), args.apkg)
+        print(f"Exported {count} notes to {args.apkg}", file=sys.stderr)
+    elif not args.file and len(args.queries) == 1:
+        response = create_anki_card(args.queries[0])
+        serialized_response = json.dumps(response.to_dict(), indent=2, ensure_ascii=False)
+        print(serialized_response)
+    else:
+        # Batch mode: one JSON document per line, printed as soon as each word is done
+        JsonlExporter(chunk_size=1).export(
+            create_anki_cards(_iter_queries(args), max_workers=args.workers), sys.stdout, flush=True)
@@ -4,12 +4,22 @@ from model.variants.variant import Variant
 
 
 class Response:
+    __slots__ = ('query', 'variants', 'error')
+
+    query: str | None
     variants: List[Variant]
+    error: str | None  # Set when the card could not be created for the query
 
-    def __init__(self):
+    def __init__(self, query: str | None = None):
+        self.query = query
         self.variants = []
+        self.error = None
 
     def to_dict(self):
-        return {
+        result = {
+            'query': self.query,
             'variants': [variant.to_dict() for variant in self.variants]
-        }
\ No newline at end of file
+        }
+        if self.error:
+            result['error'] = self.error
+        return result
\ No newline at end of file
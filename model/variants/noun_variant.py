@@ -1,13 +1,10 @@
-from dataclasses import dataclass
-from typing import List
-
-from model.enums.word_category import WordCategory
 from model.enums.word_gender import WordGender
 from model.variants.variant import Variant
 
 
-@dataclass
 class NounVariant(Variant):
+    __slots__ = ('gender',)
+
     gender: WordGender | None
 
     def __init__(self):
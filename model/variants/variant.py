@@ -1,11 +1,18 @@
-from dataclasses import dataclass
-from bs4 import Tag
-
 from model.enums.word_category import WordCategory
 
 
-@dataclass
 class Variant:
+    """
+    A dictionary entry for one meaning of the queried word.
+
+    Slotted, so instances carry no per-instance __dict__; subclasses declare their own __slots__.
+    Equality and repr compare and show every slot, as the dataclass versions did.
+    """
+    __slots__ = ('word', 'category', 'images', 'english_definitions', 'pronunciations', 'transcription',
+                 'examples', 'context', 'word_type_tags', 'errors')
+    # All slots of the class and its bases, in declaration order
+    _fields: tuple[str, ...] = __slots__
+
     word: str
     category: WordCategory
     images: list[str] | None
@@ -14,7 +21,10 @@ class Variant:
     transcription: str | None  # IPA transcription of the word
     examples: list[str]  # List of example sentences
 
-    element: Tag | None  # Non-serializable property for the HTML element
+    # Facts extracted from the Linguee entry, kept instead of the HTML element so the page can be freed
+    context: str | None  # Lemma context appended to the word, e.g. "(qqn./qqch.)"
+    word_type_tags: list[str]  # Normalized word type tags, e.g. ["noun", "masculine"]
+    errors: dict[str, str]  # Augmentation stages that failed or timed out, mapped to the reason
 
     def __init__(self):
         self.pronunciations = []
@@ -23,10 +33,31 @@ class Variant:
         self.english_definitions = []
         self.examples = []
         self.word = ""
-        self.element = None
+        self.context = None
+        self.word_type_tags = []
+        self.errors = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = cls.__base__._fields + tuple(cls.__dict__.get('__slots__', ()))
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name, None) for name in self._fields)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._values() == other._values()
+
+    # Mutable, like the dataclass versions
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={value!r}" for name, value in zip(self._fields, self._values()))
+        return f"{type(self).__name__}({fields})"
 
     def to_dict(self):
-        return {
+        result = {
             'category': self.category.value,
             'pronunciations': self.pronunciations,
             'transcription': self.transcription,
@@ -34,4 +65,7 @@ class Variant:
             'english_definitions': self.english_definitions,
             'examples': self.examples,
             'word': self.word
-        } 
\ No newline at end of file
+        }
+        if self.errors:
+            result['errors'] = self.errors
+        return result 
\ No newline at end of file
@@ -1,5 +1,4 @@
 from typing import List, Optional
-from dataclasses import dataclass, field
 
 from model.enums.word_category import WordCategory
 from model.enums.conjugates_with import ConjugatesWith
@@ -7,12 +6,13 @@ from model.enums.verb_group import VerbGroup
 from model.variants.variant import Variant
 
 
-@dataclass
 class VerbVariant(Variant):
     """A verb variant with its conjugation information"""
-    conjugates_with: Optional[ConjugatesWith] = None
-    conjugates_as: List[str] = field(default_factory=list)
-    verb_group: Optional[VerbGroup] = None
+    __slots__ = ('conjugates_with', 'conjugates_as', 'verb_group')
+
+    conjugates_with: Optional[ConjugatesWith]
+    conjugates_as: List[str]
+    verb_group: Optional[VerbGroup]
 
     def __init__(self):
         super().__init__()
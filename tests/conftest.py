@@ -0,0 +1,13 @@
+import pytest
+
+from logic.parsing.dictionary_store import DictionaryStore
+from logic.parsing.extraction_cache import ExtractionCache
+
+
+@pytest.fixture
+def isolated_stores(tmp_path, monkeypatch):
+    """Run in an empty directory with empty dictionary and extraction stores, so every page is fetched"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(DictionaryStore, '_shared', DictionaryStore(tmp_path / "dictionary.sqlite3"))
+    monkeypatch.setattr(ExtractionCache, '_shared', ExtractionCache(tmp_path / "extractions.sqlite3"))
+    return tmp_path
@@ -0,0 +1,42 @@
+import os
+import sqlite3
+
+from logic.services.audio_store import AudioStore
+
+URL = "https://audio12.forvo.com/audios/mp3/8/w/8w_9302600_49_503493.mp3"
+
+
+def test_gc_with_an_absolute_directory_keeps_live_recordings(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    AudioStore("audio_downloads").put(URL, b"recording")
+
+    store = AudioStore(os.path.abspath("audio_downloads"))
+    assert store.gc().removed_files == 0
+    assert store.stats() == {'recordings': 1, 'files': 1, 'bytes': len(b"recording")}
+    assert open(store.get(URL), 'rb').read() == b"recording"
+
+
+def test_store_is_usable_from_another_working_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    AudioStore("audio_downloads").put(URL, b"recording")
+
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+    store = AudioStore(tmp_path / "audio_downloads")
+    assert store.get(URL) is not None
+    assert store.gc() == (1, 0, 0)
+    assert store.verify() == (1, 0, 0)
+    assert open(store.get(URL), 'rb').read() == b"recording"
+
+
+def test_paths_stored_relative_to_the_working_directory_are_migrated(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = AudioStore("audio_downloads").put(URL, b"recording")
+    with sqlite3.connect(tmp_path / "audio_downloads" / "index.sqlite3") as connection:
+        # put() returns the path relative to the working directory, which is what earlier versions stored
+        connection.execute("UPDATE files SET path = ?", (path,))
+
+    store = AudioStore(tmp_path / "audio_downloads")
+    assert store.gc().removed_files == 0
+    assert open(store.get(URL), 'rb').read() == b"recording"
@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from logic.parsing.websites.browser_pool import BrowserPool
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+
+class FakeChromium:
+    def __init__(self):
+        self.launched = []
+
+    async def launch(self, headless):
+        self.launched.append(FakeBrowser())
+        return self.launched[-1]
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = FakeChromium()
+
+
+def make_pool(max_browsers: int) -> BrowserPool:
+    pool = BrowserPool(max_browsers=max_browsers)
+    pool._playwright = FakePlaywright()
+    return pool
+
+
+def test_browsers_are_reused_once_the_pool_is_full():
+    async def run():
+        pool = make_pool(2)
+        browsers = [await pool._get_browser() for _ in range(4)]
+        assert len(pool._playwright.chromium.launched) == 2
+        assert set(map(id, browsers)) == set(map(id, pool._playwright.chromium.launched))
+
+    asyncio.run(run())
+
+
+def test_a_disconnected_browser_is_replaced():
+    async def run():
+        pool = make_pool(1)
+        first = await pool._get_browser()
+        first.connected = False
+        second = await pool._get_browser()
+        assert second is not first and second.is_connected()
+        assert pool._browsers == [second]
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("sizes", [{'max_browsers': 0}, {'max_pages': 0}, {'max_browsers': -1}])
+def test_empty_pool_sizes_are_rejected(sizes):
+    with pytest.raises(ValueError):
+        BrowserPool(**sizes)
+
+
+def test_empty_pool_size_from_the_environment_is_rejected(monkeypatch):
+    monkeypatch.setenv('BROWSER_POOL_BROWSERS', '0')
+    with pytest.raises(ValueError):
+        BrowserPool()
@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from logic.parsing.websites.forvo_parser import ForvoParser
+from logic.services.audio_store import AudioStore
+
+
+class FakeButton:
+    def __init__(self, onclick: str):
+        self.onclick = onclick
+
+    async def get_attribute(self, name):
+        return self.onclick
+
+
+class FakePage:
+    """Shows the given play buttons, or times out waiting for them if there are none"""
+
+    def __init__(self, buttons):
+        self.buttons = buttons
+
+    async def wait_for_selector(self, selector, timeout):
+        if not self.buttons:
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+
+    async def query_selector_all(self, selector):
+        return self.buttons
+
+
+class FakeForvoParser(ForvoParser):
+    def __init__(self, page: FakePage):
+        super().__init__("mot")
+        self._page = page
+
+    async def _setup_page(self):
+        pass
+
+    async def _download_audio(self, url):
+        return None
+
+
+@pytest.fixture(autouse=True)
+def audio_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(AudioStore, '_shared', AudioStore(tmp_path / "audio"))
+
+
+def test_word_without_recordings_has_no_pronunciations():
+    assert asyncio.run(FakeForvoParser(FakePage([])).get_pronunciation()) == []
+
+
+def test_listed_recordings_that_all_fail_to_download_raise():
+    button = FakeButton("Play(1,'bXAzL2EubXAz','b2dnL2Eub2dn',false,'','');return false;")
+    with pytest.raises(RuntimeError):
+        asyncio.run(FakeForvoParser(FakePage([button])).get_pronunciation())
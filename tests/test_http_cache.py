@@ -0,0 +1,54 @@
+import os
+
+from logic.parsing.http_cache import HttpCache
+
+
+def store(cache: HttpCache, url: str, content: bytes) -> None:
+    """Store a body as if it had just been fetched"""
+    cache._complete(url, cache._lookup_url(url), 200, content, 'utf-8', {})
+
+
+def blob_files(cache: HttpCache) -> set:
+    return {path.name for path in (cache.directory / 'blobs').rglob('*.zz')}
+
+
+def test_eviction_drops_least_recently_used_entry_and_its_blob(tmp_path):
+    # Random bodies do not compress, so each blob takes a little over 1000 bytes and two fit under the cap
+    cache = HttpCache(tmp_path, max_bytes=2500, offline=False)
+    store(cache, "https://example.com/a", os.urandom(1000))
+    store(cache, "https://example.com/b", os.urandom(1000))
+    assert cache.get("https://example.com/a").from_cache
+
+    store(cache, "https://example.com/c", os.urandom(1000))
+
+    assert cache._lookup_url("https://example.com/a").content is not None
+    assert cache._lookup_url("https://example.com/b").content is None
+    assert cache._lookup_url("https://example.com/c").content is not None
+    assert len(blob_files(cache)) == 2
+
+
+def test_replacing_an_entry_keeps_a_blob_still_in_use(tmp_path):
+    cache = HttpCache(tmp_path, offline=False)
+    shared = os.urandom(1000)
+    store(cache, "https://example.com/a", shared)
+    store(cache, "https://example.com/b", shared)
+    assert len(blob_files(cache)) == 1
+
+    store(cache, "https://example.com/a", b"new page")
+    assert cache._lookup_url("https://example.com/b").content == shared
+    assert len(blob_files(cache)) == 2
+
+    store(cache, "https://example.com/b", b"new page")
+    assert len(blob_files(cache)) == 1
+
+
+def test_hits_are_written_in_batches(tmp_path):
+    cache = HttpCache(tmp_path, offline=False)
+    store(cache, "https://example.com/a", b"page")
+    written = cache._connection.execute("SELECT last_access FROM entries").fetchone()[0]
+
+    cache.get("https://example.com/a")
+    assert cache._connection.execute("SELECT last_access FROM entries").fetchone()[0] == written
+
+    cache.flush()
+    assert cache._connection.execute("SELECT last_access FROM entries").fetchone()[0] > written
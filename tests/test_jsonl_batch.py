@@ -0,0 +1,63 @@
+import io
+import json
+from typing import Iterable, Iterator
+
+import pytest
+
+import main
+from model.response import Response
+
+
+class SimulatedCrash(Exception):
+    pass
+
+
+def finish_first_line_last(queries: Iterable[str], max_workers: int = 1) -> Iterator[Response]:
+    """Hold the first query back, finish the next ones in order, then crash before the first finishes"""
+    queries = iter(queries)
+    next(queries)
+    for count, query in enumerate(queries, start=1):
+        yield Response(query)
+        if count == main.CHECKPOINT_INTERVAL + 1:
+            raise SimulatedCrash
+
+
+def finish_in_order(queries: Iterable[str], max_workers: int = 1) -> Iterator[Response]:
+    for query in queries:
+        yield Response(query)
+
+
+def written_queries(path) -> list:
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line)['query'] for line in f]
+
+
+def make_input(count: int) -> str:
+    return "".join(json.dumps(f"mot{index}") + "\n" for index in range(count))
+
+
+def test_resume_after_out_of_order_completion_writes_each_query_once(tmp_path, monkeypatch):
+    output_path = str(tmp_path / "out.jsonl")
+    count = main.CHECKPOINT_INTERVAL + 5
+
+    monkeypatch.setattr(main, 'create_anki_cards', finish_first_line_last)
+    with pytest.raises(SimulatedCrash):
+        main.run_jsonl_batch(io.StringIO(make_input(count)), output_path)
+    # The checkpoint was written while the first line was still pending
+    assert json.loads((tmp_path / "out.jsonl.checkpoint").read_text())['input_line'] == 0
+
+    monkeypatch.setattr(main, 'create_anki_cards', finish_in_order)
+    main.run_jsonl_batch(io.StringIO(make_input(count)), output_path)
+
+    queries = written_queries(output_path)
+    assert sorted(queries) == sorted(f"mot{index}" for index in range(count))
+    assert len(queries) == len(set(queries))
+
+
+def test_rerun_after_completion_writes_nothing(tmp_path, monkeypatch):
+    output_path = str(tmp_path / "out.jsonl")
+    monkeypatch.setattr(main, 'create_anki_cards', finish_in_order)
+
+    assert main.run_jsonl_batch(io.StringIO(make_input(3)), output_path) == 3
+    assert main.run_jsonl_batch(io.StringIO(make_input(3)), output_path) == 0
+    assert written_queries(output_path) == ["mot0", "mot1", "mot2"]
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from logic.parsing.websites import openipa_parser
+from logic.parsing.websites.openipa_parser import OpenIPABatcher, OpenIPAParser
+from logic.services.transcription_store import TranscriptionStore
+
+
+class FakePage:
+    """Shows the transcription of the typed word, or nothing for words it does not answer"""
+
+    def __init__(self, transcriptions):
+        self.transcriptions = transcriptions
+        self.result = ""
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        self.result = ""
+
+    async def fill(self, selector, word):
+        self.result = self.transcriptions.get(word, self.result)
+
+    async def wait_for_function(self, script, arg, timeout):
+        if self.result in ("", arg[1]):
+            raise Exception("Timeout")
+
+
+class FakeOpenIPAParser(OpenIPAParser):
+    def __init__(self, page: FakePage):
+        super().__init__()
+        self._page = page
+
+    async def _setup_page(self):
+        self._page.load()
+        self._page_loaded = True
+
+    async def _read_result(self):
+        return self._page.result
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = TranscriptionStore(tmp_path / "transcriptions.sqlite3")
+    monkeypatch.setattr(TranscriptionStore, 'shared', classmethod(lambda cls: store))
+    return store
+
+
+def test_homophone_is_transcribed_on_a_reloaded_page(store):
+    page = FakePage({"vert": "vɛʁ", "verre": "vɛʁ"})
+    result = asyncio.run(FakeOpenIPAParser(page).get_transcriptions(["vert", "verre"]))
+    assert result == {"vert": "vɛʁ", "verre": "vɛʁ"}
+    assert page.loads == 2
+
+
+def test_unchanged_result_is_neither_returned_nor_stored(store):
+    page = FakePage({"livre": "livʁ"})
+    result = asyncio.run(FakeOpenIPAParser(page).get_transcriptions(["livre", "xyzzy"]))
+    assert result == {"livre": "livʁ", "xyzzy": None}
+    assert store.get(OpenIPAParser.SOURCE, "xyzzy") is None
+
+
+class BrokenOpenIPAParser:
+    """Opens fine but fails to transcribe, like a store error inside get_transcriptions"""
+
+    SOURCE = OpenIPAParser.SOURCE
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def get_transcriptions(self, words):
+        raise RuntimeError("database is locked")
+
+
+def test_failed_batch_fails_its_callers(store, monkeypatch):
+    monkeypatch.setattr(openipa_parser, 'OpenIPAParser', BrokenOpenIPAParser)
+
+    async def transcribe_both():
+        batcher = OpenIPABatcher(idle_timeout=0.1)
+        return await asyncio.wait_for(
+            asyncio.gather(batcher.transcribe("vert"), batcher.transcribe("verre"), return_exceptions=True), 5)
+
+    results = asyncio.run(transcribe_both())
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
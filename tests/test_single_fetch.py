@@ -0,0 +1,99 @@
+import asyncio
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from logic.parsing.encoded_file_loader import EncodedFileLoader
+from logic.parsing.http_cache import CachedResponse, HttpCache
+from logic.parsing.websites.lefigaro_parser import LeFigaroParser
+from logic.parsing.websites.linguee_parser import LingueeParser
+from model.enums.conjugates_with import ConjugatesWith
+from model.enums.verb_group import VerbGroup
+
+LINGUEE_PAGE = Path(__file__).resolve().parent.parent / "cache" / "sans - English translation – Linguee.htm"
+
+LEFIGARO_PAGE = """
+<html><body>
+  <div id="verbeNav"><p>Verbe du <b>premier groupe</b> conjugué avec l'auxiliaire avoir</p></div>
+  <h2 id="sim">Verbes qui se conjuguent de la même façon</h2>
+  <p><a href="#">aimer</a> <a href="#">parler</a></p>
+</body></html>
+"""
+
+
+class CountingHttpCache:
+    """Stands in for HttpCache and records every URL fetched"""
+
+    def __init__(self, html: str):
+        self.html = html
+        self.urls: List[str] = []
+
+    def get(self, url: str, **kwargs) -> CachedResponse:
+        self.urls.append(url)
+        return CachedResponse(url, self.html.encode('utf-8'), 'utf-8', False)
+
+    async def get_async(self, url: str, **kwargs) -> CachedResponse:
+        return self.get(url)
+
+
+@pytest.fixture
+def http_cache(monkeypatch):
+    def install(html: str) -> CountingHttpCache:
+        cache = CountingHttpCache(html)
+        monkeypatch.setattr(HttpCache, 'shared', classmethod(lambda cls: cache))
+        return cache
+    return install
+
+
+def test_constructing_a_parser_fetches_nothing(http_cache):
+    cache = http_cache(LEFIGARO_PAGE)
+    LeFigaroParser("aimer")
+    assert cache.urls == []
+
+
+def test_lefigaro_getters_share_one_fetch(http_cache):
+    cache = http_cache(LEFIGARO_PAGE)
+    parser = LeFigaroParser("aimer")
+
+    assert parser.get_verb_group() == VerbGroup.FIRST
+    assert parser.get_conjugates_with() == ConjugatesWith.AVOIR
+    assert parser.get_conjugates_as() == ["aimer", "parler"]
+    assert parser.get_verb_group() == VerbGroup.FIRST
+    assert cache.urls == [parser.compose_query_url()]
+
+
+def test_lefigaro_load_async_then_getters_share_one_fetch(http_cache):
+    cache = http_cache(LEFIGARO_PAGE)
+    parser = LeFigaroParser("aimer")
+
+    asyncio.run(parser.load_async())
+    parser.get_verb_group()
+    parser.get_conjugates_with()
+    parser.get_conjugates_as()
+    assert len(cache.urls) == 1
+
+
+@pytest.mark.skipif(not LINGUEE_PAGE.exists(), reason="saved Linguee page not available")
+def test_linguee_getters_share_one_fetch(http_cache, isolated_stores):
+    cache = http_cache(EncodedFileLoader.load(LINGUEE_PAGE))
+    parser = LingueeParser("sans")
+
+    elements = parser.get_variant_elements()
+    assert elements
+    for element in elements:
+        parser.get_word_category(element)
+        parser.get_gender(element)
+        parser.get_examples(element)
+    parser.get_variant_elements()
+    assert cache.urls == [parser.compose_query_url()]
+
+
+@pytest.mark.skipif(not LINGUEE_PAGE.exists(), reason="saved Linguee page not available")
+def test_linguee_get_variants_fetches_once(http_cache, isolated_stores):
+    cache = http_cache(EncodedFileLoader.load(LINGUEE_PAGE))
+
+    assert LingueeParser("sans").get_variants()
+    assert asyncio.run(LingueeParser("sans").get_variants_async())
+    # The second parser fetches its own page, but neither fetches twice
+    assert len(cache.urls) == 2